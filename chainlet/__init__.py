@@ -1,14 +1,14 @@
 from __future__ import absolute_import
 from .__about__ import __version__
 from .primitives.link import ChainLink
-from .signals import StopTraversal
+from .signals import StopTraversal, SKIP
 from .funclink import funclet
 from .genlink import genlet
 from .dataflow import joinlet, forklet
 
 __all__ = [
     'ChainLink',
-    'StopTraversal',
+    'StopTraversal', 'SKIP',
     'funclet', 'genlet',
     'joinlet', 'forklet',
 ]
@@ -0,0 +1,180 @@
+"""
+Benchmarks for the throughput and latency of chainlet primitives
+
+The benchmark suite is run from the command line:
+
+.. code:: bash
+
+    python -m chainlet.bench --output results.json
+    python -m chainlet.bench --baseline results.json
+
+Each :py:class:`Benchmark` measures a freshly created :term:`chainlink`.
+The throughput is measured by dispatching a stream of :term:`data chunks <data chunk>`,
+while the latency is measured by sending individual chunks.
+Results are stored as JSON, and may be compared against a baseline of previous results
+to detect performance regressions.
+
+No baseline is shipped, since results are only comparable on the same machine and interpreter.
+To check a change for regressions, record a baseline of the unchanged code first:
+
+.. code:: bash
+
+    git stash
+    python -m chainlet.bench --output baseline.json
+    git stash pop
+    python -m chainlet.bench --baseline baseline.json
+
+The second run exits with a non-zero code and lists every metric that is worse than
+the baseline by more than the ``--tolerance``.
+The results also record the ``environment`` they were measured in, such as the Python version and machine.
+"""
+from __future__ import division, absolute_import
+import time
+import platform
+
+from ..__about__ import __version__
+
+try:
+    _timer = time.perf_counter
+except AttributeError:  # pragma: no cover
+    _timer = time.time
+
+
+#: metrics compared against a baseline, and whether larger values are better
+METRICS = (('chunks_per_second', True), ('latency_median', False))
+
+
+class Benchmark(object):
+    """
+    Measurement of a chainlink for a stream of data chunks
+
+    :param name: unique name of the benchmark
+    :type name: str
+    :param factory: callable creating the chainlink to measure
+    :param group: name of the primitive being measured
+    :type group: str
+
+    The ``factory`` is called for each measurement.
+    This prevents state of elements, such as generators, from carrying over.
+    """
+    __slots__ = ('name', 'factory', 'group')
+
+    def __init__(self, name, factory, group=None):
+        self.name = name
+        self.factory = factory
+        self.group = group if group is not None else name.partition('[')[0]
+
+    def measure_throughput(self, chunks):
+        """Measure the seconds to dispatch ``chunks`` values through a new chainlink"""
+        chainlink, values = self.factory(), range(chunks)
+        start = _timer()
+        for _ in chainlink.dispatch(values):
+            pass
+        return _timer() - start
+
+    def measure_latency(self, chunks):
+        """Measure the seconds to send each of ``chunks`` values to a new chainlink"""
+        chainlink, timings = self.factory(), []
+        send = chainlink.send
+        # a joining chainlink expects an iterable of chunks
+        values = ((value,) for value in range(chunks)) if chainlink.chain_join else range(chunks)
+        for value in values:
+            start = _timer()
+            send(value)
+            timings.append(_timer() - start)
+        return timings
+
+    def run(self, chunks=10000, repeat=3):
+        """
+        Run the benchmark and summarise its results
+
+        :param chunks: number of data chunks for each measurement
+        :type chunks: int
+        :param repeat: number of measurements, of which the best is reported
+        :type repeat: int
+        :return: the throughput and latency measured by this benchmark
+        :rtype: dict
+        """
+        elapsed = min(self.measure_throughput(chunks) for _ in range(repeat))
+        latencies = sorted(min(timings) for timings in zip(*(
+            self.measure_latency(min(chunks, 1000)) for _ in range(repeat)
+        )))
+        return {
+            'group': self.group,
+            'chunks': chunks,
+            'chunks_per_second': chunks / elapsed if elapsed > 0 else float('inf'),
+            'latency_median': _percentile(latencies, 0.5),
+            'latency_p99': _percentile(latencies, 0.99),
+        }
+
+    def __repr__(self):
+        return '%s(%r, group=%r)' % (self.__class__.__name__, self.name, self.group)
+
+
+def _percentile(ordered, fraction):
+    """Get the percentile ``fraction`` from a sorted, non-empty sequence"""
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def run(benchmarks, chunks=10000, repeat=3, report=None):
+    """
+    Run several benchmarks and collect their results
+
+    :param benchmarks: the benchmarks to run
+    :type benchmarks: iterable[Benchmark]
+    :param chunks: number of data chunks for each measurement
+    :type chunks: int
+    :param repeat: number of measurements of each benchmark
+    :type repeat: int
+    :param report: callable receiving the name and result of each benchmark when done
+    :return: results of all benchmarks and information about the environment
+    :rtype: dict
+    """
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = result = benchmark.run(chunks=chunks, repeat=repeat)
+        if report is not None:
+            report(benchmark.name, result)
+    return {
+        'environment': {
+            'chainlet': __version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+        },
+        'results': results,
+    }
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Compare benchmark results against a baseline
+
+    :param results: results of the current benchmarks, as provided by :py:func:`run`
+    :type results: dict
+    :param baseline: results of previous benchmarks, as provided by :py:func:`run`
+    :type baseline: dict
+    :param tolerance: relative amount by which results may be worse than the baseline
+    :type tolerance: float
+    :return: regressions as ``name, metric, baseline, current`` for each offending metric
+    :rtype: list[tuple]
+
+    Only benchmarks and metrics present in both ``results`` and ``baseline`` are compared.
+    """
+    regressions = []
+    previous = baseline['results']
+    for name, result in sorted(results['results'].items()):
+        if name not in previous:
+            continue
+        for metric, larger_is_better in METRICS:
+            try:
+                expected, current = previous[name][metric], result[metric]
+            except KeyError:
+                continue
+            if larger_is_better:
+                regressed = current < expected * (1 - tolerance)
+            else:
+                regressed = current > expected * (1 + tolerance)
+            if regressed:
+                regressions.append((name, metric, expected, current))
+    return regressions
@@ -0,0 +1,92 @@
+"""
+Command line interface to run the chainlet benchmarks
+"""
+from __future__ import print_function, absolute_import
+import argparse
+import fnmatch
+import json
+import sys
+
+from . import run, compare
+from .cases import benchmarks
+
+CLI = argparse.ArgumentParser(
+    prog='python -m chainlet.bench',
+    description='Measure the throughput and latency of chainlet primitives',
+)
+CLI.add_argument(
+    'select',
+    nargs='*',
+    default=['*'],
+    help='glob patterns of benchmarks to run [default: all]',
+)
+CLI.add_argument(
+    '-o', '--output',
+    help='file to write results to as JSON',
+)
+CLI.add_argument(
+    '-b', '--baseline',
+    help='JSON file of previous results to compare against, as written by --output',
+)
+CLI.add_argument(
+    '-t', '--tolerance',
+    type=float,
+    default=0.2,
+    help='relative slowdown compared to the baseline regarded as a regression [default: %(default)s]',
+)
+CLI.add_argument(
+    '-n', '--chunks',
+    type=int,
+    default=10000,
+    help='number of data chunks for each measurement [default: %(default)s]',
+)
+CLI.add_argument(
+    '-r', '--repeat',
+    type=int,
+    default=3,
+    help='number of measurements for each benchmark [default: %(default)s]',
+)
+CLI.add_argument(
+    '-l', '--list',
+    action='store_true',
+    help='list the selected benchmarks and exit',
+)
+
+
+def _report(name, result):
+    print('%-40s %12.1f chunks/s %10.2f us median %10.2f us p99' % (
+        name, result['chunks_per_second'], result['latency_median'] * 1E6, result['latency_p99'] * 1E6,
+    ))
+
+
+def main(argv=None):
+    """
+    Run the benchmarks from the command line
+
+    :return: exit code, which is non-zero if a regression is detected
+    :rtype: int
+    """
+    options = CLI.parse_args(argv)
+    selected = [
+        benchmark for benchmark in benchmarks()
+        if any(fnmatch.fnmatchcase(benchmark.name, pattern) for pattern in options.select)
+    ]
+    if options.list:
+        for benchmark in selected:
+            print(benchmark.name)
+        return 0
+    results = run(selected, chunks=options.chunks, repeat=options.repeat, report=_report)
+    if options.output:
+        with open(options.output, 'w') as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    if options.baseline:
+        with open(options.baseline) as baseline:
+            regressions = compare(results, json.load(baseline), tolerance=options.tolerance)
+        for name, metric, expected, current in regressions:
+            print('regression: %s %s %.3g (baseline %.3g)' % (name, metric, current, expected), file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Benchmarks of the chainlet primitives
+
+Each primitive is measured for several chain lengths and fan-outs.
+All elements perform trivial work, so that the overhead of the primitives dominates.
+"""
+from __future__ import absolute_import
+
+from ..signals import StopTraversal, STOP_TRAVERSAL, SKIP
+from ..primitives.link import ChainLink
+from ..primitives.chain import Chain, ENGINES
+from ..primitives.bundle import Bundle
+from ..funclink import FunctionLink, funclet
+from ..genlink import genlet
+from ..dataflow import MergeLink, Either
+from ..concurrency import threads
+from . import Benchmark
+
+#: number of sequential elements in chains
+LENGTHS = (1, 4, 16)
+#: number of parallel elements in bundles and forks
+FANOUTS = (2, 8)
+
+
+@funclet
+def increment(value, by=1):
+    """Increment every data chunk"""
+    return value + by
+
+
+def _plain_increment(value):
+    return value + 1
+
+
+class Increment(ChainLink):
+    """Increment every data chunk, without being fused by a :py:class:`~.FlatChain`"""
+    __slots__ = ()
+
+    def chainlet_send(self, value=None):
+        return value + 1
+
+
+@funclet
+def odd(value):
+    """Pass on only odd data chunks"""
+    if value % 2:
+        return value
+    return SKIP
+
+
+class FilterException(ChainLink):
+    """Pass on only every tenth data chunk, raising a new :py:exc:`~.StopTraversal` otherwise"""
+    __slots__ = ()
+
+    def chainlet_send(self, value=None):
+        if value % 10:
+            raise StopTraversal
+        return value
+
+
+class FilterShared(ChainLink):
+    """Pass on only every tenth data chunk, raising a shared :py:exc:`~.StopTraversal` otherwise"""
+    __slots__ = ()
+
+    def chainlet_send(self, value=None):
+        if value % 10:
+            raise STOP_TRAVERSAL
+        return value
+
+
+class FilterSkip(ChainLink):
+    """Pass on only every tenth data chunk, returning :py:data:`~.SKIP` otherwise"""
+    __slots__ = ()
+
+    def chainlet_send(self, value=None):
+        if value % 10:
+            return SKIP
+        return value
+
+
+#: filters for each way to signal dropped data chunks
+FILTERS = (('exception', FilterException), ('shared', FilterShared), ('skip', FilterSkip))
+
+
+@genlet
+def accumulate():
+    """Pass on the sum of all data chunks so far"""
+    total = yield
+    while True:
+        total += yield total
+
+
+def _chain(elements):
+    return Chain(list(elements))
+
+
+def _fork_join(fanout, length, engine=None):
+    # each chunk is forked to ``fanout`` branches and merged again
+    return Chain((_fork(fanout, length), MergeLink()), engine=engine)
+
+
+def _fork(fanout, length, engine=None):
+    return Chain(
+        (_chain(increment() for _ in range(length)), Bundle(increment(by=idx) for idx in range(fanout))),
+        engine=engine,
+    )
+
+
+def _fork_tail(fanout, length, engine=None):
+    # forked chunks traverse all further elements individually
+    return Chain((_fork(fanout, 1), _chain(increment() for _ in range(length))), engine=engine)
+
+
+def _either(length):
+    return Either(odd() >> _chain(increment() for _ in range(length)), default=0)
+
+
+def benchmarks():
+    """
+    Create all benchmarks
+
+    :return: the benchmarks of all primitives
+    :rtype: list[Benchmark]
+    """
+    cases = []
+    for length in LENGTHS:
+        cases.extend((
+            Benchmark(
+                'FlatChain[length=%d]' % length,
+                lambda length=length: _chain(Increment() for _ in range(length))
+            ),
+            Benchmark(
+                'FunctionLink[length=%d]' % length,
+                lambda length=length: _chain(FunctionLink(_plain_increment) for _ in range(length))
+            ),
+            Benchmark(
+                'PartialSlave[length=%d]' % length,
+                lambda length=length: _chain(increment(by=2) for _ in range(length))
+            ),
+            Benchmark(
+                'GeneratorLink[length=%d]' % length,
+                lambda length=length: _chain(accumulate() for _ in range(length))
+            ),
+            Benchmark(
+                'Either[length=%d]' % length,
+                lambda length=length: _either(length)
+            ),
+            Benchmark(
+                'ConcurrentChain[length=%d]' % length,
+                lambda length=length: threads(_chain(increment() for _ in range(length)))
+            ),
+        ))
+        for fanout in FANOUTS:
+            cases.extend((
+                Benchmark(
+                    'Chain.fork[length=%d,fanout=%d]' % (length, fanout),
+                    lambda length=length, fanout=fanout: _fork(fanout, length)
+                ),
+                Benchmark(
+                    'MergeLink[length=%d,fanout=%d]' % (length, fanout),
+                    lambda length=length, fanout=fanout: _fork_join(fanout, length)
+                ),
+            ))
+            for engine in sorted(ENGINES):
+                cases.extend((
+                    Benchmark(
+                        'Chain.fork[length=%d,fanout=%d,engine=%s]' % (length, fanout, engine),
+                        lambda length=length, fanout=fanout, engine=engine: _fork_tail(fanout, length, engine)
+                    ),
+                    Benchmark(
+                        'MergeLink[length=%d,fanout=%d,engine=%s]' % (length, fanout, engine),
+                        lambda length=length, fanout=fanout, engine=engine: _fork_join(fanout, length, engine)
+                    ),
+                ))
+    for signal, filter_type in FILTERS:
+        cases.append(Benchmark(
+            'Filter[signal=%s]' % signal,
+            lambda filter_type=filter_type: _chain((Increment(), filter_type(), Increment()))
+        ))
+    for fanout in FANOUTS:
+        cases.extend((
+            Benchmark(
+                'Bundle[fanout=%d]' % fanout,
+                lambda fanout=fanout: Bundle(increment(by=idx) for idx in range(fanout))
+            ),
+            Benchmark(
+                'ConcurrentBundle[fanout=%d]' % fanout,
+                lambda fanout=fanout: threads(Bundle(increment(by=idx) for idx in range(fanout)))
+            ),
+            Benchmark(
+                'ConcurrentChain.fork[fanout=%d]' % fanout,
+                lambda fanout=fanout: threads(_fork(fanout, 1) >> increment())
+            ),
+        ))
+    return cases
@@ -0,0 +1,265 @@
+"""
+Helpers for creating ChainLinks from functions with cached results
+
+Tools of this module allow skipping repeated work of functions whose results
+depend only on the :term:`data chunk` and their arguments.
+The interface to other `chainlet` objects is automatically built around the functions.
+
+A function can be directly used by wrapping :py:class:`CachedLink` around it:
+
+.. code:: python
+
+    from mylib import producer, consumer, lookup_owner
+
+    producer >> CachedLink(lookup_owner, 'ldap://localhost', maxsize=4096) >> consumer
+
+If a function is used only as a chainlet, one may permanently convert it by
+applying a decorator:
+
+.. code:: python
+
+    @cachedlet(maxsize=4096, ttl=600)
+    def lookup_owner(value, server):
+        # ...
+
+    producer >> lookup_owner('ldap://localhost') >> consumer
+
+All links created by the same decorator share one cache.
+The function and arguments of each link are part of the cache key, so links do not mix up their results.
+"""
+from __future__ import division, absolute_import
+import collections
+import threading
+import time
+
+from .funclink import FunctionLink
+from . import signals
+
+#: default maximum number of results in a cache
+DEFAULT_MAXSIZE = 1024
+
+_timer = getattr(time, 'monotonic', time.time)
+
+#: marker for results not in a cache
+MISSING = object()
+
+
+class LinkCache(object):
+    """
+    Cache for results of a :py:class:`CachedLink`
+
+    :param maxsize: maximum number of results, or :py:const:`None` for no limit
+    :type maxsize: int or None
+    :param ttl: seconds after which results expire, or :py:const:`None` to never expire
+    :type ttl: float or None
+    :param thread_safe: whether the cache may be used by several threads at once
+    :type thread_safe: bool
+
+    If the cache is full, the least recently used result is evicted.
+    The number of lookups finding a result or not is counted as :py:attr:`hits` and :py:attr:`misses`.
+
+    A cache is pickled without its results, so that each process uses its own, empty cache.
+    """
+    __slots__ = ('maxsize', 'ttl', 'hits', 'misses', '_results', '_lock')
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=None, thread_safe=False):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be positive or None')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be positive or None')
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = self.misses = 0
+        self._results = collections.OrderedDict()
+        self._lock = threading.Lock() if thread_safe else None
+
+    @property
+    def thread_safe(self):
+        return self._lock is not None
+
+    def get(self, key, default=MISSING):
+        """
+        Get the result for ``key``, or ``default`` if there is none
+
+        :raises TypeError: if ``key`` is not hashable
+        """
+        if self._lock is None:
+            return self._get(key, default)
+        with self._lock:
+            return self._get(key, default)
+
+    def _get(self, key, default):
+        try:
+            # re-insert the result to mark it as most recently used
+            expires, result = item = self._results.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        if expires is not None and expires < _timer():
+            self.misses += 1
+            return default
+        self._results[key] = item
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """Store the ``result`` for ``key``, evicting old results if needed"""
+        expires = _timer() + self.ttl if self.ttl is not None else None
+        if self._lock is None:
+            return self._put(key, expires, result)
+        with self._lock:
+            return self._put(key, expires, result)
+
+    def _put(self, key, expires, result):
+        results = self._results
+        results.pop(key, None)
+        results[key] = expires, result
+        if self.maxsize is not None:
+            while len(results) > self.maxsize:
+                results.popitem(last=False)
+
+    def clear(self):
+        """Remove all results and reset the counters"""
+        if self._lock is None:
+            return self._clear()
+        with self._lock:
+            return self._clear()
+
+    def _clear(self):
+        self._results.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    def __getstate__(self):
+        return self.maxsize, self.ttl, self.thread_safe
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __repr__(self):
+        return '<%s maxsize=%r, ttl=%r, size=%d, hits=%d, misses=%d>' % (
+            self.__class__.__name__, self.maxsize, self.ttl, len(self), self.hits, self.misses
+        )
+
+
+class CachedLink(FunctionLink):
+    """
+    Wrapper making a function with cached results act like a ChainLink
+
+    :param slave: the function to wrap
+    :param args: positional arguments for the slave
+    :param kwargs: keyword arguments for the slave
+    :param cache: the cache to use, by default a new one
+    :type cache: LinkCache or None
+    :param maxsize: maximum number of results of a new cache
+    :type maxsize: int or None
+    :param ttl: seconds after which results of a new cache expire
+    :type ttl: float or None
+    :param thread_safe: whether a new cache may be used by several threads at once
+    :type thread_safe: bool
+    :param typed: whether values and arguments of different types are cached separately
+    :type typed: bool
+
+    :note: Use the :py:func:`~.cachedlet` function if you wish to decorate a
+           function to produce CachedLinks.
+
+    This class wraps a function (or other callable) just like a :py:class:`~.FunctionLink`.
+    The result of ``slave(value, *args, **kwargs)`` is stored in the :py:attr:`cache`
+    keyed by ``slave``, ``value``, ``args`` and ``kwargs``, and reused for the same key.
+    If the ``slave`` stops traversal, this is cached as well.
+    Results are not cached if ``value`` or any argument is not hashable.
+
+    Like for :py:func:`functools.lru_cache`, equal values share their result even if their types differ,
+    such as ``1``, ``1.0`` and ``True``.
+    Use ``typed=True`` to cache results separately for each type.
+
+    Use ``thread_safe=True`` if the link may process several chunks at once,
+    such as in a chain of :py:func:`~chainlet.concurrency.threads`.
+    Chunks missing from the cache may still be computed several times concurrently.
+
+    The keywords ``cache``, ``maxsize``, ``ttl``, ``thread_safe`` and ``typed`` are consumed
+    by the :py:class:`CachedLink`. They are not passed on to ``slave``.
+    """
+    def __init__(self, slave, *args, **kwargs):
+        cache = kwargs.pop('cache', None)
+        maxsize = kwargs.pop('maxsize', DEFAULT_MAXSIZE)
+        ttl = kwargs.pop('ttl', None)
+        thread_safe = kwargs.pop('thread_safe', False)
+        #: whether values and arguments of different types are cached separately
+        self.typed = kwargs.pop('typed', False)
+        #: the :py:class:`LinkCache` storing results
+        self.cache = cache if cache is not None else LinkCache(maxsize=maxsize, ttl=ttl, thread_safe=thread_safe)
+        super(CachedLink, self).__init__(slave, *args, **kwargs)
+        # links sharing a cache may wrap different functions
+        function = getattr(self.__wrapped__, 'func', self.__wrapped__)
+        args = getattr(self.__wrapped__, 'args', ())
+        keywords = tuple(sorted(getattr(self.__wrapped__, 'keywords', {}).items()))
+        if self.typed:
+            args += tuple(type(arg) for arg in args)
+            keywords += tuple(type(arg) for _, arg in keywords)
+        self._key_args = function, args, keywords
+
+    def __getstate__(self):
+        state = super(CachedLink, self).__getstate__()
+        state.update(cache=self.cache, typed=self.typed, _key_args=self._key_args)
+        return state
+
+    def chainlet_send(self, value=None):
+        """Send a value to this element"""
+        key = (value, type(value), self._key_args) if self.typed else (value, self._key_args)
+        try:
+            result = self.cache.get(key)
+        except TypeError:
+            return self.__wrapped__(value)
+        if result is MISSING:
+            try:
+                result = self.__wrapped__(value)
+            except signals.StopTraversal as err:
+                err.__traceback__ = None
+                result = signals.SKIP
+            self.cache.put(key, result)
+        return result
+
+
+def cachedlet(function=None, maxsize=DEFAULT_MAXSIZE, ttl=None, thread_safe=False, typed=False):
+    """
+    Convert a function to a :py:class:`~chainlink.ChainLink` with cached results
+
+    :param function: the function to convert
+    :param maxsize: maximum number of cached results, or :py:const:`None` for no limit
+    :type maxsize: int or None
+    :param ttl: seconds after which results expire, or :py:const:`None` to never expire
+    :type ttl: float or None
+    :param thread_safe: whether links may be used by several threads at once
+    :type thread_safe: bool
+    :param typed: whether values and arguments of different types are cached separately
+    :type typed: bool
+
+    When used as a decorator, this function can also be called with and without keywords.
+
+    .. code:: python
+
+        @cachedlet
+        def resolve(value):
+            "Resolve every data chunk to its host name"
+            return socket.gethostbyaddr(value)[0]
+
+        @cachedlet(maxsize=None, thread_safe=True)
+        def owner(value, database):
+            "Look up the owner of every data chunk in a database"
+            return query_owner(database, value)
+
+    The :term:`data chunk` ``value`` is passed anonymously as the first positional parameter.
+    In other words, the wrapped function should have the signature:
+
+    .. py:function:: .slave(value, *args, **kwargs)
+
+    All links created from the same function share a single :py:class:`LinkCache`.
+    See :py:class:`~.CachedLink` for details.
+    """
+    wraplet = CachedLink.wraplet(cache=LinkCache(maxsize=maxsize, ttl=ttl, thread_safe=thread_safe), typed=typed)
+    if function is None:
+        return wraplet
+    return wraplet(function)
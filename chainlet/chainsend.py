@@ -1,7 +1,13 @@
+import itertools
+
 from . import signals
+from .signals import SKIP
+
 
+__all__ = ['lazy_send', 'eager_send', 'lazy_strategy', 'eager_strategy', 'invalidate_strategies']
 
-__all__ = ['lazy_send', 'eager_send']
+#: version of the fork and join behaviour of elements, see :py:func:`invalidate_strategies`
+strategy_epoch = 0
 
 
 def lazy_send(chainlet, chunks):
@@ -15,15 +21,44 @@ def lazy_send(chainlet, chunks):
     :return: the resulting stream slice of data returned by ``chainlet``
     :rtype: iterable
     """
+    return lazy_strategy(chainlet)(chainlet, chunks)
+
+
+def lazy_strategy(chainlet):
+    """
+    Get the implementation of :py:func:`lazy_send` for a chainlet
+
+    :param chainlet: the chainlet to receive and return data
+    :type chainlet: chainlink.ChainLink
+    :return: a function ``strategy(chainlet, chunks)`` equivalent to :py:func:`lazy_send`
+
+    The strategy depends only on the fork and join behaviour of ``chainlet``.
+    It may be cached until this behaviour changes, as signalled via :py:func:`invalidate_strategies`.
+    """
     fork, join = chainlet.chain_fork, chainlet.chain_join
     if fork and join:
-        return _send_n_get_m(chainlet, chunks)
+        return _send_n_get_m
     elif fork:
-        return _lazy_send_1_get_m(chainlet, chunks)
+        return _lazy_send_1_get_m
     elif join:
-        return _lazy_send_n_get_1(chainlet, chunks)
+        return _lazy_send_n_get_1
+    elif chainlet.chain_batch_size:
+        return _lazy_send_batched
     else:
-        return _lazy_send_1_get_1(chainlet, chunks)
+        return _lazy_send_1_get_1
+
+
+def invalidate_strategies():
+    """
+    Invalidate any cached send strategies
+
+    This must be called if the :py:attr:`~.ChainLink.chain_fork`, :py:attr:`~.ChainLink.chain_join`
+    or :py:attr:`~.ChainLink.chain_batch_size` of an element is changed after linking it.
+    The decorators :py:func:`~chainlet.dataflow.joinlet` and :py:func:`~chainlet.dataflow.forklet`
+    do this automatically.
+    """
+    global strategy_epoch  # pylint:disable=global-statement
+    strategy_epoch += 1
 
 
 def eager_send(chainlet, chunks):
@@ -37,23 +72,46 @@ def eager_send(chainlet, chunks):
     :param chunks: the stream slice of data to pass to ``chainlet``
     :type chunks: iterable
     :return: the resulting stream slice of data returned by ``chainlet``
-    :rtype: iterable
+    :rtype: list or iterable
+
+    Results are provided as a :py:class:`list`, except for ``n`` to ``m`` links
+    which provide the return value of their :py:meth:`~.ChainLink.chainlet_send` as it is.
+    """
+    return eager_strategy(chainlet)(chainlet, chunks)
+
+
+def eager_strategy(chainlet):
+    """
+    Get the implementation of :py:func:`eager_send` for a chainlet
+
+    :param chainlet: the chainlet to receive and return data
+    :type chainlet: chainlink.ChainLink
+    :return: a function ``strategy(chainlet, chunks)`` equivalent to :py:func:`eager_send`
+
+    Unlike the strategies of :py:func:`lazy_strategy`, these do not create generators:
+    each collects all results in a :py:class:`list` before returning.
+    The same caching rules as for :py:func:`lazy_strategy` apply.
     """
     fork, join = chainlet.chain_fork, chainlet.chain_join
     if fork and join:
-        return _send_n_get_m(chainlet, chunks)
+        return _send_n_get_m
     elif fork:
-        return tuple(_lazy_send_1_get_m(chainlet, chunks))
+        return _eager_send_1_get_m
     elif join:
-        return tuple(_lazy_send_n_get_1(chainlet, chunks))
+        return _eager_send_n_get_1
+    elif chainlet.chain_batch_size:
+        return _eager_send_batched
     else:
-        return tuple(_lazy_send_1_get_1(chainlet, chunks))
+        return _eager_send_1_get_1
 
 
 def _send_n_get_m(chainlet, chunks):
     # aggregate input for joining paths, flatten output of parallel paths
     # iterator goes in, iterator comes out
-    return chainlet.chainlet_send(chunks)
+    result = chainlet.chainlet_send(chunks)
+    if result is SKIP:
+        return ()
+    return result
 
 
 def _lazy_send_1_get_m(element, values):
@@ -61,20 +119,35 @@ def _lazy_send_1_get_m(element, values):
     # chunk goes in, iterator comes out
     for value in values:
         try:
-            for return_value in element.chainlet_send(value):
+            result = element.chainlet_send(value)
+            if result is SKIP:
+                continue
+            for return_value in result:
                 yield return_value
-        except signals.StopTraversal:
+        except signals.StopTraversal as err:
+            err.__traceback__ = None
             continue
         except StopIteration:
-            raise signals.ChainExit
+            break
+    else:
+        return
+    raise signals.reset(signals.CHAIN_EXIT)
 
 
 def _lazy_send_n_get_1(element, values):
     # pass on everything, box input after joining chunks
     try:
-        yield element.chainlet_send(values)
-    except signals.StopTraversal:
+        result = element.chainlet_send(values)
+    except signals.StopTraversal as err:
+        err.__traceback__ = None
         return
+    except StopIteration:
+        pass
+    else:
+        if result is not SKIP:
+            yield result
+        return
+    raise signals.reset(signals.CHAIN_EXIT)
 
 
 def _lazy_send_1_get_1(element, values):
@@ -82,8 +155,84 @@ def _lazy_send_1_get_1(element, values):
     # chunks from iterator go in, one chunk comes out for each chunk
     for value in values:
         try:
-            yield element.chainlet_send(value)
-        except signals.StopTraversal:
+            result = element.chainlet_send(value)
+            if result is not SKIP:
+                yield result
+        except signals.StopTraversal as err:
+            err.__traceback__ = None
             continue
         except StopIteration:
-            raise signals.ChainExit
+            break
+    else:
+        return
+    raise signals.reset(signals.CHAIN_EXIT)
+
+
+def _lazy_send_batched(element, values):
+    # gather input to batches, unpack output
+    # chunks from iterator go in, batches of chunks come out for each batch
+    values, batch_size = iter(values), element.chain_batch_size
+    while True:
+        batch = list(itertools.islice(values, batch_size))
+        if not batch:
+            break
+        for return_value in element.chainlet_send_batch(batch):
+            yield return_value
+
+
+def _eager_send_1_get_m(element, values):
+    # flatten output of each send for each input
+    # chunks go in, list of chunks comes out
+    results = []
+    send = element.chainlet_send
+    for value in values:
+        try:
+            result = send(value)
+            if result is not SKIP:
+                results.extend(result)
+        except signals.StopTraversal as err:
+            err.__traceback__ = None
+        except StopIteration:
+            break
+    else:
+        return results
+    raise signals.reset(signals.CHAIN_EXIT)
+
+
+def _eager_send_n_get_1(element, values):
+    # pass on everything, box output after joining chunks
+    try:
+        result = element.chainlet_send(values)
+    except signals.StopTraversal as err:
+        err.__traceback__ = None
+        return []
+    except StopIteration:
+        pass
+    else:
+        return [] if result is SKIP else [result]
+    raise signals.reset(signals.CHAIN_EXIT)
+
+
+def _eager_send_1_get_1(element, values):
+    # unpack input, pack output
+    # chunks go in, list of one chunk for each chunk comes out
+    results = []
+    send = element.chainlet_send
+    for value in values:
+        try:
+            result = send(value)
+        except signals.StopTraversal as err:
+            err.__traceback__ = None
+            continue
+        except StopIteration:
+            break
+        if result is not SKIP:
+            results.append(result)
+    else:
+        return results
+    raise signals.reset(signals.CHAIN_EXIT)
+
+
+def _eager_send_batched(element, values):
+    # the element splits the batch as it prefers
+    return element.chainlet_send_batch(list(values))
@@ -2,5 +2,14 @@
 Primitives and tools to construct concurrent chains
 """
 from .thread import convert as threads
+from .process import convert as processes
 
-__all__ = ['threads']
+__all__ = ['threads', 'processes']
+
+# coroutines require the async/await syntax of Python 3.5
+try:
+    from .asyncio import convert as coroutines
+except (ImportError, SyntaxError):  # pragma: no cover
+    pass
+else:
+    __all__.append('coroutines')
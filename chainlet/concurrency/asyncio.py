@@ -0,0 +1,419 @@
+"""
+Coroutine based concurrency domain
+
+Primitives of this module implement concurrency based on :py:mod:`asyncio` coroutines.
+This allows many blocking actions, such as network I/O, to be in flight at once
+without using one thread for each of them.
+All coroutines run in a single event loop, which runs in a background thread.
+
+Coroutine functions can be used in chains with the :py:func:`asynclet` decorator:
+
+.. code:: python
+
+    @asynclet
+    async def enrich(value, url):
+        response = await fetch(url, value)
+        return value, response
+
+    chain = producer >> coroutines(parse >> enrich(url='http://localhost:8080') >> store)
+
+Inside a converted chain, all :term:`data chunks <data chunk>` traverse stripes concurrently,
+awaiting coroutine links instead of blocking on them.
+Regular elements run directly in the event loop thread, and should not block.
+
+:note: This module requires Python 3.5 or newer.
+
+:warning: The primitives in this module should not be used manually, and may change without deprecation warning.
+          Use :py:func:`convert` instead.
+"""
+from __future__ import absolute_import
+import asyncio
+import threading
+import atexit
+
+from .. import signals
+from ..chainsend import eager_send
+from ..funclink import FunctionLink
+from ..primitives import link
+from ..primitives import linker
+from ..primitives import chain
+from ..primitives import bundle
+from .base import LightFuture, LocalExecutor, ConcurrentBundle, ConcurrentChain
+
+
+class AsyncFuture(object):
+    """
+    Coroutine executed in an event loop
+
+    :param future: the thread-safe future of the scheduled coroutine
+    :type future: concurrent.futures.Future
+    """
+    __slots__ = ('_future',)
+
+    def __init__(self, future):
+        self._future = future
+
+    def realise(self):
+        """
+        Realise the future if possible
+
+        An :py:class:`AsyncFuture` is always realised by the event loop.
+        This does not block, but only returns whether the result is already available.
+
+        :return: whether the future has been realised
+        :rtype: bool
+        """
+        return self._future.done()
+
+    @property
+    def claimed(self):
+        """Whether the future is realised by the event loop, which is always the case"""
+        return True
+
+    def await_result(self):
+        """Wait for the future to be realised"""
+        self._future.exception()
+
+    @property
+    def result(self):
+        """
+        The result from realising the future
+
+        If the result is not available, block until done.
+
+        :return: result of the future
+        :raises: any exception encountered during realising the future
+        """
+        return self._future.result()
+
+
+class AsyncioExecutor(LocalExecutor):
+    """
+    Executor for futures using an event loop in a background thread
+
+    :param max_workers: maximum number of coroutines in flight, or unbounded if not positive
+    :type max_workers: int or float
+    :param identifier: base identifier for the event loop thread
+    :type identifier: str
+
+    Coroutine functions submitted to the executor are scheduled as tasks in the event loop.
+    Any other callables are realised locally, as with a :py:class:`~.LocalExecutor`.
+    The event loop is started lazily, once there is work for it.
+    """
+    __slots__ = ('_loop', '_thread', '_lock', '_semaphore')
+
+    def __init__(self, max_workers, identifier=''):
+        super(AsyncioExecutor, self).__init__(max_workers=max_workers, identifier=identifier)
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+        atexit.register(self._teardown)
+
+    def _teardown(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(1)
+
+    @property
+    def loop(self):
+        """The event loop running coroutines of this executor"""
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    self._start_loop()
+        return self._loop
+
+    def _start_loop(self):
+        loop, ready = asyncio.new_event_loop(), threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, args=(loop, ready), name=self.identifier + '_loop')
+        self._thread.daemon = True
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+
+    def _run_loop(self, loop, ready):
+        asyncio.set_event_loop(loop)
+        # the semaphore must be created for the loop it is used in
+        if self._max_workers != float('inf'):
+            self._semaphore = asyncio.Semaphore(self._max_workers)
+        ready.set()
+        loop.run_forever()
+
+    def submit(self, call, *args, **kwargs):
+        """
+        Submit a call for future execution
+
+        :return: future for the call execution
+        :rtype: AsyncFuture or LightFuture
+        """
+        if call is eager_send:
+            return AsyncFuture(self._schedule(async_eager_send(*args, **kwargs)))
+        elif asyncio.iscoroutinefunction(call):
+            return AsyncFuture(self._schedule(call(*args, **kwargs)))
+        return LightFuture(call, *args, **kwargs)
+
+    def run(self, coroutine):
+        """
+        Run a coroutine in the event loop and wait for its result
+
+        :param coroutine: the coroutine to run
+        :return: the result of ``coroutine``
+        :raises RuntimeError: if called from the event loop itself
+        """
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError('cannot wait for a coroutine inside its own event loop')
+        return self._schedule(coroutine).result()
+
+    def _schedule(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(self._run_bounded(coroutine), self.loop)
+
+    async def _run_bounded(self, coroutine):
+        if self._semaphore is None:
+            return await coroutine
+        async with self._semaphore:
+            return await coroutine
+
+
+DEFAULT_EXECUTOR = AsyncioExecutor(-1, 'chainlet_asyncio')
+
+
+class AsyncFunctionLink(FunctionLink):
+    """
+    Wrapper making a coroutine function act like a ChainLink
+
+    :param slave: the coroutine function to wrap
+    :param args: positional arguments for the slave
+    :param kwargs: keyword arguments for the slave
+
+    :note: Use the :py:func:`~.asynclet` function if you wish to decorate a
+           coroutine function to produce AsyncFunctionLinks.
+
+    When receiving a :term:`data chunk` ``value`` as part of a coroutine chain,
+    the link awaits ``slave(value, *args, **kwargs)`` and passes on the result.
+    In any other chain, the coroutine is run in the event loop of the :py:attr:`executor`,
+    and the link blocks until the result is available.
+    """
+    #: executor providing the event loop to run coroutines
+    executor = DEFAULT_EXECUTOR
+
+    def chainlet_send(self, value=None):
+        """Send a value to this element, blocking until the coroutine completes"""
+        return self.executor.run(self.chainlet_send_async(value))
+
+    def chainlet_send_batch(self, values):
+        """Send multiple values to this element, running all coroutines concurrently"""
+        return list(self.executor.run(async_eager_send(self, values)))
+
+    async def chainlet_send_async(self, value=None):
+        """Coroutine sending a value to this element"""
+        return await self.__wrapped__(value)
+
+
+def asynclet(function):
+    """
+    Convert a coroutine function to a :py:class:`~chainlink.ChainLink`
+
+    .. code:: python
+
+        @asynclet
+        async def delay(value, seconds=1):
+            "Delay every data chunk by some ``seconds``"
+            await asyncio.sleep(seconds)
+            return value
+
+    The :term:`data chunk` ``value`` is passed anonymously as the first positional parameter.
+    In other words, the wrapped function should have the signature:
+
+    .. py:function:: .slave(value, *args, **kwargs)
+
+    See :py:class:`~.AsyncFunctionLink` for details.
+    """
+    return AsyncFunctionLink.wraplet()(function)
+
+
+async def async_eager_send(chainlet, chunks):
+    """
+    Coroutine version of :py:func:`~chainlet.chainsend.eager_send`
+
+    :param chainlet: the chainlet to receive and return data
+    :type chainlet: chainlink.ChainLink
+    :param chunks: the stream slice of data to pass to ``chainlet``
+    :type chunks: iterable
+    :return: the resulting stream slice of data returned by ``chainlet``
+    :rtype: tuple
+
+    Chunks are passed concurrently to coroutine links, as well as through chains and bundles containing them.
+    Any other links are sent chunks synchronously.
+    """
+    fork, join = chainlet.chain_fork, chainlet.chain_join
+    if join:
+        if isinstance(chainlet, (AsyncChain, AsyncBundle)):
+            results = await chainlet.chainlet_send_async(chunks)
+            return tuple(results) if fork else (results,)
+        elif isinstance(chainlet, chain.Chain):
+            return await _async_send_chain(chainlet, chunks)
+        elif isinstance(chainlet, bundle.Bundle):
+            return await _async_send_bundle(chainlet, chainlet._fan_out(chunks))  # pylint:disable=protected-access
+        try:
+            return eager_send(chainlet, chunks)
+        except StopIteration:
+            pass
+        raise signals.reset(signals.CHAIN_EXIT)
+    return _flatten(await asyncio.gather(*(_async_send_1(chainlet, chunk) for chunk in chunks)))
+
+
+async def _async_send_1(chainlet, chunk):
+    # one chunk goes in, a sequence of chunks comes out
+    try:
+        if isinstance(chainlet, (AsyncFunctionLink, AsyncChain, AsyncBundle)):
+            result = await chainlet.chainlet_send_async(chunk)
+        elif isinstance(chainlet, chain.Chain) and not any(element.chain_join for element in chainlet.elements):
+            return await _async_send_chain(chainlet, (chunk,))
+        elif isinstance(chainlet, bundle.Bundle):
+            return await _async_send_bundle(chainlet, chainlet._fan_out(chunk))  # pylint:disable=protected-access
+        else:
+            result = chainlet.chainlet_send(chunk)
+    except signals.StopTraversal as err:
+        err.__traceback__ = None
+        return ()
+    except StopIteration:
+        pass
+    else:
+        if result is signals.SKIP:
+            return ()
+        return tuple(result) if chainlet.chain_fork else (result,)
+    raise signals.reset(signals.CHAIN_EXIT)
+
+
+async def _async_send_chain(chainlet, chunks):
+    # all chunks traverse each element before the next one
+    # this is equivalent to sending each chunk separately if no element but the first joins
+    values = chunks
+    for element in chainlet.elements:
+        values = await async_eager_send(element, values)
+        if not values:
+            break
+    return tuple(values)
+
+
+async def _async_send_bundle(chainlet, chunks):
+    # chunks must be materialised, as all elements receive them
+    return _flatten(await asyncio.gather(*(async_eager_send(element, chunks) for element in chainlet.elements)))
+
+
+async def _bounded_send(semaphore, chainlet, chunks):
+    # limit the number of concurrent sends, if any
+    if semaphore is None:
+        return await async_eager_send(chainlet, chunks)
+    async with semaphore:
+        return await async_eager_send(chainlet, chunks)
+
+
+def _flatten(results):
+    return tuple(value for result in results for value in result)
+
+
+class AsyncLinkPrimitives(linker.LinkPrimitives):
+    pass
+
+
+class AsyncBundle(ConcurrentBundle):
+    """
+    A group of chainlets that concurrently process each :term:`data chunk` as coroutines
+
+    The elements of the bundle are scheduled as tasks in the event loop of the :py:attr:`executor`.
+    """
+    chain_types = AsyncLinkPrimitives()
+    executor = DEFAULT_EXECUTOR
+    __slots__ = ()
+    completion_order = False
+    # tasks of the event loop are gathered, instead of being submitted as sends
+    merge_modes = (None,)
+
+    def chainlet_send(self, value=None):
+        # fetch joined input outside of the event loop, as it may be computed by blocking links
+        if self.chain_join:
+            value = tuple(value)
+        return list(self._executor.run(self.chainlet_send_async(value)))
+
+    async def chainlet_send_async(self, value=None):
+        """Coroutine sending a value to this element"""
+        return await _async_send_bundle(self, self._fan_out(value))
+
+    def __repr__(self):
+        return 'coroutines(%s)' % super(AsyncBundle, self).__repr__()
+
+
+class AsyncChain(ConcurrentChain):
+    """
+    A group of chainlets that concurrently process each :term:`data chunk` as coroutines
+
+    Each stripe of the chain is scheduled as a task in the event loop of the :py:attr:`executor`.
+    All data chunks traverse stripes concurrently,
+    with coroutine links awaiting their result instead of blocking.
+    """
+    chain_types = AsyncLinkPrimitives()
+    executor = DEFAULT_EXECUTOR
+    __slots__ = ()
+    completion_order = False
+
+    def chainlet_send(self, value=None):
+        # fetch joined input outside of the event loop, as it may be computed by blocking links
+        if self.chain_join:
+            value = tuple(value)
+        try:
+            return self._executor.run(self.chainlet_send_async(value))
+        # An element in the chain is exhausted permanently
+        except signals.ChainExit as err:
+            err.__traceback__ = None
+            raise StopIteration
+
+    async def chainlet_send_async(self, value=None):
+        """Coroutine sending a value to this element"""
+        if self._stripes is None:
+            self._compile_stripes()
+        values = value if self.chain_join else (value,)
+        inflight = asyncio.Semaphore(self.max_inflight) if self.max_inflight is not None else None
+        for stripe in self._stripes:
+            if not stripe.chain_join:
+                values = _flatten(
+                    await asyncio.gather(*(
+                        _bounded_send(inflight, stripe, chunk) for chunk in self._chunk_values(values)
+                    ))
+                )
+            else:
+                values = await async_eager_send(stripe, values)
+            if not values:
+                break
+        if self.chain_fork:
+            return list(values)
+        elif values:
+            return values[0]
+        return signals.SKIP
+
+    def __repr__(self):
+        return 'coroutines(%s)' % super(AsyncChain, self).__repr__()
+
+
+AsyncLinkPrimitives.base_bundle_type = AsyncBundle
+AsyncLinkPrimitives.base_chain_type = AsyncChain
+AsyncLinkPrimitives.flat_chain_type = AsyncChain
+
+
+def convert(element, **options):
+    """
+    Convert a regular :term:`chainlink` to a coroutine based version
+
+    :param element: the chainlink to convert
+    :param options: options for a converted chain or bundle, such as ``executor``, ``max_inflight`` or ``fanout``
+    :return: a coroutine based version of ``element`` if possible, or the element itself
+    """
+    element = linker.LinkPrimitives().convert(element)
+    if isinstance(element, link.ChainLink.chain_types.base_bundle_type):
+        options.setdefault('fanout', element.fanout)
+        return AsyncLinkPrimitives.base_bundle_type(element.elements, **options)
+    elif isinstance(element, link.ChainLink.chain_types.base_chain_type):
+        return AsyncLinkPrimitives.base_chain_type(element.elements, **options)
+    return element
@@ -3,10 +3,15 @@ import multiprocessing
 import collections
 import itertools
 
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
 from ..primitives import bundle
 from ..primitives import chain
 from .. import signals
-from ..chainsend import eager_send
+from ..chainsend import lazy_send, eager_send
 
 
 CPU_CONCURRENCY = multiprocessing.cpu_count()
@@ -59,6 +64,11 @@ class StoredFuture(object):
             # indicate whether the executing thread is done
             return self._result is not None
 
+    @property
+    def claimed(self):
+        """Whether a thread is realising the future, or has done so"""
+        return self._result is not None or self._mutex.locked()
+
     def await_result(self):
         """Wait for the future to be realised"""
         # if we cannot realise the future, another thread is doing so already
@@ -85,6 +95,94 @@ class StoredFuture(object):
         raise exception  # re-raise exception from execution
 
 
+#: lock to create the event of a contended :py:class:`LightFuture`
+_CONTENTION_LOCK = threading.Lock()
+
+
+class LightFuture(object):
+    """
+    Call stored for future execution, optimised for uncontended usage
+
+    :param call: callable to execute
+    :param args: positional arguments to ``call``
+    :param kwargs: keyword arguments to ``call``
+
+    This provides the same interface as :py:class:`~.StoredFuture` but does not
+    allocate any lock for itself.
+    The call is claimed atomically by removing it from a :py:class:`list`.
+    Only if a thread has to wait for the result realised by another thread,
+    a :py:class:`threading.Event` is created to wait on.
+    """
+    __slots__ = ('_instruction', '_result', '_done')
+
+    def __init__(self, call, *args, **kwargs):
+        self._instruction = [(call, args, kwargs)]
+        self._result = None
+        self._done = None
+
+    def realise(self):
+        """
+        Realise the future if possible
+
+        If the future has not been realised yet, do so in the current thread.
+        This will block execution until the future is realised.
+        Otherwise, do not block but return whether the result is already available.
+
+        This will not return the result nor propagate any exceptions of the future itself.
+
+        :return: whether the future has been realised
+        :rtype: bool
+        """
+        try:
+            call, args, kwargs = self._instruction.pop()
+        except IndexError:
+            # another thread is realising the future, or has done so
+            return self._result is not None
+        try:
+            result = call(*args, **kwargs)
+        except BaseException as err:
+            self._result = None, err
+        else:
+            self._result = result, None
+        # the result must be set before checking for waiting threads
+        if self._done is not None:
+            self._done.set()
+        return True
+
+    @property
+    def claimed(self):
+        """Whether a thread is realising the future, or has done so"""
+        return not self._instruction
+
+    def await_result(self):
+        """Wait for the future to be realised"""
+        if self.realise():
+            return
+        with _CONTENTION_LOCK:
+            if self._done is None:
+                self._done = threading.Event()
+        # the event must be set before checking for the result
+        if self._result is None:
+            self._done.wait()
+
+    @property
+    def result(self):
+        """
+        The result from realising the future
+
+        If the result is not available, block until done.
+
+        :return: result of the future
+        :raises: any exception encountered during realising the future
+        """
+        if self._result is None:
+            self.await_result()
+        chunks, exception = self._result
+        if exception is None:
+            return chunks
+        raise exception  # re-raise exception from execution
+
+
 class FutureChainResults(object):
     """
     Chain result computation stored for future and concurrent execution
@@ -112,7 +210,6 @@ class FutureChainResults(object):
     def _set_done(self):
         self._done = True
         self._futures = None
-        self._result_lock = None
 
     def __iter__(self):
         if self._done:
@@ -125,39 +222,331 @@ class FutureChainResults(object):
             raise self._exception
 
     def _active_iter(self):
-        result_idx = 0
-        # fast-forward existing results
-        for item in self._results:
-            yield item
-            result_idx += 1
-        # fetch remaining results safely
-        while not self._done:
+        result_idx, results = 0, self._results
+        while True:
+            # fast-forward existing results without locking
+            # appending to a list is thread-safe, so existing items are valid
+            while result_idx < len(results):
+                yield results[result_idx]
+                result_idx += 1
+            if self._done:
+                break
+            # fetch remaining results safely
             # someone may have beaten us before we acquire this lock
             # constraints must be rechecked as needed
             with self._result_lock:
+                if result_idx < len(results) or self._done:
+                    continue
                 try:
-                    result = self._results[result_idx]
-                except IndexError:
-                    try:
-                        future = next(self._futures)
-                    except StopIteration:
-                        break
-                    try:
-                        results = future.result
-                    except BaseException as err:
-                        self._exception = err
-                        break
-                    else:
-                        self._results.extend(results)
-                        for item in results:
-                            yield item
-                            result_idx += 1
+                    future = next(self._futures)
+                except StopIteration:
+                    self._set_done()
+                    continue
+                try:
+                    results.extend(future.result)
+                except BaseException as err:
+                    self._exception = err
+                    self._set_done()
+
+
+class FutureChainIterator(object):
+    """
+    Chain result computation stored for future execution, for a single consumer
+
+    Acts as an iterable for the actual results, similar to :py:class:`~.FutureChainResults`.
+    Results are neither stored nor protected against concurrent iteration,
+    and may only be iterated over once.
+
+    :param futures: the stored futures for each result chunk
+    :type futures: list[StoredFuture]
+    """
+    __slots__ = ('_futures',)
+
+    def __init__(self, futures):
+        self._futures = iter(futures)
+
+    def __iter__(self):
+        futures, self._futures = self._futures, None
+        if futures is None:
+            raise RuntimeError('%s can only be iterated once' % self.__class__.__name__)
+        for future in futures:
+            for item in future.result:
+                yield item
+
+
+def report_completion(completions, call, *args):
+    """
+    Perform ``call(*args)`` and put its result into ``completions``
+
+    :param completions: queue receiving pairs of ``result, exception``
+    :type completions: queue.Queue
+    """
+    try:
+        result = call(*args)
+    except BaseException as err:
+        completions.put((None, err))
+        raise
+    completions.put((result, None))
+    return result
+
+
+class CompletedResults(object):
+    """
+    Chain result computation stored for future execution, in the order futures complete
+
+    Acts as an iterable for the actual results, similar to :py:class:`~.FutureChainIterator`.
+    Instead of waiting for each future in turn, the results of any future are provided as soon as it completes.
+    Results may only be iterated over once.
+
+    :param futures: the stored futures for each result chunk
+    :type futures: iterable[LightFuture]
+    :param completions: queue receiving the result of each future via :py:func:`report_completion`
+    :type completions: queue.Queue
+
+    Futures are fetched from ``futures`` only as results are consumed.
+    This preserves lazy submission of futures, such as for ``max_inflight``.
+    Futures which are not started by any worker are realised by the consumer;
+    only these futures are kept until their results are provided.
+    """
+    __slots__ = ('_futures', '_completions')
+
+    def __init__(self, futures, completions):
+        self._futures = iter(futures)
+        self._completions = completions
+
+    def __iter__(self):
+        futures, self._futures = self._futures, None
+        if futures is None:
+            raise RuntimeError('%s can only be iterated once' % self.__class__.__name__)
+        completions, pending = self._completions, collections.deque()
+        outstanding = self._fetch(futures, pending)
+        while outstanding:
+            try:
+                result, exception = completions.get(block=False)
+            except queue.Empty:
+                # fetch another future and realise one not started by any worker, instead of waiting
+                outstanding += self._fetch(futures, pending)
+                if self._realise_any(pending):
+                    continue
+                result, exception = completions.get()
+            outstanding += self._fetch(futures, pending) - 1
+            if exception is not None:
+                raise exception
+            for item in result:
+                yield item
+
+    @staticmethod
+    def _fetch(futures, pending):
+        """Fetch the next of ``futures`` into ``pending``, returning the number of fetched futures"""
+        # only futures not claimed by any worker may be realised later on
+        while pending and pending[0].claimed:
+            pending.popleft()
+        for future in itertools.islice(futures, 1):
+            if not future.claimed:
+                pending.append(future)
+            return 1
+        return 0
+
+    @staticmethod
+    def _realise_any(pending):
+        """Realise the newest of the ``pending`` futures that is not realised by another thread"""
+        # workers take the oldest futures first, and report any they claimed on their own
+        while pending:
+            if pending.pop().realise():
+                return True
+        return False
+
+
+#: number of results each element of a merging bundle may buffer before blocking
+STREAM_BUFFER = 64
+
+#: marker for the end of all results of a :py:class:`StreamedResults`
+_END = object()
+
+
+class _StreamState(object):
+    """Results of several sends, shared between the producing calls and the consumer"""
+    __slots__ = (
+        'sends', 'buffer_size', 'buffers', 'arrivals', 'claims', 'done', 'errors',
+        'consumer', 'consumer_busy', 'abandoned', 'waiting', 'condition',
+    )
+
+    def __init__(self, sends, buffer_size, track_arrivals):
+        self.sends = sends
+        self.buffer_size = buffer_size
+        self.buffers = [collections.deque() for _ in sends]
+        #: index of the send of each result in production order, and of each exhausted send
+        self.arrivals = collections.deque() if track_arrivals else None
+        #: a send is claimed by removing its instruction, as for :py:class:`LightFuture`
+        self.claims = [[True] for _ in sends]
+        self.done = [False for _ in sends]
+        self.errors = [None for _ in sends]
+        self.consumer = None
+        #: whether the consumer runs a send itself, and cannot fetch results meanwhile
+        self.consumer_busy = False
+        self.abandoned = False
+        self.waiting = 0
+        self.condition = threading.Condition(threading.Lock())
+
+    def produce(self, index):
+        """Run the send ``index`` and buffer its results, unless it is already claimed"""
+        try:
+            self.claims[index].pop()
+        except IndexError:
+            return
+        condition, buffer, error = self.condition, self.buffers[index], None
+        element, values = self.sends[index]
+        try:
+            for result in lazy_send(element, values):
+                with condition:
+                    # the consumer cannot fetch results while it runs a send itself
+                    while len(buffer) >= self.buffer_size and not self.abandoned and not self.consumer_busy:
+                        self._wait()
+                    if self.abandoned:
+                        return
+                    buffer.append(result)
+                    if self.arrivals is not None:
+                        self.arrivals.append(index)
+                    if self.waiting:
+                        condition.notify_all()
+        except Exception as err:  # pylint:disable=broad-except
+            error = err
+        with condition:
+            self.errors[index], self.done[index] = error, True
+            if self.arrivals is not None:
+                self.arrivals.append(index)
+            if self.waiting:
+                condition.notify_all()
+
+    def next_result(self, index=None):
+        """
+        Get the next result of send ``index``, or of any send in production order
+
+        :return: the next result, or :py:data:`_END` if there are no more results
+        """
+        condition = self.condition
+        while True:
+            with condition:
+                if index is None:
+                    if self.arrivals:
+                        source = self.arrivals.popleft()
+                        if self.buffers[source]:
+                            return self._pop(source)
+                        # all results of ``source`` have been consumed
+                        self._raise(source)
+                        continue
+                    if all(self.done):
+                        return _END
+                    pending = next((idx for idx, claim in enumerate(self.claims) if claim), None)
+                elif self.buffers[index]:
+                    return self._pop(index)
+                elif self.done[index]:
+                    self._raise(index)
+                    return _END
                 else:
-                    yield result
-                    result_idx += 1
-        for item in self._results[result_idx:]:
-            yield item
-        self._set_done()
+                    pending = index if self.claims[index] else None
+                if pending is None:
+                    self._wait()
+                    continue
+            # run a send not started by any worker, instead of waiting for it
+            self._set_busy(True)
+            try:
+                self.produce(pending)
+            finally:
+                self._set_busy(False)
+
+    def abandon(self):
+        """Stop all sends, as their results will never be consumed"""
+        with self.condition:
+            self.abandoned = True
+            self.condition.notify_all()
+
+    def _set_busy(self, busy):
+        with self.condition:
+            self.consumer_busy = busy
+            if self.waiting:
+                self.condition.notify_all()
+
+    def _wait(self):
+        self.waiting += 1
+        self.condition.wait()
+        self.waiting -= 1
+
+    def _pop(self, index):
+        result = self.buffers[index].popleft()
+        if self.waiting:
+            self.condition.notify_all()
+        return result
+
+    def _raise(self, index):
+        error, self.errors[index] = self.errors[index], None
+        if error is not None:
+            raise error
+
+
+class StreamedResults(object):
+    """
+    Results of sending to several elements, available as soon as each element produces them
+
+    :param sends: pairs of ``element, values`` to :py:func:`~chainlet.chainsend.lazy_send`
+    :type sends: list[tuple]
+    :param executor: executor to concurrently run each send
+    :param merge: ``'round_robin'`` to alternate between elements, or ``'completed'`` for production order
+    :type merge: str
+    :param buffer_size: number of results each element may produce before blocking until they are consumed
+    :type buffer_size: int
+
+    Acts as an iterable for the results, which can be iterated only once.
+    Each send is submitted to the ``executor``, and buffers its results for the consumer.
+    If the consumer needs the results of a send not yet started by the ``executor``,
+    it runs the send itself.
+    If any send raises an exception, iteration re-raises the exception
+    after all previous results of the send.
+    """
+    __slots__ = ('_state', '_merge')
+
+    def __init__(self, sends, executor, merge='completed', buffer_size=STREAM_BUFFER):
+        self._state = _StreamState(sends, buffer_size, track_arrivals=merge == 'completed')
+        self._merge = merge
+        for index in range(len(sends)):
+            executor.submit(self._state.produce, index)
+
+    def __iter__(self):
+        state = self._state
+        with state.condition:
+            if state.consumer is not None:
+                raise RuntimeError('%s can only be iterated once' % self.__class__.__name__)
+            state.consumer = threading.current_thread()
+        return self._iter_round_robin() if self._merge == 'round_robin' else self._iter_completed()
+
+    # iterators refer to the results, so that sends are not abandoned while iterating
+    def _iter_completed(self):
+        state = self._state
+        try:
+            while True:
+                result = state.next_result()
+                if result is _END:
+                    return
+                yield result
+        finally:
+            state.abandon()
+
+    def _iter_round_robin(self):
+        state = self._state
+        active = list(range(len(state.buffers)))
+        try:
+            while active:
+                for index in tuple(active):
+                    result = state.next_result(index)
+                    if result is _END:
+                        active.remove(index)
+                    else:
+                        yield result
+        finally:
+            state.abandon()
+
+    def __del__(self):
+        self._state.abandon()
 
 
 class SafeTee(object):
@@ -189,8 +578,150 @@ class SafeTee(object):
             return
 
 
-def multi_iter(iterable, count=2):
-    """Return `count` independent, thread-safe iterators for `iterable`"""
+#: default number of items by which a consumer of a :py:class:`RingTee` may lead other consumers
+TEE_HIGH_WATER = 1024
+
+
+class RingTee(object):
+    """
+    Thread-safe version of :py:func:`itertools.tee` sharing one bounded buffer
+
+    :param iterable: source iterable to split
+    :param n: number of safe iterators to produce for `iterable`
+    :type n: int
+    :param high_water: number of items a consumer may lead other consumers, or :py:const:`None` for no limit
+    :type high_water: int or None
+
+    All consumers read from a single buffer, each keeping a cursor to its position.
+    Items are discarded once every consumer has passed them.
+    Instead of buffering items without limit, a consumer that leads another consumer
+    by ``high_water`` items blocks until the other consumer catches up.
+    Each consumer fetches all items available to it at once,
+    so that the lock of the buffer is not acquired for every single item.
+
+    Only consumers that are actively iterated in *other* threads may block a consumer.
+    Items are buffered without limit for consumers which are not iterated yet,
+    or which are iterated by the same thread, as this thread could not catch up while blocked.
+    """
+    __slots__ = (
+        'high_water', '_count', '_consumers', '_source', '_pull_size', '_buffer', '_offset', '_cursors', '_owners',
+        '_waiting', '_exhausted', '_error', '_condition',
+    )
+
+    def __init__(self, iterable, n=2, high_water=TEE_HIGH_WATER):
+        if high_water is not None and high_water < 1:
+            raise ValueError('high_water must be positive or None')
+        self.high_water = high_water
+        self._count = n
+        # consumers are registered upfront, so that no items are discarded before they start
+        self._consumers = [object() for _ in range(n)]
+        self._source = iter(iterable)
+        self._pull_size = 1
+        self._buffer, self._offset = [], 0
+        #: consumer => index of its next item
+        self._cursors = dict((consumer, 0) for consumer in self._consumers)
+        #: consumer => thread which last fetched items for it
+        self._owners = {}
+        self._waiting = 0
+        self._exhausted, self._error = False, None
+        self._condition = threading.Condition(threading.Lock())
+
+    def __iter__(self):
+        with self._condition:
+            if not self._consumers:
+                raise ValueError('too many iterations (expected %d)' % self._count)
+            consumer = self._consumers.pop()
+        return self._consume(consumer)
+
+    def _consume(self, consumer):
+        try:
+            while True:
+                with self._condition:
+                    items = self._fetch(consumer)
+                if not items:
+                    return
+                for item in items:
+                    yield item
+        finally:
+            with self._condition:
+                del self._cursors[consumer]
+                self._owners.pop(consumer, None)
+                self._trim()
+                if self._waiting:
+                    self._condition.notify_all()
+
+    def _fetch(self, consumer):
+        """Fetch the next items for ``consumer``, or an empty list if there are none"""
+        thread = self._owners[consumer] = threading.current_thread()
+        while True:
+            cursor = self._cursors[consumer]
+            allowance = self._allowance(cursor, thread)
+            if allowance is not None and allowance <= 0:
+                self._waiting += 1
+                self._condition.wait()
+                self._waiting -= 1
+                continue
+            end = self._offset + len(self._buffer)
+            if cursor < end:
+                start = cursor - self._offset
+                items = self._buffer[start:] if allowance is None else self._buffer[start:start + allowance]
+            elif self._exhausted:
+                if self._error is not None:
+                    raise self._error
+                return []
+            else:
+                # pull growing batches, so that the first items are available quickly
+                pull_size = self._pull_size if allowance is None else min(self._pull_size, allowance)
+                self._pull_size = min(self._pull_size * 2, MAX_CHUNK_SIZE)
+                items = []
+                try:
+                    for item in itertools.islice(self._source, pull_size):
+                        items.append(item)
+                except Exception as err:  # pylint:disable=broad-except
+                    # items pulled before the error are still passed on
+                    self._exhausted, self._error = True, err
+                    if not items:
+                        raise
+                if not items:
+                    self._exhausted = True
+                    continue
+                self._buffer.extend(items)
+            self._cursors[consumer] = cursor + len(items)
+            self._trim()
+            if self._waiting:
+                self._condition.notify_all()
+            return items
+
+    def _allowance(self, cursor, thread):
+        """Number of items a consumer at ``cursor`` iterated by ``thread`` may fetch, or :py:const:`None` for any"""
+        if self.high_water is None:
+            return None
+        owners, laggard = self._owners, None
+        for other, other_cursor in self._cursors.items():
+            if owners.get(other, thread) is not thread and (laggard is None or other_cursor < laggard):
+                laggard = other_cursor
+        if laggard is None:
+            return None
+        return laggard + self.high_water - cursor
+
+    def _trim(self):
+        """Discard items passed by all consumers"""
+        # compact only occasionally, to amortise the cost of moving the remaining items
+        if len(self._buffer) <= 128:
+            return
+        passed = min(self._cursors.values()) - self._offset if self._cursors else len(self._buffer)
+        if passed > 64 and passed * 2 >= len(self._buffer):
+            del self._buffer[:passed]
+            self._offset += passed
+
+
+def multi_iter(iterable, count=2, high_water=TEE_HIGH_WATER):
+    """
+    Return `count` independent, thread-safe iterators for `iterable`
+
+    :param high_water: number of items an iterator may lead the others, see :py:class:`RingTee`
+    :type high_water: int or None
+    """
     # no need to special-case re-usable, container-like iterables
     if not isinstance(
             iterable,
@@ -199,7 +730,7 @@ def multi_iter(iterable, count=2):
                     FutureChainResults,
                     collections.Sequence, collections.Set, collections.Mapping, collections.MappingView
             )):
-        iterable = SafeTee(iterable, n=count)
+        iterable = RingTee(iterable, n=count, high_water=high_water)
     return (iter(iterable) for _ in range(count))
 
 
@@ -224,14 +755,45 @@ class LocalExecutor(object):
         Submit a call for future execution
 
         :return: future for the call execution
-        :rtype: StoredFuture
+        :rtype: LightFuture
         """
-        return StoredFuture(call, *args, **kwargs)
+        return LightFuture(call, *args, **kwargs)
 
 
 DEFAULT_EXECUTOR = LocalExecutor(-1, 'chainlet_local')
 
 
+#: largest number of values sent by one future with automatic chunk size
+MAX_CHUNK_SIZE = 256
+
+
+def _fixed_chunks(values, chunk_size):
+    values = iter(values)
+    while True:
+        chunk = list(itertools.islice(values, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+
+
+def _ramp_chunks(values):
+    # grow chunks so that the first results are available quickly
+    values, chunk_size = iter(values), 1
+    while True:
+        chunk = list(itertools.islice(values, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+        chunk_size = min(chunk_size * 2, MAX_CHUNK_SIZE)
+
+
+def _slot_options(options):
+    # the default executor is restored when creating the chainlet, and may not be pickleable
+    if 'executor' in options:
+        options['_executor'] = options.pop('executor')
+    return options
+
+
 class ConcurrentBundle(bundle.Bundle):
     """
     A group of chainlets that concurrently process each :term:`data chunk`
@@ -243,22 +805,97 @@ class ConcurrentBundle(bundle.Bundle):
 
     Concurrent bundles implement element concurrency:
     the same data is processed concurrently by multiple elements.
+
+    :param executor: executor for futures, instead of the default :py:attr:`executor`
+    :param fanout: how to pass data chunks to the elements, see :py:class:`~chainlet.primitives.bundle.Bundle`
+    :type fanout: str
+    :param merge: how to merge results streamed from the elements, or :py:const:`None` to not stream them
+    :type merge: str or None
+    :param ordered: whether results are provided in the order of elements, or as soon as they are available
+    :type ordered: bool or None
+
+    With the default ``fanout='stream'``, each element iterates the input independently
+    via :py:func:`multi_iter`. Use ``fanout='shared'`` to pass large data chunks to
+    all elements without buffering them for each element.
+
+    By default, all results of an element are collected before they are passed on,
+    in the order of elements.
+    If ``merge`` is set, results are passed on as soon as elements produce them
+    via :py:class:`StreamedResults`.
+    This reduces the time to the first result and the memory for intermediate results,
+    but the order of results depends on the ``merge`` mode:
+
+    ``'round_robin'``
+        Alternate between the results of all elements.
+
+    ``'completed'``
+        Results are passed on in the order they are produced by all elements.
+
+    If ``ordered`` is :py:const:`False`, all results of an element are passed on once it is done,
+    via :py:class:`CompletedResults`, instead of after all results of previous elements.
     """
-    __slots__ = ()
+    __slots__ = ('_executor', 'merge', 'ordered')
+    #: default executor for futures
     executor = DEFAULT_EXECUTOR
+    #: modes of merging results supported by this bundle type
+    merge_modes = (None, 'round_robin', 'completed')
+    #: whether results may be provided in the order futures complete
+    completion_order = True
+
+    def __init__(self, elements, executor=None, fanout='stream', merge=None, ordered=None):
+        super(ConcurrentBundle, self).__init__(elements, fanout=fanout)
+        self._executor = executor if executor is not None else self.executor
+        if merge not in self.merge_modes:
+            raise ValueError('%s supports merge modes %s, not %r' % (
+                self.__class__.__name__, ', '.join(repr(mode) for mode in self.merge_modes), merge
+            ))
+        self.merge = merge
+        if ordered is False and not self.completion_order:
+            raise ValueError('%s cannot provide results in completion order' % self.__class__.__name__)
+        self.ordered = ordered
+
+    @property
+    def options(self):
+        """All options that are set for this bundle"""
+        options = {'executor': self._executor} if self._executor is not self.executor else {}
+        if self.fanout != 'stream':
+            options['fanout'] = self.fanout
+        if self.merge is not None:
+            options['merge'] = self.merge
+        if self.ordered is not None:
+            options['ordered'] = self.ordered
+        return options
+
+    def __getitem__(self, item):
+        if item.__class__ == slice:
+            return self.__class__(self.elements[item], **self.options)
+        return self.elements[item]
+
+    def __reduce__(self):
+        return self.__class__, (self.elements,), (None, _slot_options(self.options))
 
     def chainlet_send(self, value=None):
-        if self.chain_join:
-            return FutureChainResults([
-                self.executor.submit(eager_send, element, values)
-                for element, values in zip(self.elements, multi_iter(value, len(self.elements)))
-            ])
+        if self.chain_join and self.fanout == 'stream':
+            sends = list(zip(self.elements, multi_iter(value, len(self.elements))))
         else:
-            values = (value,)
-            return FutureChainResults([
-                self.executor.submit(eager_send, element, values)
-                for element in self.elements
-            ])
+            values = self._fan_out(value)
+            sends = [(element, values) for element in self.elements]
+        if self.merge is not None:
+            return StreamedResults(sends, self._executor, merge=self.merge)
+        elif self.ordered is False:
+            completions = queue.Queue()
+            return CompletedResults([
+                self._executor.submit(report_completion, completions, eager_send, element, values)
+                for element, values in sends
+            ], completions)
+        return FutureChainResults([
+            self._executor.submit(eager_send, element, values)
+            for element, values in sends
+        ])
+
+    def chainlet_send_batch(self, values):
+        # concurrency is implemented by chainlet_send only
+        return list(lazy_send(self, values))
 
 
 class ConcurrentChain(chain.Chain):
@@ -273,19 +910,89 @@ class ConcurrentChain(chain.Chain):
     Concurrent chains implement data concurrency:
     multiple data is processed concurrently by the same elements.
 
+    :param executor: executor for futures, instead of the default :py:attr:`executor`
+    :param max_inflight: maximum number of futures submitted but not consumed
+    :type max_inflight: int or None
+    :param chunk_size: number of values sent by each future, or ``'auto'``
+    :type chunk_size: int, str or None
+    :param ordered: whether results are provided in the order of values, or as soon as they are available
+    :type ordered: bool or None
+
+    If ``max_inflight`` is set, futures are submitted lazily as earlier results are consumed.
+    The results of a bounded chain are not kept once consumed, and may only be iterated over once.
+    If ``chunk_size`` is set, each future sends several values to a stripe at once.
+    This reduces the overhead of futures for cheap stripes, at the cost of less concurrency.
+    With ``'auto'``, the chunk size is about a quarter of the values per worker if the number of
+    values is known, as for :py:meth:`multiprocessing.pool.Pool.map`.
+    Otherwise, chunks grow from a single value up to :py:data:`MAX_CHUNK_SIZE` values.
+    This limits the resources used by a stream of data of any size.
+    If ``ordered`` is :py:const:`False`, the results of each future are provided via :py:class:`CompletedResults`
+    as soon as it completes, instead of after the results of all previous futures.
+    This avoids waiting for slow values if the order of results is irrelevant.
+    Options not set explicitly are inherited from any concurrent chain of the same
+    type in ``elements``, such as when linking ``chain >> element``.
+
     :note: A :py:class:`ConcurrentChain` will *always* :term:`join`
            and :term:`fork` to handle all data.
     """
-    __slots__ = ('_stripes',)
+    __slots__ = ('_stripes', '_executor', 'max_inflight', 'chunk_size', 'ordered')
+    #: default executor for futures
     executor = DEFAULT_EXECUTOR
+    #: names of options inherited when linking the chain
+    chain_options = ('max_inflight', 'chunk_size', 'ordered')
+    #: whether results may be provided in the order futures complete
+    completion_order = True
+
+    def __new__(cls, elements, executor=None, **options):
+        return super(ConcurrentChain, cls).__new__(cls, elements)
 
-    def __init__(self, elements):
+    def __init__(self, elements, executor=None, **options):
         super(ConcurrentChain, self).__init__(elements)
         self._stripes = None
+        if executor is None:
+            executor = self._inherit_option(elements, '_executor') or self.executor
+        self._executor = executor
+        for name in self.chain_options:
+            value = options.pop(name, None)
+            setattr(self, name, value if value is not None else self._inherit_option(elements, name))
+        if options:
+            raise TypeError('%s got unexpected options %s' % (self.__class__.__name__, ', '.join(sorted(options))))
+        if self.max_inflight is not None and self.max_inflight < 1:
+            raise ValueError('max_inflight must be positive')
+        if self.chunk_size is not None and self.chunk_size != 'auto' and self.chunk_size < 1:
+            raise ValueError("chunk_size must be positive or 'auto'")
+        if self.ordered is False and not self.completion_order:
+            raise ValueError('%s cannot provide results in completion order' % self.__class__.__name__)
         # need to receive all data for parallelism
         self.chain_join = True
         self.chain_fork = True
 
+    def _inherit_option(self, elements, name):
+        for element in elements:
+            if isinstance(element, ConcurrentChain) and element.chain_types is self.chain_types:
+                value = getattr(element, name)
+                if value is not None:
+                    return value
+        return None
+
+    @property
+    def options(self):
+        """All options that are set for this chain"""
+        options = dict(
+            (name, getattr(self, name)) for name in self.chain_options if getattr(self, name) is not None
+        )
+        if self._executor is not self.executor:
+            options['executor'] = self._executor
+        return options
+
+    def __getitem__(self, item):
+        if item.__class__ == slice:
+            return self.__class__(self.elements[item], **self.options)
+        return self.elements[item]
+
+    def __reduce__(self):
+        return self.__class__, (self.elements,), (None, _slot_options(self.options))
+
     def _compile_stripes(self):
         stripes, buffer = [], []
         for element in self.elements:
@@ -307,6 +1014,48 @@ class ConcurrentChain(chain.Chain):
             stripes.append(chain.Chain(buffer))
         self._stripes = stripes
 
+    def _submit_stripe(self, stripe, values, completions=None):
+        """Submit futures for sending each of ``values`` to ``stripe``, reporting to ``completions`` if set"""
+        chunks = self._chunk_values(values)
+        if completions is None:
+            call = (eager_send, stripe)
+        else:
+            call = (report_completion, completions, eager_send, stripe)
+        if self.max_inflight is None:
+            return [self._executor.submit(*(call + (chunk,))) for chunk in chunks]
+        return self._submit_bounded(call, chunks)
+
+    def _submit_bounded(self, call, chunks):
+        # submit one future for every future consumed from us
+        submit = self._executor.submit
+        inflight = collections.deque(
+            submit(*(call + (chunk,))) for chunk in itertools.islice(chunks, self.max_inflight)
+        )
+        while inflight:
+            future = inflight.popleft()
+            for chunk in itertools.islice(chunks, 1):
+                inflight.append(submit(*(call + (chunk,))))
+            yield future
+
+    def _chunk_values(self, values):
+        """Split ``values`` into lists of values, each to be sent by one future"""
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            return ([value] for value in values)
+        elif chunk_size == 'auto':
+            try:
+                value_count = len(values)
+            except TypeError:
+                return _ramp_chunks(values)
+            # same as multiprocessing.Pool.map: about four chunks per worker
+            workers = self._executor._max_workers  # pylint:disable=protected-access
+            if workers == float('inf'):
+                workers = CPU_CONCURRENCY
+            chunk_size, extra = divmod(value_count, workers * 4)
+            if extra:
+                chunk_size += 1
+        return _fixed_chunks(values, max(chunk_size, 1))
+
     def chainlet_send(self, value=None):
         if self._stripes is None:
             self._compile_stripes()
@@ -315,12 +1064,23 @@ class ConcurrentChain(chain.Chain):
         else:
             values = [value]
         try:
-            for stripe in self._stripes:
-                if not stripe.chain_join:
-                    values = FutureChainResults([
-                        self.executor.submit(eager_send, stripe, [value])
-                        for value in values
-                    ])
+            stripes = self._stripes
+            for index, stripe in enumerate(stripes):
+                if index + 1 < len(stripes):
+                    # results consumed by another stripe are iterated only once, unless it joins them
+                    single_pass = not stripes[index + 1].chain_join
+                else:
+                    # bounded chains do not keep final results once they are consumed
+                    single_pass = self.max_inflight is not None
+                if not stripe.chain_join and self.ordered is False:
+                    completions = queue.Queue()
+                    values = CompletedResults(self._submit_stripe(stripe, values, completions), completions)
+                    if index + 1 < len(stripes) and not single_pass:
+                        # a joining element may iterate its input several times
+                        values = list(values)
+                elif not stripe.chain_join:
+                    result_type = FutureChainIterator if single_pass else FutureChainResults
+                    values = result_type(self._submit_stripe(stripe, values))
                 else:
                     values = eager_send(stripe, values)
                 if not values:
@@ -328,10 +1088,14 @@ class ConcurrentChain(chain.Chain):
             if self.chain_fork:
                 return values
             else:
-                try:
-                    return next(iter(values))
-                except IndexError:
-                    raise signals.StopTraversal
+                for value in values:
+                    return value
+                return signals.SKIP
         # An element in the chain is exhausted permanently
-        except signals.ChainExit:
+        except signals.ChainExit as err:
+            err.__traceback__ = None
             raise StopIteration
+
+    def chainlet_send_batch(self, values):
+        # concurrency is implemented by chainlet_send only
+        return list(lazy_send(self, values))
@@ -0,0 +1,356 @@
+"""
+Process based concurrency domain
+
+Primitives of this module implement concurrency based on processes.
+This allows regular Python code to be run in parallel, as each process has its own :term:`Global Interpreter Lock`.
+Elements are copied to worker processes, and data chunks are exchanged via :py:mod:`pickle`.
+Large data chunks may be exchanged via shared memory, see :py:mod:`~chainlet.concurrency.transport`.
+Any state and side effects of elements are local to each worker, and not visible to the main process.
+See the :py:mod:`multiprocessing` module for details.
+
+:warning: The primitives in this module should not be used manually, and may change without deprecation warning.
+          Use :py:func:`convert` instead.
+"""
+from __future__ import print_function
+import os
+import threading
+import multiprocessing
+import itertools
+import atexit
+import weakref
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from ..primitives import link
+from ..primitives import linker
+from .base import LightFuture, CPU_CONCURRENCY, LocalExecutor, ConcurrentBundle, ConcurrentChain
+from .transport import PICKLE_TRANSPORT
+
+
+class ProcessFuture(object):
+    """
+    Call executed in a worker process
+
+    The future is realised by the executor once the worker process provides the result.
+    """
+    __slots__ = ('_result', '_done')
+
+    def __init__(self):
+        self._result = None
+        self._done = threading.Event()
+
+    def realise(self):
+        """
+        Realise the future if possible
+
+        A :py:class:`ProcessFuture` is always realised by a worker process.
+        This does not block, but only returns whether the result is already available.
+
+        :return: whether the future has been realised
+        :rtype: bool
+        """
+        return self._result is not None
+
+    @property
+    def claimed(self):
+        """Whether the future is realised by a worker process, which is always the case"""
+        return True
+
+    def await_result(self):
+        """Wait for the future to be realised"""
+        self._done.wait()
+
+    @property
+    def result(self):
+        """
+        The result from realising the future
+
+        If the result is not available, block until done.
+
+        :return: result of the future
+        :raises: any exception encountered during realising the future
+        """
+        if self._result is None:
+            self.await_result()
+        chunks, exception = self._result
+        if exception is None:
+            return chunks
+        raise exception  # re-raise exception from execution
+
+    def _set_result(self, chunks, exception):
+        self._result = chunks, exception
+        self._done.set()
+
+
+class _StashedLink(object):
+    """Reference to a chainlink already stored in a worker process"""
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __getstate__(self):
+        return self.key
+
+    def __setstate__(self, state):
+        self.key = state
+
+
+def _process_worker(tasks, results, transport):
+    """Realise futures in a worker process until receiving :py:const:`None`"""
+    stash = {}
+    while True:
+        try:
+            task = transport.recv(tasks)
+        except EOFError:
+            break
+        if task is None:
+            break
+        task_id, call, args, kwargs = task
+        if call is None:
+            # store a pickled chainlink for use by later calls, or discard it once it is unused
+            if args is None:
+                stash.pop(task_id, None)
+            else:
+                stash[task_id] = pickle.loads(args)
+            continue
+        try:
+            args = [stash[arg.key] if isinstance(arg, _StashedLink) else arg for arg in args]
+            result = call(*args, **kwargs), None
+        except BaseException as err:  # pylint:disable=broad-except
+            result = None, err
+        try:
+            transport.send(results, (task_id,) + result)
+        except Exception as err:  # pylint:disable=broad-except
+            transport.send(results, (task_id, None, RuntimeError('cannot send result to main process: %r' % err)))
+    tasks.close()
+    results.close()
+
+
+class _ProcessWorker(object):
+    """Handle to a worker process and its pending futures"""
+    __slots__ = ('process', 'tasks', 'results', 'futures', 'stashed')
+
+    def __init__(self, name, transport):
+        # one-way pipes as (receiving end, sending end)
+        worker_tasks, self.tasks = multiprocessing.Pipe(duplex=False)
+        self.results, worker_results = multiprocessing.Pipe(duplex=False)
+        self.futures = {}
+        self.stashed = set()
+        self.process = multiprocessing.Process(
+            target=_process_worker, args=(worker_tasks, worker_results, transport), name=name
+        )
+        self.process.daemon = True
+        self.process.start()
+        worker_tasks.close()
+        worker_results.close()
+
+
+class ProcessPoolExecutor(LocalExecutor):
+    """
+    Executor for futures using a pool of processes
+
+    :param max_workers: maximum number of processes in pool
+    :type max_workers: int or float
+    :param identifier: base identifier for all workers
+    :type identifier: str
+    :param transport: how to exchange data with workers, by default via :py:mod:`pickle`
+    :type transport: :py:class:`~chainlet.concurrency.transport.PickleTransport`
+
+    Any :py:class:`~.ChainLink` passed as a positional argument to :py:meth:`submit`
+    is pickled only once, and sent to each worker process only once.
+    Subsequent calls use the copy already stored by the worker process.
+    Once the :py:class:`~.ChainLink` is garbage collected, worker processes discard their copy as well.
+    Worker processes are started lazily, once there is work for them.
+
+    If the executor is used from another process, such as a worker process of a
+    nested chain, futures are realised locally instead.
+    """
+    __slots__ = ('_workers', '_stash', '_released', '_task_ids', '_pid', '_lock', '_transport')
+
+    def __init__(self, max_workers, identifier='', transport=PICKLE_TRANSPORT):
+        super(ProcessPoolExecutor, self).__init__(max_workers=max_workers, identifier=identifier)
+        if self._max_workers == float('inf'):
+            self._max_workers = CPU_CONCURRENCY
+        self._transport = transport
+        self._workers = []
+        self._stash = {}
+        self._released = []
+        self._task_ids = itertools.count()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        atexit.register(self._teardown)
+
+    def _teardown(self):
+        # prevent starting new workers
+        self._max_workers = 0
+        for worker in self._workers:
+            try:
+                self._transport.send(worker.tasks, None)
+            except (IOError, OSError):
+                pass
+        for worker in self._workers:
+            worker.process.join(1)
+        # tasks not received by any worker will not be received anymore
+        self._transport.close()
+
+    def submit(self, call, *args, **kwargs):
+        """
+        Submit a call for future execution
+
+        :return: future for the call execution
+        :rtype: ProcessFuture or LightFuture
+        """
+        if os.getpid() != self._pid or not self._max_workers:
+            return LightFuture(call, *args, **kwargs)
+        future = ProcessFuture()
+        with self._lock:
+            worker = self._get_worker()
+            task_id = next(self._task_ids)
+            # the result may arrive before send returns
+            worker.futures[task_id] = future
+            try:
+                self._discard_released()
+                args = tuple(
+                    self._stash_link(worker, arg) if isinstance(arg, link.ChainLink) else arg for arg in args
+                )
+                self._transport.send(worker.tasks, (task_id, call, args, kwargs))
+            except Exception as err:  # pylint:disable=broad-except
+                del worker.futures[task_id]
+                future._set_result(None, err)  # pylint:disable=protected-access
+        return future
+
+    def _stash_link(self, worker, element):
+        """Ensure ``element`` is stored by ``worker``, and return a reference to it"""
+        try:
+            key, payload = self._stash[id(element)][1:]
+        except KeyError:
+            key, payload = next(self._task_ids), pickle.dumps(element, pickle.HIGHEST_PROTOCOL)
+            self._stash[id(element)] = self._reference(element), key, payload
+        if key not in worker.stashed:
+            self._transport.send(worker.tasks, (key, None, payload, None))
+            worker.stashed.add(key)
+        return _StashedLink(key)
+
+    def _reference(self, element):
+        """Reference ``element`` from the stash, releasing its entry once ``element`` is garbage collected"""
+        element_id = id(element)
+
+        def release(_):
+            # the element is gone before its id may be reused
+            self._released.append(self._stash.pop(element_id)[1])
+        try:
+            return weakref.ref(element, release)
+        except TypeError:
+            # keep a reference so that the id() of the element is not reused
+            return element
+
+    def _discard_released(self):
+        """Let workers discard their copies of chainlinks which are garbage collected"""
+        while self._released:
+            key = self._released.pop()
+            for worker in self._workers:
+                if key in worker.stashed:
+                    worker.stashed.discard(key)
+                    self._transport.send(worker.tasks, (key, None, None, None))
+
+    def _get_worker(self):
+        """Get the least busy worker, starting a new one if needed"""
+        if self._workers:
+            worker = min(self._workers, key=lambda wrkr: len(wrkr.futures))
+            if not worker.futures or len(self._workers) >= self._max_workers:
+                return worker
+        worker = _ProcessWorker(name=self.identifier + '_%d' % len(self._workers), transport=self._transport)
+        collector = threading.Thread(
+            target=self._collect_results, args=(worker,), name=self.identifier + '_collector_%d' % len(self._workers)
+        )
+        collector.daemon = True
+        collector.start()
+        self._workers.append(worker)
+        return worker
+
+    def _collect_results(self, worker):
+        """Provide the results of ``worker`` to its futures"""
+        while True:
+            try:
+                task_id, chunks, exception = self._transport.recv(worker.results)
+            except (EOFError, IOError, OSError):
+                break
+            worker.futures.pop(task_id)._set_result(chunks, exception)  # pylint:disable=protected-access
+            # do not keep the result alive while waiting for the next one
+            chunks = exception = None
+        with self._lock:
+            try:
+                self._workers.remove(worker)
+            except ValueError:
+                pass
+        for future in list(worker.futures.values()):
+            future._set_result(  # pylint:disable=protected-access
+                None, RuntimeError('worker process %r exited' % worker.process.name)
+            )
+
+
+DEFAULT_EXECUTOR = ProcessPoolExecutor(CPU_CONCURRENCY, 'chainlet_process')
+
+
+class ProcessLinkPrimitives(linker.LinkPrimitives):
+    pass
+
+
+class ProcessBundle(ConcurrentBundle):
+    chain_types = ProcessLinkPrimitives()
+    executor = DEFAULT_EXECUTOR
+    __slots__ = ()
+    completion_order = False
+    # results are only returned once a worker process is done
+    merge_modes = (None,)
+
+    def chainlet_send(self, value=None):
+        # all elements receive a copy of the data, so fetch it only once
+        if self.chain_join:
+            value = tuple(value)
+        return super(ProcessBundle, self).chainlet_send(value)
+
+    def _fan_out(self, value):
+        # all elements receive a pickled copy of the data, and views cannot be pickled
+        return tuple(value) if self.chain_join else (value,)
+
+    def __repr__(self):
+        return 'processes(%s)' % super(ProcessBundle, self).__repr__()
+
+
+class ProcessChain(ConcurrentChain):
+    chain_types = ProcessLinkPrimitives()
+    executor = DEFAULT_EXECUTOR
+    __slots__ = ()
+    completion_order = False
+
+    def __repr__(self):
+        return 'processes(%s)' % super(ProcessChain, self).__repr__()
+
+
+ProcessLinkPrimitives.base_bundle_type = ProcessBundle
+ProcessLinkPrimitives.base_chain_type = ProcessChain
+ProcessLinkPrimitives.flat_chain_type = ProcessChain
+
+
+def convert(element, **options):
+    """
+    Convert a regular :term:`chainlink` to a process based version
+
+    :param element: the chainlink to convert
+    :param options: options for a converted chain or bundle, such as ``executor``, ``max_inflight`` or ``fanout``
+    :return: a process based version of ``element`` if possible, or the element itself
+
+    All elements of a converted chainlink are copied to worker processes.
+    Elements should not rely on state shared between data chunks or with the main process.
+    """
+    element = linker.LinkPrimitives().convert(element)
+    if isinstance(element, link.ChainLink.chain_types.base_bundle_type):
+        options.setdefault('fanout', element.fanout)
+        return ProcessLinkPrimitives.base_bundle_type(element.elements, **options)
+    elif isinstance(element, link.ChainLink.chain_types.base_chain_type):
+        return ProcessLinkPrimitives.base_chain_type(element.elements, **options)
+    return element
@@ -13,6 +13,8 @@ from __future__ import print_function
 import threading
 import time
 import atexit
+import collections
+import itertools
 
 from ..primitives import link
 from ..primitives import linker
@@ -22,23 +24,86 @@ try:
 except ImportError:
     import queue
 
-from .base import StoredFuture, CPU_CONCURRENCY, LocalExecutor, ConcurrentBundle, ConcurrentChain
+from .base import LightFuture, CPU_CONCURRENCY, LocalExecutor, ConcurrentBundle, ConcurrentChain
+
+
+_timer = getattr(time, 'monotonic', time.time)
+
+#: seconds after which a worker above the minimum is dismissed if it receives no work
+IDLE_TIMEOUT = 10.0
+#: seconds a future may wait in the queue before another worker is started
+GROW_WAIT = 0.005
+
+
+class ExecutorMetrics(object):
+    """
+    Snapshot of the utilisation of a :py:class:`ThreadPoolExecutor`
+
+    :param queue_depth: number of futures waiting for a worker
+    :param workers: number of worker threads
+    :param active_workers: number of workers executing a future
+    :param tasks_completed: number of futures executed by workers
+    :param average_wait: average seconds futures waited for a worker
+    """
+    __slots__ = ('queue_depth', 'workers', 'active_workers', 'tasks_completed', 'average_wait')
+
+    def __init__(self, queue_depth, workers, active_workers, tasks_completed, average_wait):
+        self.queue_depth = queue_depth
+        self.workers = workers
+        self.active_workers = active_workers
+        self.tasks_completed = tasks_completed
+        self.average_wait = average_wait
+
+    def __repr__(self):
+        return '<%s queue_depth=%d, workers=%d, active_workers=%d, tasks_completed=%d, average_wait=%.6fs>' % (
+            self.__class__.__name__, self.queue_depth, self.workers, self.active_workers,
+            self.tasks_completed, self.average_wait,
+        )
 
 
 class ThreadPoolExecutor(LocalExecutor):
     """
-    Executor for futures using a pool of threads
+    Executor for futures using an adaptive pool of threads
 
     :param max_workers: maximum number of threads in pool
     :type max_workers: int or float
     :param identifier: base identifier for all workers
     :type identifier: str
+    :param min_workers: number of threads kept even without work
+    :type min_workers: int or None
+    :param idle_timeout: seconds after which a thread above ``min_workers`` without work is dismissed
+    :type idle_timeout: float
+    :param grow_wait: seconds a future may wait for a thread before another one is started
+    :type grow_wait: float
+
+    The pool starts with ``min_workers`` threads, by default one per CPU but at least two.
+    Another thread is started only if there is no idle thread and futures have been waiting
+    in the queue for at least ``grow_wait`` seconds, but at most one thread every ``grow_wait`` seconds.
+    This lets the pool grow with sustained load, without overshooting on short bursts.
+    While futures are queued and no thread is idle, a monitor thread checks the age of the oldest future;
+    the pool grows even if all threads are blocked, such as by I/O.
+    See :py:meth:`metrics` to inspect the utilisation of the pool.
     """
-    __slots__ = ('_workers', '_queue', '_min_workers')
+    __slots__ = (
+        '_workers', '_queue', '_min_workers', 'idle_timeout', 'grow_wait', '_worker_ids', '_lock',
+        '_idle', '_active', '_completed', '_total_wait', '_last_growth', '_monitoring',
+    )
 
-    def __init__(self, max_workers, identifier=''):
+    def __init__(self, max_workers, identifier='', min_workers=None, idle_timeout=IDLE_TIMEOUT, grow_wait=GROW_WAIT):
         super(ThreadPoolExecutor, self).__init__(max_workers=max_workers, identifier=identifier)
-        self._min_workers = max(CPU_CONCURRENCY, 2)
+        if min_workers is None:
+            min_workers = min(max(CPU_CONCURRENCY, 2), self._max_workers)
+        if not 0 <= min_workers <= self._max_workers:
+            raise ValueError('min_workers must be between 0 and max_workers')
+        self._min_workers = min_workers
+        self.idle_timeout = idle_timeout
+        self.grow_wait = grow_wait
+        self._worker_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._idle = self._active = self._completed = 0
+        self._total_wait = 0.0
+        self._last_growth = _timer()
+        self._monitoring = False
         self._workers = set()
         self._queue = queue.Queue()
         self._ensure_worker()
@@ -63,47 +128,256 @@ class ThreadPoolExecutor(LocalExecutor):
         Submit a call for future execution
 
         :return: future for the call execution
-        :rtype: StoredFuture
+        :rtype: LightFuture
         """
-        future = StoredFuture(call, *args, **kwargs)
-        self._queue.put(future)
-        self._ensure_worker()
+        future = LightFuture(call, *args, **kwargs)
+        self._queue.put((_timer(), future))
+        if not self._idle:
+            self._ensure_worker()
         return future
 
+    def metrics(self):
+        """
+        Current utilisation of the pool
+
+        :rtype: ExecutorMetrics
+
+        A high :py:attr:`~.ExecutorMetrics.average_wait` with few :py:attr:`~.ExecutorMetrics.workers`
+        means the pool grows too slowly for the load.
+        In this case, raise ``min_workers`` or lower ``grow_wait``.
+        """
+        with self._lock:
+            return ExecutorMetrics(
+                queue_depth=self._queue.qsize(),
+                workers=len(self._workers),
+                active_workers=self._active,
+                tasks_completed=self._completed,
+                average_wait=self._total_wait / self._completed if self._completed else 0.0,
+            )
+
     def _execute_futures(self):
+        lock, work_queue = self._lock, self._queue
         while True:
             # try and get work
+            with lock:
+                self._idle += 1
             try:
-                future = self._queue.get(timeout=10)  # type: StoredFuture
+                item = work_queue.get(timeout=self.idle_timeout)
             except queue.Empty:
+                with lock:
+                    self._idle -= 1
                 if self._dismiss_worker(threading.current_thread()):
                     break
             else:
-                if future is None:
+                if item is None:
+                    with lock:
+                        self._idle -= 1
                     break
+                submitted, future = item  # type: float, LightFuture
+                waited = _timer() - submitted
+                with lock:
+                    self._idle -= 1
+                    self._active += 1
+                    self._total_wait += waited
+                if waited >= self.grow_wait or (not self._monitoring and work_queue.qsize()):
+                    # the pool did not keep up, so backlogged futures need more workers
+                    self._ensure_worker()
                 future.realise()
-                self._queue.task_done()
+                # do not keep the result alive while waiting for work
+                item = future = None
+                with lock:
+                    self._active -= 1
+                    self._completed += 1
+                work_queue.task_done()
         # clean up dangling threads
         self._workers.discard(threading.current_thread())
 
     def _dismiss_worker(self, worker):
         """Dismiss ``worker`` unless it is still required"""
-        self._workers.remove(worker)
-        if len(self._workers) < self._min_workers:
-            self._workers.add(worker)
-            return False
-        return True
+        with self._lock:
+            if len(self._workers) <= self._min_workers:
+                return False
+            self._workers.discard(worker)
+            return True
 
     def _ensure_worker(self):
         """Ensure there are enough workers available"""
-        while len(self._workers) < self._min_workers or len(self._workers) < self._queue.qsize() < self._max_workers:
+        with self._lock:
+            while len(self._workers) < self._min_workers:
+                self._start_worker()
+            if len(self._workers) >= self._max_workers or self._idle:
+                return
+            if not self._monitoring and self._queue.qsize():
+                # workers may be blocked indefinitely, so watch the queue independently
+                self._monitoring = True
+                monitor = threading.Thread(target=self._monitor_backlog, name=self.identifier + '_monitor')
+                monitor.daemon = True
+                monitor.start()
+            if not self._backlogged():
+                return
+            now = _timer()
+            if now - self._last_growth < self.grow_wait:
+                return
+            self._last_growth = now
+            self._start_worker()
+
+    def _monitor_backlog(self):
+        """Start workers while futures wait in the queue, until the queue is empty or the pool is full"""
+        while True:
+            # check at least every millisecond, to not spin with ``grow_wait=0``
+            time.sleep(max(self.grow_wait, 0.001))
+            with self._lock:
+                if not self._queue.qsize() or len(self._workers) >= self._max_workers:
+                    self._monitoring = False
+                    return
+            self._ensure_worker()
+
+    def _backlogged(self):
+        """Whether the oldest queued future has waited longer than ``grow_wait``"""
+        try:
+            # peek without taking the lock of the queue, as an outdated result just delays growth
+            submitted = self._queue.queue[0]
+        except IndexError:
+            return False
+        return submitted is not None and _timer() - submitted[0] >= self.grow_wait
+
+    def _start_worker(self):
+        worker = threading.Thread(
+            target=self._execute_futures,
+            name=self.identifier + '_%d' % next(self._worker_ids),
+        )
+        worker.daemon = True
+        self._workers.add(worker)
+        worker.start()
+
+
+class WorkStealingExecutor(LocalExecutor):
+    """
+    Executor for futures using a pool of threads with a work queue each
+
+    :param max_workers: maximum number of threads in pool
+    :type max_workers: int or float
+    :param identifier: base identifier for all workers
+    :type identifier: str
+
+    Every worker thread takes futures from its own :py:class:`~collections.deque`,
+    and steals futures from other workers only when it runs out of work.
+    This avoids contention of all workers on a single queue.
+    Futures submitted by a worker, e.g. by a nested concurrent bundle,
+    are queued by that worker for locality.
+    """
+    __slots__ = (
+        '_workers', '_queues', '_wakeups', '_idle', '_queued_idle', '_next_queue', '_local', '_lock', '_running',
+    )
+
+    def __init__(self, max_workers, identifier=''):
+        super(WorkStealingExecutor, self).__init__(max_workers=max_workers, identifier=identifier)
+        if self._max_workers == float('inf'):
+            self._max_workers = CPU_CONCURRENCY * 5
+        self._workers = []
+        self._queues = []
+        self._wakeups = []
+        self._idle = collections.deque()
+        # whether each worker is in the idle queue, so that it is queued at most once
+        self._queued_idle = []
+        self._next_queue = itertools.count()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._running = True
+        atexit.register(self._teardown)
+
+    def _teardown(self):
+        # prevent starting new workers
+        self._max_workers, self._running = 0, False
+        for wakeup in self._wakeups:
+            wakeup.set()
+        for worker in self._workers:
+            worker.join()
+
+    def submit(self, call, *args, **kwargs):
+        """
+        Submit a call for future execution
+
+        :return: future for the call execution
+        :rtype: LightFuture
+        """
+        future = LightFuture(call, *args, **kwargs)
+        own_queue = getattr(self._local, 'queue', None)
+        if own_queue is not None:
+            # keep work local, but let idle workers steal it
+            own_queue.append(future)
+            self._wake_idle()
+        elif not self._wake_idle(future):
+            if len(self._workers) < self._max_workers:
+                self._start_worker(future)
+            elif self._queues:
+                self._queues[next(self._next_queue) % len(self._queues)].append(future)
+            # without any workers, the future is realised by its consumer
+        return future
+
+    def _wake_idle(self, future=None):
+        """Wake up an idle worker, optionally queueing ``future`` for it"""
+        try:
+            worker_idx = self._idle.popleft()
+        except IndexError:
+            return False
+        self._queued_idle[worker_idx] = False
+        if future is not None:
+            self._queues[worker_idx].append(future)
+        self._wakeups[worker_idx].set()
+        return True
+
+    def _start_worker(self, future):
+        with self._lock:
+            worker_idx = len(self._workers)
+            if worker_idx >= self._max_workers:
+                if self._queues:
+                    self._queues[worker_idx % len(self._queues)].append(future)
+                return
+            self._queues.append(collections.deque((future,)))
+            self._wakeups.append(threading.Event())
+            self._queued_idle.append(False)
             worker = threading.Thread(
                 target=self._execute_futures,
-                name=self.identifier + '_%d' % time.time(),
+                args=(worker_idx,),
+                name=self.identifier + '_%d' % worker_idx,
             )
             worker.daemon = True
-            self._workers.add(worker)
-            worker.start()
+            self._workers.append(worker)
+        worker.start()
+
+    def _execute_futures(self, worker_idx):
+        wakeup = self._wakeups[worker_idx]
+        self._local.queue = self._queues[worker_idx]
+        while self._running:
+            future = self._get_future(worker_idx)
+            if future is None:
+                wakeup.clear()
+                # a worker may still be queued as idle if it found work after queueing itself
+                if not self._queued_idle[worker_idx]:
+                    self._queued_idle[worker_idx] = True
+                    self._idle.append(worker_idx)
+                # work may have been queued before we were marked as idle
+                future = self._get_future(worker_idx)
+                if future is None:
+                    wakeup.wait()
+                    continue
+            future.realise()
+
+    def _get_future(self, worker_idx):
+        """Get the newest own work or the oldest work of any other worker"""
+        queues = self._queues
+        try:
+            # newest work first, as its data is most likely still cached
+            return queues[worker_idx].pop()
+        except IndexError:
+            pass
+        for offset in range(1, len(queues)):
+            try:
+                return queues[(worker_idx + offset) % len(queues)].popleft()
+            except IndexError:
+                continue
+        return None
 
 
 DEFAULT_EXECUTOR = ThreadPoolExecutor(CPU_CONCURRENCY * 5, 'chainlet_thread')
@@ -136,16 +410,19 @@ ThreadLinkPrimitives.base_chain_type = ThreadChain
 ThreadLinkPrimitives.flat_chain_type = ThreadChain
 
 
-def convert(element):
+def convert(element, **options):
     """
     Convert a regular :term:`chainlink` to a thread based version
 
     :param element: the chainlink to convert
+    :param options: options for a converted chain or bundle,
+                    such as ``executor``, ``max_inflight``, ``fanout`` or ``ordered``
     :return: a threaded version of ``element`` if possible, or the element itself
     """
     element = linker.LinkPrimitives().convert(element)
     if isinstance(element, link.ChainLink.chain_types.base_bundle_type):
-        return ThreadLinkPrimitives.base_bundle_type(element.elements)
+        options.setdefault('fanout', element.fanout)
+        return ThreadLinkPrimitives.base_bundle_type(element.elements, **options)
     elif isinstance(element, link.ChainLink.chain_types.base_chain_type):
-        return ThreadLinkPrimitives.base_chain_type(element.elements)
+        return ThreadLinkPrimitives.base_chain_type(element.elements, **options)
     return element
@@ -0,0 +1,220 @@
+"""
+Transports for exchanging data chunks between processes
+
+A transport sends and receives objects via a :py:class:`multiprocessing.connection.Connection`.
+The :py:class:`PickleTransport` copies objects via :py:mod:`pickle`, just like the connection itself.
+The :py:class:`SharedMemoryTransport` moves large buffers, such as of :py:mod:`numpy` arrays,
+via :py:mod:`multiprocessing.shared_memory` instead:
+
+.. code:: python
+
+    executor = ProcessPoolExecutor(4, transport=SharedMemoryTransport())
+    chain = producer >> processes(load_image >> detect_edges, executor=executor) >> consumer
+
+Each large buffer is copied once into a new block of shared memory, and the
+receiving process uses the block directly without copying it again.
+
+:note: The :py:class:`SharedMemoryTransport` requires Python 3.8 or newer and POSIX shared memory.
+"""
+from __future__ import absolute_import
+import mmap
+import os
+import weakref
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:  # pragma: no cover
+    shared_memory = resource_tracker = None
+
+try:
+    import _posixshmem
+except ImportError:  # pragma: no cover
+    _posixshmem = None
+
+
+class PickleTransport(object):
+    """
+    Transport copying objects via :py:mod:`pickle`
+    """
+    __slots__ = ()
+
+    def send(self, connection, obj):
+        """Send ``obj`` via ``connection``"""
+        connection.send(obj)
+
+    def recv(self, connection):
+        """Receive an object from ``connection``"""
+        return connection.recv()
+
+    def close(self):
+        """Release all resources of objects sent but not received"""
+        pass
+
+    def __repr__(self):
+        return '%s()' % self.__class__.__name__
+
+
+#: transport used by default
+PICKLE_TRANSPORT = PickleTransport()
+
+
+class SharedMemoryTransport(PickleTransport):
+    """
+    Transport moving large buffers via shared memory
+
+    :param threshold: minimum size in bytes of buffers to move via shared memory
+    :type threshold: int
+
+    Objects are pickled with protocol 5, which provides buffers of objects supporting it,
+    such as :py:mod:`numpy` arrays, separately from the pickled data.
+    Every contiguous buffer of at least ``threshold`` bytes is copied into its own block of shared memory.
+    Smaller buffers are sent as part of the pickled data.
+    Note that :py:class:`bytes` and :py:class:`bytearray` are always pickled in place.
+
+    The receiving process owns each block. It releases a block as soon as the last
+    object referring to it is garbage collected, as tracked by :py:attr:`attached`.
+    The sending process remembers each block until it is received.
+    Use :py:meth:`close` to release blocks which are never received, such as on shutdown.
+    """
+    __slots__ = ('threshold', '_attached', '_sent', '_prune_size', '_pid')
+
+    def __init__(self, threshold=65536):
+        if shared_memory is None or _posixshmem is None:  # pragma: no cover
+            raise NotImplementedError('%s requires POSIX multiprocessing.shared_memory' % self.__class__.__name__)
+        self.threshold = threshold
+        self._attached = set()
+        self._sent = set()
+        self._prune_size = 64
+        self._pid = os.getpid()
+
+    @property
+    def attached(self):
+        """Number of received blocks of shared memory still in use by this process"""
+        return len(self._attached)
+
+    def send(self, connection, obj):
+        blocks = []
+
+        def export_buffer(pickle_buffer):
+            try:
+                data = pickle_buffer.raw()
+            except BufferError:
+                # non-contiguous buffers must be pickled in place
+                return True
+            if not data.nbytes or data.nbytes < self.threshold:
+                return True
+            block = shared_memory.SharedMemory(create=True, size=data.nbytes)
+            blocks.append((block, data.nbytes))
+            block.buf[:data.nbytes] = data
+            return False
+
+        try:
+            payload = pickle.dumps(obj, protocol=5, buffer_callback=export_buffer)
+        except BaseException:
+            for block, _ in blocks:
+                block.close()
+                block.unlink()
+            raise
+        # ownership of each block is passed on to the receiver, so this process must not unlink it on exit
+        for block, _ in blocks:
+            block.close()
+            _untrack(block.name)
+        try:
+            connection.send((payload, [(block.name, size) for block, size in blocks]))
+        except BaseException:
+            for block, _ in blocks:
+                _unlink(block.name)
+            raise
+        self._track_sent(block.name for block, _ in blocks)
+
+    def recv(self, connection):
+        payload, blocks = connection.recv()
+        buffers = []
+        try:
+            for name, size in blocks:
+                buffers.append(self._attach(name, size))
+        except BaseException:
+            # the message is lost, so no one else can release its remaining blocks
+            for name, _ in blocks[len(buffers) + 1:]:
+                _unlink(name)
+            raise
+        return pickle.loads(payload, buffers=buffers)
+
+    def close(self):
+        """Unlink all blocks sent by this process which are not received yet"""
+        if os.getpid() != self._pid:
+            return
+        sent, self._sent = self._sent, set()
+        for name in sent:
+            _unlink(name)
+
+    def _track_sent(self, names):
+        if os.getpid() != self._pid:
+            # a forked copy of the transport does not own blocks of its parent
+            self._sent, self._pid = set(), os.getpid()
+        self._sent.update(names)
+        if len(self._sent) >= self._prune_size:
+            # forget blocks already unlinked by their receiver
+            self._sent = set(name for name in self._sent if _exists(name))
+            self._prune_size = max(64, 2 * len(self._sent))
+
+    def _attach(self, name, size):
+        """Get a view on the block ``name`` which releases the block once it is garbage collected"""
+        # The mapping is released once the last view exporting it is garbage collected.
+        # A SharedMemory block cannot be closed while views exist, so map the block directly.
+        mapping = _map(name, size)
+        self._attached.add(name)
+        weakref.finalize(mapping, self._attached.discard, name)
+        return memoryview(mapping)[:size]
+
+    def __getstate__(self):
+        # sent and received blocks are local to each process
+        return (self.threshold,)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __repr__(self):
+        return '%s(threshold=%d)' % (self.__class__.__name__, self.threshold)
+
+
+# Opening a SharedMemory block registers it with the resource tracker, which
+# unlinks it when the process exits. Blocks passed on to other processes are
+# accessed via the underlying POSIX shared memory instead, which is not tracked.
+def _untrack(name):
+    """Stop the resource tracker from unlinking the block ``name`` created by this process"""
+    resource_tracker.unregister('/' + name, 'shared_memory')
+
+
+def _map(name, size):
+    """Map the first ``size`` bytes of the block ``name`` and unlink it"""
+    fd = _posixshmem.shm_open('/' + name, os.O_RDWR, mode=0o600)
+    try:
+        mapping = mmap.mmap(fd, size)
+    finally:
+        os.close(fd)
+    # the memory stays available as long as it is mapped
+    _posixshmem.shm_unlink('/' + name)
+    return mapping
+
+
+def _exists(name):
+    """Whether the shared memory block ``name`` exists"""
+    try:
+        fd = _posixshmem.shm_open('/' + name, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    os.close(fd)
+    return True
+
+
+def _unlink(name):
+    """Unlink the shared memory block ``name`` if it exists"""
+    try:
+        _posixshmem.shm_unlink('/' + name)
+    except FileNotFoundError:
+        pass
@@ -8,7 +8,8 @@ import numbers
 
 from .primitives.link import ChainLink
 from .primitives.neutral import NeutralLink
-from .signals import StopTraversal
+from .signals import StopTraversal, SKIP
+from .chainsend import invalidate_strategies
 from . import utility
 
 __all__ = ['NoOp', 'joinlet', 'forklet', 'MergeLink', 'either']
@@ -62,6 +63,7 @@ def joinlet(chainlet):
             return sum(values) / len(values)
     """
     chainlet.chain_join = True
+    invalidate_strategies()
     return chainlet
 
 
@@ -87,6 +89,7 @@ def forklet(chainlet):
             return (person for person in persons if person.is_friend(value))
     """
     chainlet.chain_fork = True
+    invalidate_strategies()
     return chainlet
 
 
@@ -168,7 +171,7 @@ class MergeLink(ChainLink):
         try:
             base_value = next(iter_values)
         except StopIteration:
-            raise StopTraversal
+            return SKIP
         sample_type = type(base_value)
         try:
             merger = self._cache_mapping[sample_type]
@@ -200,9 +203,9 @@ class Either(ChainLink):
     :param default: default value to provide if no chain produces a result
 
     For every :term:`data chunk`, the first chain from ``choices`` to
-    produce a result is chosen. Success is determined by not raising
-    :py:exc:`~.StopTraversal`; there is no special casing of
-    ``[]`` or :py:const:`None`.
+    produce a result is chosen. Success is determined by neither returning
+    :py:data:`~.SKIP` nor raising :py:exc:`~.StopTraversal`;
+    there is no special casing of ``[]`` or :py:const:`None`.
 
     A simple switch statement can be implemented as
 
@@ -231,12 +234,15 @@ class Either(ChainLink):
     def chainlet_send(self, value=None):
         for choice in self.choices:
             try:
-                return choice.chainlet_send(value)
-            except StopTraversal:
+                result = choice.chainlet_send(value)
+            except StopTraversal as err:
+                err.__traceback__ = None
                 continue
+            if result is not SKIP:
+                return result
         if self.default is not self.NO_DEFAULT:
             return self.default
-        raise StopTraversal
+        return SKIP
 
     def __repr__(self):
         if self.default:
@@ -1,6 +1,135 @@
 from __future__ import division, absolute_import
 import threading
 import multiprocessing
+import socket
+import time
+import heapq
+import itertools
+import functools
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+try:
+    import selectors
+except ImportError:  # pragma: no cover
+    selectors = None
+
+from .primitives.chain import Chain
+from .concurrency.transport import PICKLE_TRANSPORT
+
+
+_timer = getattr(time, 'monotonic', time.time)
+
+
+class PullPolicy(object):
+    """
+    Policy how often a driver pulls a mounted chain
+
+    :param rate: maximum number of pulls per second, or :py:const:`None` for no limit
+    :type rate: float or None
+    :param burst: number of pulls that may exceed ``rate`` at once, by default ``batch``
+    :type burst: int or None
+    :param batch: number of pulls per scheduling turn of the chain
+    :type batch: int
+    :param min_backoff: initial seconds to wait after a turn in which the chain produced nothing
+    :type min_backoff: float
+    :param max_backoff: maximum seconds to wait after a turn in which the chain produced nothing,
+                        or :py:const:`None` to never wait
+    :type max_backoff: float or None
+
+    The ``rate`` is enforced by a token bucket holding up to ``burst`` pulls.
+    A chain produces nothing if it returns :py:const:`None` or an empty :py:class:`list`,
+    such as when traversal is stopped.
+    The wait after each such turn is doubled, until the chain produces something again.
+    """
+    __slots__ = ('rate', 'burst', 'batch', 'min_backoff', 'max_backoff')
+
+    def __init__(self, rate=None, burst=None, batch=1, min_backoff=0.001, max_backoff=None):
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be positive or None')
+        if batch < 1:
+            raise ValueError('batch must be at least 1')
+        if burst is None:
+            burst = batch
+        if burst < 1:
+            raise ValueError('burst must be at least 1')
+        if max_backoff is not None and not 0 < min_backoff <= max_backoff:
+            raise ValueError('min_backoff must be positive and at most max_backoff')
+        self.rate = rate
+        self.burst = burst
+        self.batch = batch
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+
+    def __repr__(self):
+        return '%s(rate=%r, burst=%r, batch=%r, min_backoff=%r, max_backoff=%r)' % (
+            self.__class__.__name__, self.rate, self.burst, self.batch, self.min_backoff, self.max_backoff
+        )
+
+
+#: policy to pull chains as fast as possible
+DEFAULT_POLICY = PullPolicy()
+
+
+class _Puller(object):
+    """
+    State of pulling ``mount`` according to a :py:class:`PullPolicy`
+
+    :param mount: the chain to pull
+    :param policy: the policy how to pull ``mount``
+    :type policy: PullPolicy
+    """
+    __slots__ = ('mount', 'policy', 'due', '_tokens', '_updated', '_backoff')
+
+    def __init__(self, mount, policy):
+        self.mount = mount
+        self.policy = policy
+        #: time at which the mount may be pulled again
+        self.due = 0.0
+        self._tokens = policy.burst
+        self._updated = _timer()
+        self._backoff = 0.0
+
+    def turn(self, handle=None):
+        """
+        Pull the mount for one scheduling turn
+
+        :param handle: callable receiving every result of the mount
+        :returns: seconds until the mount may be pulled again
+        :rtype: float
+        :raises StopIteration: if the mount is exhausted
+        """
+        policy, mount = self.policy, self.mount
+        pulls = policy.batch
+        if policy.rate is not None:
+            now = _timer()
+            self._tokens = min(policy.burst, self._tokens + (now - self._updated) * policy.rate)
+            self._updated = now
+            pulls = min(pulls, int(self._tokens))
+            if not pulls:
+                return self._delay((1 - self._tokens) / policy.rate)
+            self._tokens -= pulls
+        idle = True
+        for _ in range(pulls):
+            result = next(mount)
+            if handle is not None:
+                handle(result)
+            if result is not None and (result.__class__ is not list or result):
+                idle = False
+        if idle and policy.max_backoff is not None:
+            self._backoff = min(max(2 * self._backoff, policy.min_backoff), policy.max_backoff)
+        else:
+            self._backoff = 0.0
+        if policy.rate is not None and self._tokens < 1:
+            return self._delay(max(self._backoff, (1 - self._tokens) / policy.rate))
+        return self._delay(self._backoff) if self._backoff else 0.0
+
+    def _delay(self, delay):
+        self.due = _timer() + delay
+        return delay
 
 
 class ChainDriver(object):
@@ -9,15 +138,40 @@ class ChainDriver(object):
 
     This driver pulls all mounted chains via a single thread. This drives chains
     synchronously, but blocks all chains if any individual chain blocks.
+
+    Each chain is pulled according to the :py:class:`PullPolicy` it was mounted with.
+    If no chain may be pulled, the driver sleeps until the next one is due.
     """
     def __init__(self):
         self.mounts = []
+        #: the non-default :py:class:`PullPolicy` of mounts by their ``id``
+        self.policies = {}
         self._run_lock = threading.Lock()
         self._run_thread = None
 
-    def mount(self, *chains):
-        """Add chains to this driver"""
+    def mount(self, *chains, **options):
+        """
+        Add chains to this driver
+
+        :param policy: how to pull the chains, by default as fast as possible
+        :type policy: PullPolicy or None
+        """
+        policy = options.pop('policy', None)
+        if options:
+            raise TypeError('unexpected keyword arguments: %s' % ', '.join(options))
         self.mounts.extend(chains)
+        if policy is not None:
+            for chain in chains:
+                self.policies[id(chain)] = policy
+
+    def _unmount(self, mount):
+        """Remove an exhausted ``mount``"""
+        self.mounts.remove(mount)
+        self.policies.pop(id(mount), None)
+
+    def _puller(self, mount):
+        """Create the state for pulling ``mount``"""
+        return _Puller(mount, self.policies.get(id(mount), DEFAULT_POLICY))
 
     @property
     def running(self):
@@ -53,12 +207,25 @@ class ChainDriver(object):
         Start driving the chain, block until done
         """
         with self._run_lock:
+            pullers = {}
             while self.mounts:
-                for mount in self.mounts:
+                now, next_due = _timer(), None
+                for mount in self.mounts[:]:
+                    try:
+                        puller = pullers[id(mount)]
+                    except KeyError:
+                        puller = pullers[id(mount)] = self._puller(mount)
+                    if puller.due > now:
+                        next_due = puller.due if next_due is None else min(next_due, puller.due)
+                        continue
+                    next_due = now
                     try:
-                        next(mount)
+                        puller.turn()
                     except StopIteration:
-                        self.mounts.remove(mount)
+                        del pullers[id(mount)]
+                        self._unmount(mount)
+                if next_due is not None and next_due > now:
+                    time.sleep(next_due - now)
 
 
 class ConcurrentChainDriver(ChainDriver):
@@ -86,12 +253,15 @@ class ConcurrentChainDriver(ChainDriver):
             ]
             for chain, runner in chain_runners:
                 runner.join()
-                self.mounts.remove(chain)
+                self._unmount(chain)
 
     def _mount_driver(self, mount):
+        puller = self._puller(mount)
         try:
             while True:
-                next(mount)
+                delay = puller.turn()
+                if delay:
+                    time.sleep(delay)
         except StopIteration:
             pass
 
@@ -138,3 +308,343 @@ class MultiprocessChainDriver(ConcurrentChainDriver):
         runner.daemon = self.daemon
         runner.start()
         return runner
+
+
+class ProcessPoolChainDriver(ChainDriver):
+    """
+    Actively drives chains by pulling them
+
+    This driver pulls all mounted chains via a fixed pool of processes. Each process
+    pulls its share of chains, just like a :py:class:`ChainDriver`. Chains sharing elements
+    cannot exchange state between them.
+
+    :param processes: maximum number of processes, by default one per CPU
+    :type processes: int or None
+    :param daemon: run processes as ``daemon``, i.e. do not wait for them to finish
+    :type daemon: bool
+    :param handler: callable receiving ``handler(mount, result)`` for every result of every chain
+    :type handler: callable or None
+    :param transport: how to send results to the main process, by default via :py:mod:`pickle`
+    :type transport: :py:class:`~chainlet.concurrency.transport.PickleTransport`
+
+    Mounted chains are copied to worker processes, and each copy is closed in its worker
+    once the driver is done with it.
+    Results are sent back only if there is a ``handler``, which is called in a thread of the main process.
+    Each process applies the :py:class:`PullPolicy` of its chains, sleeping if none is due.
+    If a chain raises an exception, all chains are stopped and :py:meth:`run` raises the exception.
+    Use :py:meth:`stop` to shut down all processes while running.
+    """
+    def __init__(self, processes=None, daemon=True, handler=None, transport=PICKLE_TRANSPORT):
+        super(ProcessPoolChainDriver, self).__init__()
+        self.processes = processes if processes is not None else multiprocessing.cpu_count()
+        if self.processes < 1:
+            raise ValueError('processes must be at least 1')
+        self.daemon = daemon
+        self.handler = handler
+        self.transport = transport
+        self._controls = []
+        self._errors = []
+        self._stopped = False
+
+    def run(self):
+        with self._run_lock:
+            mounts = list(self.mounts)
+            if not mounts:
+                return
+            self._errors, self._stopped = [], False
+            collectors, processes = [], []
+            worker_count = min(self.processes, len(mounts))
+            for number in range(worker_count):
+                assigned = [(index, self._puller(mounts[index])) for index in range(number, len(mounts), worker_count)]
+                process, collector = self._start_worker(mounts, assigned, 'chainlet_driver_%d' % number)
+                processes.append(process)
+                collectors.append(collector)
+            for collector in collectors:
+                collector.join()
+            for process in processes:
+                process.join()
+            controls, self._controls = self._controls, []
+            for control in controls:
+                control.close()
+            if self._errors:
+                raise self._errors[0]
+
+    def stop(self):
+        """Stop all processes, closing all chains, if the driver is running"""
+        self._stopped = True
+        for control in self._controls:
+            try:
+                control.send(None)
+            except (IOError, OSError):
+                pass
+
+    def _start_worker(self, mounts, assigned, name):
+        """Start a worker process pulling ``assigned`` mounts, and a collector for its results"""
+        # one-way pipes as (receiving end, sending end)
+        worker_control, control = multiprocessing.Pipe(duplex=False)
+        results, worker_results = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_drive_mounts_process,
+            args=(assigned, worker_control, worker_results, self.transport, self.handler is not None),
+            name=name,
+        )
+        process.daemon = self.daemon
+        process.start()
+        worker_control.close()
+        worker_results.close()
+        self._controls.append(control)
+        collector = threading.Thread(
+            target=self._collect_results, args=(mounts, [index for index, _ in assigned], results),
+            name=name + '_collector',
+        )
+        collector.daemon = True
+        collector.start()
+        return process, collector
+
+    def _collect_results(self, mounts, pending, results):
+        """Provide the results of mounts in a worker process to the handler"""
+        pending = set(pending)
+        while True:
+            try:
+                index, result, exception = self.transport.recv(results)
+            except (EOFError, IOError, OSError):
+                break
+            mount = mounts[index]
+            if exception is None:
+                try:
+                    self.handler(mount, result)
+                except Exception as err:  # pylint:disable=broad-except
+                    self._fail(err)
+            elif isinstance(exception, StopIteration):
+                pending.discard(index)
+                self._unmount(mount)
+            else:
+                pending.discard(index)
+                self._fail(exception)
+        results.close()
+        if pending and not self._stopped:
+            self._fail(RuntimeError('worker process exited before its chains were exhausted'))
+
+    def _fail(self, exception):
+        self._errors.append(exception)
+        self.stop()
+
+
+def _drive_mounts_process(assigned, control, results, transport, send_results):
+    """
+    Pull ``assigned`` mounts in a worker process, until done or receiving a message via ``control``
+
+    Messages are sent via ``results`` as ``index, result, exception``;
+    an exhausted mount is signalled by a :py:exc:`StopIteration` exception.
+    """
+    active, timeout = list(assigned), 0
+    try:
+        # wait for the next due mount by waiting for a message
+        while active and not control.poll(timeout):
+            now, next_due = _timer(), None
+            for item in active[:]:
+                index, puller = item
+                if puller.due > now:
+                    next_due = puller.due if next_due is None else min(next_due, puller.due)
+                    continue
+                next_due = now
+                try:
+                    puller.turn(functools.partial(_send_result, transport, results, index) if send_results else None)
+                except BaseException as err:  # pylint:disable=broad-except
+                    active.remove(item)
+                    transport.send(results, (index, None, err))
+            timeout = max(next_due - now, 0) if next_due is not None else 0
+    finally:
+        for _, puller in assigned:
+            puller.mount.close()
+        control.close()
+        results.close()
+
+
+def _send_result(transport, results, index, result):
+    try:
+        transport.send(results, (index, result, None))
+    except Exception as err:  # pylint:disable=broad-except
+        transport.send(results, (index, None, RuntimeError('cannot send result to main process: %r' % err)))
+
+
+class MultiplexChainDriver(ChainDriver):
+    """
+    Actively drives chains by pulling them
+
+    This driver pulls all mounted chains via a fixed pool of threads. This drives chains
+    concurrently, while a blocking chain only blocks one of the threads.
+    Chains sharing elements may need to be synchronized explicitly.
+
+    :param workers: number of threads pulling chains, by default one per CPU
+    :type workers: int or None
+    :param daemon: run threads as ``daemon``, i.e. do not wait for them to finish
+    :type daemon: bool
+
+    Chains reading from a selectable source, such as a socket or pipe, are only pulled
+    once their source is ready for reading. Idle chains thus neither occupy a thread nor use CPU.
+    A chain is selectable if it, or its first element, provides a ``fileno`` method.
+    Such a source should not buffer data itself, as only its file descriptor is watched.
+    All other chains are pulled round-robin by the threads.
+    Chains which are not due according to their :py:class:`PullPolicy` do not occupy a thread either.
+
+    :note: This driver requires the :py:mod:`selectors` module of Python 3.4.
+    """
+    def __init__(self, workers=None, daemon=True):
+        if selectors is None:  # pragma: no cover
+            raise NotImplementedError('%s requires the selectors module' % self.__class__.__name__)
+        super(MultiplexChainDriver, self).__init__()
+        self.workers = workers if workers is not None else max(multiprocessing.cpu_count(), 2)
+        if self.workers < 1:
+            raise ValueError('workers must be at least 1')
+        self.daemon = daemon
+
+    def run(self):
+        with self._run_lock:
+            if self.mounts:
+                _MountMultiplexer(self, self.workers, self.daemon).run()
+
+
+def _selectable_source(mount):
+    """
+    Get the selectable source of a chain
+
+    :param mount: chain to inspect
+    :type mount: ChainLink
+    :returns: the chain or its first element providing ``fileno``, or :py:const:`None`
+    """
+    while True:
+        if callable(getattr(mount, 'fileno', None)):
+            return mount
+        if not isinstance(mount, Chain) or not mount.elements:
+            return None
+        mount = mount.elements[0]
+
+
+class _MountMultiplexer(object):
+    """
+    State of a single run of a :py:class:`MultiplexChainDriver`
+
+    :param driver: driver whose mounts to pull; exhausted chains are unmounted
+    :type driver: MultiplexChainDriver
+    :param workers: number of threads pulling chains
+    :type workers: int
+    :param daemon: run threads as ``daemon``
+    :type daemon: bool
+
+    Every chain is in exactly one place at any time: queued for a worker,
+    waiting until due or for readiness, or being pulled by a worker.
+    Only the thread calling :py:meth:`run` uses the selector;
+    workers hand over waiting chains and wake it up via a socket pair.
+    """
+    def __init__(self, driver, workers, daemon):
+        self.driver = driver
+        mounts = driver.mounts
+        self.workers = min(workers, len(mounts))
+        self.daemon = daemon
+        self._ready = queue.Queue()
+        self._lock = threading.Lock()
+        self._waiting = []
+        self._remaining = len(mounts)
+        self._exception = None
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+        for mount in mounts:
+            source = _selectable_source(mount)
+            if source is None:
+                self._ready.put((mount, source, driver._puller(mount)))  # pylint:disable=protected-access
+            else:
+                self._waiting.append((mount, source, driver._puller(mount)))  # pylint:disable=protected-access
+
+    def run(self):
+        """Pull all chains, block until done"""
+        selector = selectors.DefaultSelector()
+        selector.register(self._wake_recv, selectors.EVENT_READ)
+        threads = [
+            threading.Thread(target=self._drive_mounts, name='chainlet_multiplex_%d' % index)
+            for index in range(self.workers)
+        ]
+        for thread in threads:
+            thread.daemon = self.daemon
+            thread.start()
+        timers, order = [], itertools.count()
+        try:
+            while True:
+                with self._lock:
+                    if not self._remaining or self._exception is not None:
+                        break
+                    waiting, self._waiting = self._waiting, []
+                for item in waiting:
+                    heapq.heappush(timers, (item[2].due, next(order), item))
+                now = _timer()
+                while timers and timers[0][0] <= now:
+                    item = heapq.heappop(timers)[2]
+                    if item[1] is None:
+                        self._ready.put(item)
+                    else:
+                        selector.register(item[1], selectors.EVENT_READ, item)
+                for key, _ in selector.select(timers[0][0] - now if timers else None):
+                    if key.data is None:
+                        self._drain_wakeup()
+                    else:
+                        selector.unregister(key.fileobj)
+                        self._ready.put(key.data)
+        finally:
+            for _ in threads:
+                self._ready.put(None)
+            # workers may be stuck in a chain if another one failed
+            if self._exception is None:
+                for thread in threads:
+                    thread.join()
+            selector.close()
+            self._wake_recv.close()
+            self._wake_send.close()
+        if self._exception is not None:
+            raise self._exception
+
+    def _drive_mounts(self):
+        ready = self._ready
+        while True:
+            item = ready.get()
+            if item is None:
+                break
+            mount, source, puller = item
+            try:
+                delay = puller.turn()
+            except StopIteration:
+                self._release(mount)
+            except BaseException as err:
+                self._release(mount, err)
+                break
+            else:
+                if source is None and not delay:
+                    ready.put(item)
+                else:
+                    with self._lock:
+                        self._waiting.append(item)
+                    self._wakeup()
+
+    def _release(self, mount, exception=None):
+        """Remove an exhausted or failed ``mount``"""
+        with self._lock:
+            if exception is None:
+                self.driver._unmount(mount)  # pylint:disable=protected-access
+                self._remaining -= 1
+            elif self._exception is None:
+                self._exception = exception
+        self._wakeup()
+
+    def _wakeup(self):
+        try:
+            self._wake_send.send(b'\0')
+        except socket.error:
+            # the buffer is full, so the selector is woken up anyway
+            pass
+
+    def _drain_wakeup(self):
+        try:
+            while self._wake_recv.recv(4096):
+                pass
+        except socket.error:
+            pass
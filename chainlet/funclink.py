@@ -36,6 +36,7 @@ from __future__ import division, absolute_import
 import itertools
 
 from .primitives.link import ChainLink
+from . import signals
 from . import wrapper
 
 
@@ -105,6 +106,26 @@ class FunctionLink(wrapper.WrapperMixin, ChainLink):
         """Send a value to this element"""
         return self.__wrapped__(value)
 
+    def chainlet_send_batch(self, values):
+        """Send multiple values to this element"""
+        # call the slave directly only if doing so is equivalent to chainlet_send
+        if self.chain_fork or self.chain_join or type(self).chainlet_send is not FunctionLink.chainlet_send:
+            return super(FunctionLink, self).chainlet_send_batch(values)
+        slave, results, skip = self.__wrapped__, [], signals.SKIP
+        for value in values:
+            try:
+                result = slave(value)
+                if result is not skip:
+                    results.append(result)
+            except signals.StopTraversal as err:
+                err.__traceback__ = None
+                continue
+            except StopIteration:
+                break
+        else:
+            return results
+        raise signals.reset(signals.CHAIN_EXIT)
+
     def __wraplet_repr__(self):  # pragma: no cover
         if hasattr(self.__wrapped__, 'args'):
             return '<%s.%s(%s)>' % (
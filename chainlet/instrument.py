@@ -0,0 +1,378 @@
+"""
+Opt-in instrumentation to find bottlenecks in chains
+
+Instrumenting a :term:`chainlink` records how often and how long each of its elements is used:
+
+.. code:: python
+
+    chain = instrument(producer >> parse >> (analyse, archive) >> report)
+    for _ in chain:
+        pass
+    print(chain.stats())
+
+Each instrumented element records the number of calls, the number of
+:term:`data chunks <data chunk>` it receives and produces, as well as
+its cumulative and self time in nanoseconds.
+The self time excludes any time spent in instrumented sub-elements.
+The statistics are provided by :py:meth:`~.ChainLink.stats` as a tree of :py:class:`LinkStats`,
+which mirrors the structure of compound elements.
+
+Instrumentation is implemented by swapping the class of each element for a subclass
+with instrumented :py:meth:`~.ChainLink.chainlet_send` and :py:meth:`~.ChainLink.chainlet_send_batch`.
+Elements which are not instrumented run without any overhead.
+
+:note: Results of :term:`forking <fork>` elements are counted as they are consumed.
+       The time of an element does not include producing results lazily, such as by a generator.
+       Elements copied to other processes do not record statistics visible to the main process.
+"""
+from __future__ import absolute_import, division
+import threading
+import time
+import weakref
+
+from .signals import SKIP
+from .primitives.compound import CompoundLink
+from .primitives.chain import FlatChain
+from .concurrency.base import ConcurrentChain
+
+try:
+    _timer_ns = time.perf_counter_ns
+except AttributeError:  # pragma: no cover
+    try:
+        _perf_counter = time.perf_counter
+    except AttributeError:
+        _perf_counter = time.time
+
+    def _timer_ns():
+        return int(_perf_counter() * 1E9)
+
+__all__ = ['instrument', 'uninstrument', 'link_stats', 'LinkStats']
+
+
+class _Counters(object):
+    """Statistics recorded by a single instrumented element"""
+    __slots__ = ('calls', 'chunks_in', 'chunks_out', 'total_time', 'self_time', '_lock')
+
+    def __init__(self):
+        self.calls = self.chunks_in = self.chunks_out = self.total_time = self.self_time = 0
+        self._lock = threading.Lock()
+
+    def record(self, chunks_in, chunks_out, total_time, self_time):
+        with self._lock:
+            self.calls += 1
+            self.chunks_in += chunks_in
+            self.chunks_out += chunks_out
+            self.total_time += total_time
+            self.self_time += self_time
+
+    def add_chunk_in(self):
+        with self._lock:
+            self.chunks_in += 1
+
+    def add_chunk_out(self):
+        with self._lock:
+            self.chunks_out += 1
+
+
+#: id(element) => (reference to element, counters) of every instrumented element
+_REGISTRY = {}
+#: base class => instrumented subclass
+_INSTRUMENTED_TYPES = {}
+_REGISTRY_LOCK = threading.Lock()
+#: per-thread stack of ``[element id, time spent in instrumented sub-elements]``
+_CALL_STACK = threading.local()
+
+
+def _enter(element_id):
+    """Enter the instrumented call of an element, if it is not already active"""
+    try:
+        stack = _CALL_STACK.stack
+    except AttributeError:
+        stack = _CALL_STACK.stack = []
+    # an element calling itself, e.g. its chainlet_send via chainlet_send_batch, is recorded only once
+    if stack and stack[-1][0] == element_id:
+        return None
+    stack.append([element_id, 0])
+    return stack
+
+
+def _leave(stack, counters, start, chunks_in, chunks_out):
+    """Leave the instrumented call of an element, recording its statistics"""
+    total_time = _timer_ns() - start
+    child_time = stack.pop()[1]
+    if stack:
+        stack[-1][1] += total_time
+    counters.record(chunks_in, chunks_out, total_time, total_time - child_time)
+
+
+def _count_chunks(values, count):
+    """Call ``count`` for each chunk of ``values`` passing through an element"""
+    for value in values:
+        count()
+        yield value
+
+
+def _instrument_send(send):
+    """Instrument a ``chainlet_send`` function"""
+    def chainlet_send(self, value=None):
+        try:
+            counters = _REGISTRY[id(self)][1]
+        except KeyError:
+            return send(self, value)
+        stack = _enter(id(self))
+        if stack is None:
+            return send(self, value)
+        chunks_in, chunks_out = 1, 0
+        if self.chain_join:
+            try:
+                chunks_in = len(value)
+            except TypeError:
+                chunks_in, value = 0, _count_chunks(value, counters.add_chunk_in)
+        start = _timer_ns()
+        try:
+            result = send(self, value)
+            if result is SKIP:
+                pass
+            elif self.chain_fork:
+                try:
+                    chunks_out = len(result)
+                except TypeError:
+                    result = _count_chunks(result, counters.add_chunk_out)
+            else:
+                chunks_out = 1
+            return result
+        finally:
+            _leave(stack, counters, start, chunks_in, chunks_out)
+    chainlet_send.__doc__ = send.__doc__
+    return chainlet_send
+
+
+def _instrument_send_batch(send_batch):
+    """Instrument a ``chainlet_send_batch`` function"""
+    def chainlet_send_batch(self, values):
+        try:
+            counters = _REGISTRY[id(self)][1]
+        except KeyError:
+            return send_batch(self, values)
+        stack = _enter(id(self))
+        if stack is None:
+            return send_batch(self, values)
+        chunks_out = 0
+        start = _timer_ns()
+        try:
+            results = send_batch(self, values)
+            chunks_out = len(results)
+            return results
+        finally:
+            _leave(stack, counters, start, len(values), chunks_out)
+    chainlet_send_batch.__doc__ = send_batch.__doc__
+    return chainlet_send_batch
+
+
+def _call_compiled(function):
+    """Adapt a compiled function to the signature of a method"""
+    def method(self, value):
+        return function(value)
+    return method
+
+
+def _bind_weakly(function, element):
+    """Bind ``function`` to ``element`` without keeping ``element`` alive"""
+    reference = weakref.ref(element)
+
+    def method(value):
+        return function(reference(), value)
+    return method
+
+
+def _new_object(cls, *args):
+    """Create a new, uninitialised object of ``cls``"""
+    return cls.__new__(cls, *args)
+
+
+def _instrumented_type(base):
+    """Get the instrumented subclass of ``base``"""
+    try:
+        return _INSTRUMENTED_TYPES[base]
+    except KeyError:
+        pass
+
+    def __new__(cls, *args, **kwargs):
+        # new elements, e.g. from slicing, are not instrumented
+        return base(*args, **kwargs)
+
+    def __reduce_ex__(self, protocol):
+        # copies of an element are not instrumented
+        reduced = list(base.__reduce_ex__(self, protocol))
+        if reduced[0] is cls:
+            reduced[0] = base
+        elif reduced[1] and reduced[1][0] is cls:
+            # pickle insists that __newobj__ creates an object of the same class
+            reduced[0], reduced[1] = _new_object, (base,) + tuple(reduced[1][1:])
+        return tuple(reduced)
+
+    namespace = {
+        '__slots__': (),
+        '__module__': base.__module__,
+        '__new__': __new__,
+        '__reduce_ex__': __reduce_ex__,
+        'chainlet_send': _instrument_send(base.chainlet_send),
+        'chainlet_send_batch': _instrument_send_batch(base.chainlet_send_batch),
+    }
+    if issubclass(base, FlatChain):
+        def compile(self):  # pylint:disable=redefined-builtin
+            base.compile(self)
+            # the compiled functions bypass the class, so instrument them as well
+            # bound methods stored in the element would keep it alive until the next garbage collection
+            self.chainlet_send = _bind_weakly(_instrument_send(_call_compiled(self.chainlet_send)), self)
+            self.chainlet_send_batch = _bind_weakly(
+                _instrument_send_batch(_call_compiled(self.chainlet_send_batch)), self
+            )
+            return self
+        namespace['compile'] = compile
+    cls = type(base.__name__, (base,), namespace)
+    _INSTRUMENTED_TYPES[base] = cls
+    return cls
+
+
+def _children(element):
+    if isinstance(element, CompoundLink):
+        return element.elements
+    return ()
+
+
+def _reset_compiled(element):
+    """Discard any traversal compiled from the methods of the elements of ``element``"""
+    if isinstance(element, FlatChain):
+        instance_dict = getattr(element, '__dict__', {})
+        instance_dict.pop('chainlet_send', None)
+        instance_dict.pop('chainlet_send_batch', None)
+    elif isinstance(element, ConcurrentChain):
+        element._stripes = None  # pylint:disable=protected-access
+
+
+def instrument(element):
+    """
+    Record statistics of ``element`` and all its sub-elements
+
+    :param element: the chainlink to instrument
+    :type element: ChainLink
+    :return: the instrumented ``element``
+
+    Instrumenting an element resets any statistics previously recorded for it.
+    The statistics of an element are discarded once it is garbage collected.
+    Elements without support for weak references are kept alive until they are uninstrumented.
+    """
+    with _REGISTRY_LOCK:
+        _instrument(element)
+    return element
+
+
+def _instrument(element):
+    for child in _children(element):
+        _instrument(child)
+    _REGISTRY[id(element)] = _reference(element), _Counters()
+    if type(element) not in _INSTRUMENTED_TYPES.values():
+        element.__class__ = _instrumented_type(type(element))
+    _reset_compiled(element)
+
+
+def _reference(element):
+    """Reference ``element`` from the registry, discarding its entry once ``element`` is garbage collected"""
+    element_id = id(element)
+
+    def discard(_):
+        # the element is gone before its id may be reused
+        _REGISTRY.pop(element_id, None)
+    try:
+        return weakref.ref(element, discard)
+    except TypeError:
+        # elements without weak references are kept alive until they are uninstrumented
+        return element
+
+
+def uninstrument(element):
+    """
+    Stop recording statistics of ``element`` and all its sub-elements
+
+    :param element: the chainlink to uninstrument
+    :type element: ChainLink
+    :return: the uninstrumented ``element``
+    """
+    with _REGISTRY_LOCK:
+        _uninstrument(element)
+    return element
+
+
+def _uninstrument(element):
+    for child in _children(element):
+        _uninstrument(child)
+    _REGISTRY.pop(id(element), None)
+    if type(element) in _INSTRUMENTED_TYPES.values():
+        element.__class__ = type(element).__bases__[0]
+    _reset_compiled(element)
+
+
+class LinkStats(object):
+    """
+    Statistics recorded for an element and its sub-elements
+
+    :param element: the element for which statistics are recorded
+    :type element: ChainLink
+    :param children: statistics of the sub-elements of ``element``
+    :type children: tuple[LinkStats]
+
+    All times are in nanoseconds.
+    The statistics of an element which is not instrumented are all zero.
+    """
+    __slots__ = ('element', 'calls', 'chunks_in', 'chunks_out', 'total_time', 'self_time', 'children')
+
+    def __init__(self, element, children=()):
+        self.element = element
+        self.children = tuple(children)
+        try:
+            counters = _REGISTRY[id(element)][1]
+        except KeyError:
+            self.calls = self.chunks_in = self.chunks_out = self.total_time = self.self_time = 0
+        else:
+            with counters._lock:  # pylint:disable=protected-access
+                self.calls = counters.calls
+                self.chunks_in = counters.chunks_in
+                self.chunks_out = counters.chunks_out
+                self.total_time = counters.total_time
+                self.self_time = counters.self_time
+
+    def __iter__(self):
+        """Iterate over the statistics of this element and all sub-elements, depth first"""
+        yield self
+        for child in self.children:
+            for stats in child:
+                yield stats
+
+    def __str__(self):
+        return '\n'.join(self._format_lines(0))
+
+    def _format_lines(self, depth):
+        yield '%s%r: calls=%d in=%d out=%d total=%.3fms self=%.3fms' % (
+            '  ' * depth, self.element, self.calls, self.chunks_in, self.chunks_out,
+            self.total_time / 1E6, self.self_time / 1E6,
+        )
+        for child in self.children:
+            for line in child._format_lines(depth + 1):  # pylint:disable=protected-access
+                yield line
+
+    def __repr__(self):
+        return '<%s for %r, calls=%d, total_time=%d>' % (
+            self.__class__.__name__, self.element, self.calls, self.total_time
+        )
+
+
+def link_stats(element):
+    """
+    Get the statistics of ``element`` and all its sub-elements
+
+    :param element: the chainlink to inspect
+    :type element: ChainLink
+    :rtype: LinkStats
+    """
+    return LinkStats(element, (link_stats(child) for child in _children(element)))
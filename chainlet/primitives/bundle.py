@@ -3,37 +3,137 @@ from ..chainsend import lazy_send
 from .link import ChainLink
 from .compound import CompoundLink
 
+#: modes of passing data chunks to the elements of a :py:class:`Bundle`
+FANOUT_MODES = ('stream', 'shared')
+
+
+def _read_only(chunk):
+    """Provide a mutable buffer ``chunk`` as a read-only view without copying it"""
+    if isinstance(chunk, bytearray):
+        chunk = memoryview(chunk)
+    if isinstance(chunk, memoryview) and not chunk.readonly:
+        try:
+            return chunk.toreadonly()
+        except AttributeError:  # pragma: no cover
+            # python < 3.8 has no read-only views of mutable buffers, and copying defeats sharing
+            return chunk
+    return chunk
+
+
+def share_chunks(chunks):
+    """
+    Materialise ``chunks`` once as a read-only sequence for several consumers
+
+    :param chunks: the data chunks to share
+    :type chunks: iterable
+    :rtype: tuple
+
+    Mutable buffers, namely :py:class:`bytearray` and :py:class:`memoryview`,
+    are provided as read-only :py:class:`memoryview` sharing the same memory.
+    Any other chunk, such as immutable :py:class:`bytes`, is shared as it is.
+
+    :note: Before Python 3.8, a :py:class:`memoryview` cannot be made read-only without copying.
+           Mutable buffers are then provided as a writable :py:class:`memoryview` sharing the same memory,
+           and consumers must not modify them.
+    """
+    return tuple(_read_only(chunk) for chunk in chunks)
+
 
 class Bundle(CompoundLink):
     """
     A group of chainlets that concurrently process each :term:`data chunk`
+
+    :param elements: the chainlets making up this bundle
+    :type elements: iterable[:py:class:`ChainLink`]
+    :param fanout: how to pass data chunks to the elements, see :py:attr:`fanout`
+    :type fanout: str
+
+    The :py:attr:`fanout` defines how each element receives the input of the bundle:
+
+    ``'stream'``
+        Elements receive the input as it is, or a copy of it if the bundle :term:`joins <join>`.
+        Concurrent bundles pass the input to their elements while it is being produced.
+        This is the default.
+
+    ``'shared'``
+        The input is materialised once via :py:func:`share_chunks`,
+        and all elements read from the same read-only sequence.
+        This avoids copying and buffering large data chunks, such as :py:class:`bytes`, for each element.
+        Concurrent bundles only pass on data once all input is available.
     """
     chain_fork = True
-    __slots__ = ('chain_join',)
+    __slots__ = ('chain_join', '_fanout')
 
-    def __init__(self, elements):
+    def __init__(self, elements, fanout='stream'):
         super(Bundle, self).__init__(elements)
         if self.elements:
             self.chain_join = any(element.chain_join for element in self.elements)
         else:
             self.chain_join = False
+        self.fanout = fanout
+
+    @property
+    def fanout(self):
+        """The name of the mode of passing data chunks to the elements, see :py:data:`FANOUT_MODES`"""
+        return self._fanout
+
+    @fanout.setter
+    def fanout(self, value):
+        if value not in FANOUT_MODES:
+            raise ValueError('fanout must be one of %s, not %r' % (', '.join(FANOUT_MODES), value))
+        self._fanout = value
+
+    def __getitem__(self, item):
+        if item.__class__ == slice:
+            return self.__class__(self.elements[item], fanout=self._fanout)
+        return self.elements[item]
+
+    def __reduce__(self):
+        return self.__class__, (self.elements, self._fanout)
+
+    def _fan_out(self, value):
+        """Prepare the ``value`` sent to the bundle as input shared by all elements"""
+        if self._fanout == 'shared':
+            return share_chunks(value) if self.chain_join else (_read_only(value),)
+        elif self.chain_join:
+            return list(value)
+        return (value,)
 
     def chainlet_send(self, value=None):
-        if self.chain_join:
-            values = list(value)
-        else:
-            values = (value,)
+        values = self._fan_out(value)
         results = []
         elements_exhausted = 0
         for element in self.elements:
             try:
                 results.extend(lazy_send(element, values))
-            except signals.ChainExit:
+            except signals.ChainExit as err:
+                err.__traceback__ = None
                 elements_exhausted += 1
         if elements_exhausted == len(self.elements):
             raise StopIteration
         return results
 
+    def chainlet_send_batch(self, values):
+        if self.chain_join:
+            try:
+                return list(self.chainlet_send(values))
+            except StopIteration:
+                pass
+            raise signals.reset(signals.CHAIN_EXIT)
+        if self._fanout == 'shared':
+            values = share_chunks(values)
+        results = []
+        elements_exhausted = 0
+        for element in self.elements:
+            try:
+                results.extend(element.chainlet_send_batch(values))
+            except signals.ChainExit as err:
+                err.__traceback__ = None
+                elements_exhausted += 1
+        if elements_exhausted == len(self.elements):
+            raise signals.reset(signals.CHAIN_EXIT)
+        return results
+
     def __repr__(self):
         return repr(self.elements)
 
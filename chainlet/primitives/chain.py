@@ -1,7 +1,14 @@
 from .. import signals
-from ..chainsend import lazy_send
+from .. import chainsend
 from .link import ChainLink
 from .compound import CompoundLink
+from .neutral import NeutralLink
+
+#: execution engines of :py:class:`Chain` and how they resolve the send strategy of elements
+ENGINES = {
+    'lazy': chainsend.lazy_strategy,
+    'iterative': chainsend.eager_strategy,
+}
 
 
 class Chain(CompoundLink):
@@ -10,6 +17,8 @@ class Chain(CompoundLink):
 
     :param elements: the chainlets making up this chain
     :type elements: iterable[:py:class:`ChainLink`]
+    :param engine: name of the execution :py:attr:`engine` of the chain
+    :type engine: str or None
 
     :note: If ``elements`` contains a :py:class:`~.Chain`, this is flattened
            and any sub-elements are directly included in the new :py:class:`~.Chain`.
@@ -34,15 +43,32 @@ class Chain(CompoundLink):
     :note: Some optimised chainlets may assimilate subsequent chainlets during linking.
            The rules for splitting chains still apply, though the actual chain elements
            may differ from the provided ones.
+
+    The :py:attr:`engine` defines how data is passed along the elements of a chain
+    that forks or joins:
+
+    ``'lazy'``
+        Each element is traversed via a generator consuming the results of the previous element.
+        This is the default.
+
+    ``'iterative'``
+        Each element receives all values of the previous element as a :py:class:`list`,
+        and returns all its results as a new :py:class:`list`.
+        This avoids resuming a generator per element for each data chunk,
+        at the cost of holding all intermediate data chunks of a single traversal in memory.
+
+    Both engines traverse the chain breadth first, and produce the same results.
+    The iterative engine always calls the elements of one stage before those of the next stage.
+    If ``engine`` is not set, it is inherited from any :py:class:`Chain` in ``elements``.
     """
-    __slots__ = ('chain_join', 'chain_fork')
+    __slots__ = ('chain_join', 'chain_fork', 'chain_batch_size', '_engine', '_strategies', '_strategy_epoch')
 
-    def __new__(cls, elements):
+    def __new__(cls, elements, engine=None):
         if not any(element.chain_fork or element.chain_join for element in cls._flatten(elements)):
             return super(Chain, cls).__new__(cls.chain_types.flat_chain_type)
         return super(Chain, cls).__new__(cls.chain_types.base_chain_type)
 
-    def __init__(self, elements):
+    def __init__(self, elements, engine=None):
         super(Chain, self).__init__(self._flatten(elements))
         if elements:
             self.chain_fork = self._chain_forks(elements)
@@ -50,6 +76,46 @@ class Chain(CompoundLink):
         else:
             self.chain_fork = False
             self.chain_join = False
+        # batches are passed on to elements, so adopt their preference
+        self.chain_batch_size = max([element.chain_batch_size for element in self.elements] or [0])
+        if engine is None:
+            engine = next(
+                (element.engine for element in elements if isinstance(element, Chain) and element.engine != 'lazy'),
+                'lazy'
+            )
+        self.engine = engine
+
+    @property
+    def engine(self):
+        """The name of the execution engine passing data along the elements, see :py:data:`ENGINES`"""
+        return self._engine
+
+    @engine.setter
+    def engine(self, value):
+        if value not in ENGINES:
+            raise ValueError('engine must be one of %s, not %r' % (', '.join(sorted(ENGINES)), value))
+        self._engine = value
+        self._compile_strategies()
+
+    def _compile_strategies(self):
+        """Resolve the send strategy of every element"""
+        self._strategy_epoch = chainsend.strategy_epoch
+        strategy = ENGINES[self._engine]
+        # without data chunks, only joining elements still produce results
+        stops = [True] * len(self.elements)
+        for index in range(len(self.elements) - 1, 0, -1):
+            stops[index - 1] = stops[index] and not self.elements[index].chain_join
+        self._strategies = tuple(
+            (strategy(element), element, stop) for element, stop in zip(self.elements, stops)
+        )
+
+    def __getitem__(self, item):
+        if item.__class__ == slice:
+            return self.__class__(self.elements[item], engine=self._engine)
+        return self.elements[item]
+
+    def __reduce__(self):
+        return self.__class__, (self.elements, self._engine)
 
     @classmethod
     def _flatten(cls, elements):
@@ -110,26 +176,39 @@ class Chain(CompoundLink):
 
     def chainlet_send(self, value=None):
         # traverse breadth first to allow for synchronized forking and joining
+        if self._strategy_epoch != chainsend.strategy_epoch:
+            self._compile_strategies()
         if self.chain_join:
             values = value
         else:
             values = [value]
         try:
-            for element in self.elements:
-                values = lazy_send(element, values)
-                if not values:
+            for strategy, element, stop in self._strategies:
+                values = strategy(element, values)
+                if stop and not values:
                     break
             if self.chain_fork:
                 return list(values)
             else:
-                try:
-                    return next(iter(values))
-                except IndexError:
-                    raise signals.StopTraversal
+                for value in values:
+                    return value
+                return signals.SKIP
         # An element in the chain is exhausted permanently
-        except signals.ChainExit:
+        except signals.ChainExit as err:
+            err.__traceback__ = None
             raise StopIteration
 
+    def chainlet_send_batch(self, values):
+        # a join collects all values derived from a single chunk sent to the chain
+        # a batch can only be traversed stage by stage if there is no such join
+        if any(element.chain_join for element in self.elements[1:]):
+            return super(Chain, self).chainlet_send_batch(values)
+        for element in self.elements:
+            values = element.chainlet_send_batch(values)
+            if not values:
+                break
+        return values
+
     def __repr__(self):
         return ' >> '.join(repr(elem) for elem in self.elements)
 
@@ -137,6 +216,9 @@ class Chain(CompoundLink):
 class FlatChain(Chain):
     """
     A specialised :py:class:`Chain` which never forks or joins internally
+
+    A :py:class:`FlatChain` is compiled to a single function on its first traversal.
+    See :py:meth:`compile` for details.
     """
     chain_join = False
     chain_fork = False
@@ -145,13 +227,136 @@ class FlatChain(Chain):
     __iter__ = ChainLink._iter_flat  # pylint:disable=protected-access
     send = ChainLink._send_flat  # pylint:disable=protected-access
 
-    def chainlet_send(self, value=None):
-        for element in self.elements:
-            # a StopTraversal may be raised here
-            # we do NOT catch it, but let it bubble up instead
-            # whoever catches it can extract a potential early return value
-            value = element.chainlet_send(value)
-        return value
+    def compile(self):
+        """
+        Compile the traversal of all elements to a single function
+
+        :returns: this chain
+        :rtype: :py:class:`FlatChain`
+
+        The compiled functions replace :py:meth:`chainlet_send` and :py:meth:`chainlet_send_batch`
+        of this instance.
+        Runs of :py:class:`~chainlet.funclink.FunctionLink` elements are fused:
+        their functions are called directly, instead of dispatching via each element.
+        Compilation is done implicitly on the first traversal of the chain.
+        It must be repeated explicitly only if elements are modified after that,
+        e.g. by replacing the function of a :py:class:`~chainlet.funclink.FunctionLink`.
+        """
+        self.chainlet_send, self.chainlet_send_batch = _compile_flat_send(self.elements)
+        return self
+
+    def chainlet_send(self, value=None):  # pylint:disable=method-hidden
+        return self.compile().chainlet_send(value)
+
+    def chainlet_send_batch(self, values):  # pylint:disable=method-hidden
+        return self.compile().chainlet_send_batch(values)
+
+
+def _method_function(cls, name):
+    """Get the plain function implementing method ``name`` of ``cls``"""
+    method = getattr(cls, name)
+    return getattr(method, '__func__', method)
+
+
+def _fuse_elements(elements, namespace):
+    """
+    Translate elements to statements, fusing functions where possible
+
+    :param elements: the elements to traverse in order
+    :type elements: iterable[ChainLink]
+    :param namespace: namespace to which any referenced objects are added
+    :type namespace: dict
+    :returns: triples of ``index, element, statement``, with :py:const:`None` as ``element`` if it is fused
+    """
+    # funclink imports the primitives, so we can only fetch it once they are ready
+    from ..funclink import FunctionLink, PartialSlave
+    function_send = _method_function(FunctionLink, 'chainlet_send')
+    neutral_send = _method_function(NeutralLink, 'chainlet_send')
+    for index, element in enumerate(elements):
+        element_send = _method_function(type(element), 'chainlet_send')
+        if element_send is neutral_send:
+            continue
+        elif element_send is function_send:
+            # fuse the function: call it directly without going through the element
+            slave = element.__wrapped__
+            if type(slave) is PartialSlave:
+                namespace['slave_%d' % index] = slave.func
+                arguments = ['value']
+                if slave.args:
+                    namespace['args_%d' % index] = slave.args
+                    arguments.append('*args_%d' % index)
+                if slave.keywords:
+                    namespace['kwargs_%d' % index] = slave.keywords
+                    arguments.append('**kwargs_%d' % index)
+                yield index, None, 'value = slave_%d(%s)' % (index, ', '.join(arguments))
+            else:
+                namespace['slave_%d' % index] = slave
+                yield index, None, 'value = slave_%d(value)' % index
+        else:
+            namespace['send_%d' % index] = element.chainlet_send
+            namespace['batch_%d' % index] = element.chainlet_send_batch
+            yield index, element, 'value = send_%d(value)' % index
+
+
+def _compile_flat_send(elements):
+    """
+    Compile the ``chainlet_send`` and ``chainlet_send_batch`` of a sequence of 1 -> 1 elements
+
+    :param elements: the elements to traverse in order
+    :type elements: iterable[ChainLink]
+    :returns: functions equivalent to passing a value or batch of values through all ``elements``
+    """
+    namespace = {
+        'StopTraversal': signals.StopTraversal, 'CHAIN_EXIT': signals.CHAIN_EXIT, 'SKIP': signals.SKIP,
+        'reset': signals.reset,
+    }
+    # a StopTraversal may be raised by any statement of a single send
+    # we do NOT catch it, but let it bubble up instead
+    send_source, batch_source, fused = [], [], []
+    for index, element, statement in _fuse_elements(elements, namespace):
+        send_source.append(statement)
+        send_source.append('if value is SKIP: return value')
+        if element is None:
+            fused.append(statement)
+        else:
+            batch_source.extend(_batch_fused_source(fused))
+            fused = []
+            batch_source.append('values = batch_%d(values)' % index)
+            batch_source.append('if not values: return values')
+    batch_source.extend(_batch_fused_source(fused))
+    source = 'def chainlet_send(value=None):\n%s\ndef chainlet_send_batch(values):\n%s' % (
+        ''.join('    %s\n' % line for line in send_source + ['return value']),
+        ''.join('    %s\n' % line for line in batch_source + ['return values']),
+    )
+    exec(compile(source, '<compiled FlatChain>', 'exec'), namespace)  # pylint:disable=exec-used
+    # the functions must not refer to themselves via their globals, so that elements are released without cycles
+    return namespace.pop('chainlet_send'), namespace.pop('chainlet_send_batch')
+
+
+def _batch_fused_source(statements):
+    """Source lines to traverse fused ``statements`` for each item of a batch"""
+    if not statements:
+        return []
+    return [
+        'results = []',
+        'for value in values:',
+        '    try:',
+    ] + [
+        line for statement in statements for line in ('        %s' % statement, '        if value is SKIP: continue')
+    ] + [
+        '    except StopTraversal as err:',
+        '        err.__traceback__ = None',
+        '        continue',
+        '    except StopIteration:',
+        '        break',
+        '    results.append(value)',
+        'else:',
+        '    values = results',
+        # raise outside of the handler, so that the signal does not refer to the StopIteration
+        'if values is not results: raise reset(CHAIN_EXIT)',
+        'if not values: return values',
+    ]
+
 
 ChainLink.chain_types.base_chain_type = Chain
 ChainLink.chain_types.flat_chain_type = FlatChain
@@ -31,7 +31,8 @@ class CompoundLink(ChainLink):
 
         Whether the link contains any elements.
     """
-    __slots__ = ('elements',)
+    # elements may be weakly referenced, e.g. by instrumentation
+    __slots__ = ('elements', '__weakref__')
 
     def __init__(self, elements):
         self.elements = tuple(elements)
@@ -58,6 +59,10 @@ class CompoundLink(ChainLink):
     def __hash__(self):
         return hash(self.elements)
 
+    def __reduce__(self):
+        # compound links are fully defined by their elements
+        return self.__class__, (self.elements,)
+
     def chainlet_send(self, value=None):
         raise NotImplementedError
 
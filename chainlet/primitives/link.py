@@ -74,6 +74,18 @@ class ChainLink(object):
        This method should only be called to explicitly traverse elements in a chain.
        Client code should use ``next(link)`` and ``link.send(chunk)`` instead.
 
+    .. method:: link.send_many(chunks)
+
+       Process several data ``chunks`` at once, and return a :py:class:`list` of all results.
+
+    .. method:: link.chainlet_send_batch(chunks)
+
+       Process a :py:class:`list` of data ``chunks`` locally, and return a :py:class:`list` of all results.
+
+       This method implements batch processing in an element; subclasses may
+       overwrite it to amortise the cost of processing each chunk.
+       By default, each chunk is passed to :py:meth:`chainlet_send` individually.
+
     .. method:: link.throw(type[, value[, traceback]])
 
        Raises an exception of ``type`` inside the link. The link may either
@@ -102,9 +114,16 @@ class ChainLink(object):
        at once. That is, the return value is an *iterable* of data chunks,
        each of which should be passed on independently.
 
+    .. py:attribute:: chain_batch_size
+
+       An :py:class:`int` indicating that a `1 -> 1` element prefers to receive
+       batches of up to this many chunks via :py:meth:`chainlet_send_batch`.
+       If it is ``0``, each chunk is passed via :py:meth:`chainlet_send`.
+
     To prematurely stop the traversal of a chain, `1 -> n` and `n -> m` elements should
-    return an empty container. Any `1 -> 1` and `n -> 1` element must raise
-    :py:exc:`StopTraversal`.
+    return an empty container. Any `1 -> 1` and `n -> 1` element must either return
+    :py:data:`~chainlet.signals.SKIP` or raise :py:exc:`StopTraversal`.
+    Returning :py:data:`~chainlet.signals.SKIP` is preferred, as it avoids the cost of exception handling.
 
     .. _Generator-Iterator Methods: https://docs.python.org/3/reference/expressions.html#generator-iterator-methods
     """
@@ -113,6 +132,8 @@ class ChainLink(object):
     chain_join = False
     #: whether this element produces several data chunks at once
     chain_fork = False
+    #: number of data chunks this element prefers to process at once
+    chain_batch_size = 0
     __slots__ = ()
 
     def _link(self, parent, child):
@@ -159,19 +180,26 @@ class ChainLink(object):
     def _iter_flat(self):
         while True:
             try:
-                yield self.chainlet_send(None)
-            except signals.StopTraversal:
+                result = self.chainlet_send(None)
+            except signals.StopTraversal as err:
+                err.__traceback__ = None
                 continue
             except StopIteration:
                 break
+            if result is not signals.SKIP:
+                yield result
 
     def _iter_fork(self):
         while True:
             try:
-                result = list(self.chainlet_send(None))
+                result = self.chainlet_send(None)
+                if result is signals.SKIP:
+                    continue
+                result = list(result)
                 if result:
                     yield result
-            except (StopIteration, signals.ChainExit):
+            except (StopIteration, signals.ChainExit) as err:
+                err.__traceback__ = None
                 break
 
     def __next__(self):
@@ -189,24 +217,60 @@ class ChainLink(object):
 
     def _send_flat(self, value=None):
         try:
-            return self.chainlet_send(value)
-        except signals.StopTraversal:
+            result = self.chainlet_send(value)
+        except signals.StopTraversal as err:
+            err.__traceback__ = None
             return None
+        return None if result is signals.SKIP else result
 
     def _send_fork(self, value=None):
-        return list(self.chainlet_send(value))
+        result = self.chainlet_send(value)
+        return [] if result is signals.SKIP else list(result)
 
     def dispatch(self, values):
         """Dispatch multiple values to this element for processing"""
         for result in lazy_send(self, values):
             yield result
 
+    def send_many(self, values):
+        """Send multiple values to this element for processing, and return all results"""
+        return self.chainlet_send_batch(list(values))
+
     def chainlet_send(self, value=None):
         """Send a value to this element for processing"""
         raise NotImplementedError  # overwrite in subclasses
 
+    def chainlet_send_batch(self, values):
+        """
+        Send multiple values to this element for processing
+
+        :param values: the data chunks to process
+        :type values: list
+        :returns: the data chunks resulting from ``values``
+        :rtype: list
+        :raises ChainExit: if the element is exhausted
+
+        The result is equivalent to ``list(lazy_send(link, values))``.
+        However, compound elements may traverse their elements one batch at a time.
+        This preserves the ordering of data along each branch, but not across forked branches.
+        """
+        return list(lazy_send(self, values))
+
     throw = _throw_method
 
+    def stats(self):
+        """
+        Statistics recorded for this element and its sub-elements
+
+        :rtype: :py:class:`~chainlet.instrument.LinkStats`
+
+        Statistics are only recorded while the element is instrumented.
+        See :py:mod:`chainlet.instrument` for details.
+        """
+        # the instrumentation requires the primitives, so we can only fetch it once they are ready
+        from ..instrument import link_stats
+        return link_stats(self)
+
     def close(self):
         """Close this element, freeing resources and possibly blocking further interactions"""
         pass
@@ -219,4 +283,5 @@ class ChainLink(object):
         return False
 
 
-ChainLink.chain_types.base_link_type = ChainLink
+# all domains share the same base link, so set it for every LinkPrimitives type
+LinkPrimitives.base_link_type = ChainLink
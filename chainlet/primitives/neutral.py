@@ -1,4 +1,5 @@
 from .link import ChainLink
+from .linker import LinkPrimitives
 
 
 class NeutralLink(ChainLink):
@@ -38,4 +39,5 @@ class NeutralLink(ChainLink):
     def __repr__(self):
         return super(NeutralLink, self).__repr__()
 
-ChainLink.chain_types.neutral_link_type = NeutralLink
+# all domains share the same neutral link, so set it for every LinkPrimitives type
+LinkPrimitives.neutral_link_type = NeutralLink
@@ -151,7 +151,7 @@ def filterlet(function=bool, iterable=None):
 def _filterlet(value=None, function=bool):
     if function(value):
         return value
-    raise chainlet.signals.StopTraversal
+    return chainlet.signals.SKIP
 
 
 @genlink.genlet
@@ -9,6 +9,11 @@ class StopTraversal(Exception):
     It may still produce values regularly on future traversal.
     If an element will *never* produce values again, it should raise :py:exc:`ChainExit`.
 
+    Instead of raising :py:exc:`~.StopTraversal`, an element may return :py:data:`SKIP`.
+    This is equivalent, but avoids the cost of raising and handling an exception.
+    If an exception is preferred, raising the shared :py:data:`STOP_TRAVERSAL`
+    at least avoids creating a new exception each time.
+
     :note: This signal explicitly affects the current chain only. It does not
            affect other, parallel chains of a graph.
 
@@ -24,3 +29,49 @@ class ChainExit(Exception):
     Terminate the traversal of a chain
     """
     pass
+
+
+#: Shared instance of :py:exc:`StopTraversal`
+#:
+#: Raising the shared instance avoids creating a new exception for every stopped traversal.
+#: Primitives catching it clear its ``__traceback__``, so that it does not accumulate frames.
+STOP_TRAVERSAL = StopTraversal()
+#: Shared instance of :py:exc:`ChainExit`, used by primitives when an element is exhausted
+CHAIN_EXIT = ChainExit()
+
+
+def reset(signal):
+    """
+    Prepare a shared ``signal`` for raising again
+
+    Clears any traceback and previous exception of ``signal``, so that it does not keep them alive.
+    Primitives raise a shared signal only outside of exception handlers;
+    otherwise, the signal would refer to the handled exception again.
+
+    :param signal: the shared signal to raise, such as :py:data:`CHAIN_EXIT`
+    :type signal: BaseException
+    :return: ``signal`` itself
+    """
+    signal.__traceback__ = signal.__context__ = signal.__cause__ = None
+    return signal
+
+
+class _Skip(object):
+    """Type of the :py:data:`SKIP` sentinel"""
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'SKIP'
+
+    def __reduce__(self):
+        # the sentinel is compared by identity, so it must survive pickling
+        return 'SKIP'
+
+
+#: Sentinel returned by an element to stop the traversal of the current value
+#:
+#: Returning :py:data:`SKIP` from :py:meth:`~.ChainLink.chainlet_send` is equivalent to
+#: raising :py:exc:`~.StopTraversal`, but does not allocate an exception.
+#: Chains pass on :py:data:`SKIP` instead of raising :py:exc:`~.StopTraversal`,
+#: and clients such as :py:meth:`~.ChainLink.send` never receive it.
+SKIP = _Skip()
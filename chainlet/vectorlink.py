@@ -0,0 +1,152 @@
+"""
+Helpers for creating ChainLinks from vectorised functions
+
+Tools of this module allow processing many data chunks with a single call
+to a function operating on :py:mod:`numpy` arrays.
+The interface to other `chainlet` objects is automatically built around the functions.
+In a chain, data chunks are gathered into arrays, passed to the function, and
+the resulting array is split into individual data chunks again.
+
+A vectorised function can be directly used by wrapping :py:class:`VectorLink`
+around it:
+
+.. code:: python
+
+    import numpy
+    from mylib import producer, consumer
+
+    def log_scale(values, base=10):
+        return numpy.log(values) / numpy.log(base)
+
+    producer >> VectorLink(log_scale, 2) >> consumer
+
+If a function is used only as a chainlet, one may permanently convert it by
+applying a decorator:
+
+.. code:: python
+
+    @vectorlet(batch_size=4096)
+    def log_scale(values, base=10):
+        # ...
+
+    producer >> log_scale(2) >> consumer
+
+:note: This module requires :py:mod:`numpy` to be installed.
+"""
+from __future__ import division, absolute_import
+import itertools
+
+import numpy
+
+from .funclink import FunctionLink
+from . import signals
+
+#: default maximum number of chunks passed to a vectorised function at once
+DEFAULT_BATCH_SIZE = 1024
+
+
+class VectorLink(FunctionLink):
+    """
+    Wrapper making a vectorised function act like a ChainLink
+
+    :param slave: the function to wrap
+    :param args: positional arguments for the slave
+    :param kwargs: keyword arguments for the slave
+    :param batch_size: maximum number of chunks passed to ``slave`` at once
+    :type batch_size: int
+    :param mask: whether ``slave`` returns a mask selecting chunks to pass on
+    :type mask: bool
+    :param dtype: data type of the array passed to ``slave``
+
+    :note: Use the :py:func:`~.vectorlet` function if you wish to decorate a
+           function to produce VectorLinks.
+
+    This class wraps a function (or other callable), calling it to perform work
+    on an :py:class:`numpy.ndarray` of :term:`data chunks <data chunk>`.
+    The ``slave`` should take an array of chunks as its first parameter,
+    and return an array with one result per chunk.
+    When used in a chain, chunks are passed to ``slave`` in batches of up to ``batch_size`` chunks.
+
+    If ``mask`` is set, ``slave`` acts as a filter:
+    it must return a boolean array, and only chunks for which it is :py:const:`True`
+    are passed on unchanged.
+    This replaces raising :py:exc:`~.StopTraversal` for each rejected chunk.
+
+    The keywords ``batch_size``, ``mask`` and ``dtype`` are consumed by the :py:class:`VectorLink`.
+    They are not passed on to ``slave``.
+    """
+    def __init__(self, slave, *args, **kwargs):
+        self.chain_batch_size = kwargs.pop('batch_size', DEFAULT_BATCH_SIZE)
+        self.mask = kwargs.pop('mask', False)
+        self.dtype = kwargs.pop('dtype', None)
+        if self.chain_batch_size < 1:
+            raise ValueError('batch_size must be positive')
+        super(VectorLink, self).__init__(slave, *args, **kwargs)
+
+    def __getstate__(self):
+        state = super(VectorLink, self).__getstate__()
+        state.update(chain_batch_size=self.chain_batch_size, mask=self.mask, dtype=self.dtype)
+        return state
+
+    def chainlet_send(self, value=None):
+        """Send a value to this element"""
+        results = self.chainlet_send_batch([value])
+        if results:
+            return results[0]
+        return signals.SKIP
+
+    def chainlet_send_batch(self, values):
+        """Send multiple values to this element"""
+        slave, batch_size, results = self.__wrapped__, self.chain_batch_size, []
+        for start in range(0, len(values), batch_size):
+            batch = values[start:start + batch_size]
+            batch_result = slave(numpy.asarray(batch, dtype=self.dtype))
+            if len(batch_result) != len(batch):
+                raise ValueError(
+                    'vectorised function must return one result per chunk (expected %d, got %d)' % (
+                        len(batch), len(batch_result)
+                    ))
+            if self.mask:
+                results.extend(itertools.compress(batch, batch_result))
+            else:
+                results.extend(batch_result)
+        return results
+
+
+def vectorlet(function=None, batch_size=DEFAULT_BATCH_SIZE, mask=False, dtype=None):
+    """
+    Convert a vectorised function to a :py:class:`~chainlink.ChainLink`
+
+    :param function: the function to convert
+    :param batch_size: maximum number of chunks passed to ``function`` at once
+    :type batch_size: int
+    :param mask: whether ``function`` returns a mask selecting chunks to pass on
+    :type mask: bool
+    :param dtype: data type of the array passed to ``function``
+
+    When used as a decorator, this function can also be called with and without keywords.
+
+    .. code:: python
+
+        @vectorlet
+        def square(values):
+            "Convert every data chunk to its numerical square"
+            return values ** 2
+
+        @vectorlet(mask=True)
+        def positive(values):
+            "Pass on only positive data chunks"
+            return values > 0
+
+    The :term:`data chunks <data chunk>` are passed anonymously as a :py:class:`numpy.ndarray`
+    in the first positional parameter.
+    In other words, the wrapped function should have the signature:
+
+    .. py:function:: .slave(values, *args, **kwargs)
+
+    See :py:class:`~.VectorLink` for details.
+    """
+    wraplet = VectorLink.wraplet(batch_size=batch_size, mask=mask, dtype=dtype)
+    if function is None:
+        return wraplet
+    return wraplet(function)
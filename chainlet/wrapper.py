@@ -63,6 +63,11 @@ class WrapperMixin(object):
             if hasattr(self, attr)
         )
 
+    def __setstate__(self, state):
+        # __wrapped__ is a slot, which is not restored via __dict__
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
     def __repr__(self):
         return '<%s wrapper %s.%s at %x>' % (
             self.__class__.__name__, self.__wrapped__.__module__,
@@ -0,0 +1,82 @@
+from __future__ import absolute_import
+import unittest
+import tempfile
+import shutil
+import json
+import os
+import contextlib
+import io
+import sys
+
+from chainlet import bench
+from chainlet.bench import cases
+from chainlet.bench import __main__ as bench_main
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_cases(self):
+        """Run each benchmark briefly"""
+        for benchmark in cases.benchmarks():
+            with self.subTest(benchmark=benchmark):
+                result = benchmark.run(chunks=20, repeat=1)
+                self.assertEqual(result['chunks'], 20)
+                self.assertGreater(result['chunks_per_second'], 0)
+                self.assertLessEqual(result['latency_median'], result['latency_p99'])
+
+    def test_unique(self):
+        names = [benchmark.name for benchmark in cases.benchmarks()]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_compare(self):
+        baseline = {'results': {'fast': {'chunks_per_second': 100.0, 'latency_median': 1.0}}}
+        for throughput, latency, regressed in (
+                (100.0, 1.0, []),
+                (90.0, 1.1, []),
+                (50.0, 1.0, ['chunks_per_second']),
+                (100.0, 2.0, ['latency_median']),
+                (50.0, 2.0, ['chunks_per_second', 'latency_median']),
+        ):
+            with self.subTest(throughput=throughput, latency=latency):
+                results = {'results': {
+                    'fast': {'chunks_per_second': throughput, 'latency_median': latency},
+                    'new': {'chunks_per_second': 1.0, 'latency_median': 100.0},
+                }}
+                regressions = bench.compare(results, baseline, tolerance=0.2)
+                self.assertEqual([regression[1] for regression in regressions], regressed)
+                for regression in regressions:
+                    self.assertEqual(regression[0], 'fast')
+
+
+@unittest.skipIf(sys.version_info < (3, 4), 'requires contextlib.redirect_stdout')
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir)
+
+    def _main(self, *args):
+        with contextlib.redirect_stdout(io.StringIO()) as stdout, contextlib.redirect_stderr(io.StringIO()):
+            exit_code = bench_main.main(list(args))
+        return exit_code, stdout.getvalue()
+
+    def test_list(self):
+        exit_code, output = self._main('--list', 'Bundle*')
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output.split(), ['Bundle[fanout=%d]' % fanout for fanout in cases.FANOUTS])
+
+    def test_baseline(self):
+        output = os.path.join(self.workdir, 'results.json')
+        exit_code, _ = self._main('-n', '20', '-r', '1', '-o', output, 'FlatChain*')
+        self.assertEqual(exit_code, 0)
+        with open(output) as results_file:
+            results = json.load(results_file)
+        self.assertEqual(
+            sorted(results['results']), sorted('FlatChain[length=%d]' % length for length in cases.LENGTHS)
+        )
+        self.assertEqual(self._main('-n', '20', '-r', '1', '-b', output, '-t', '1E6', 'FlatChain*')[0], 0)
+        for result in results['results'].values():
+            result['chunks_per_second'] *= 1E6
+        with open(output, 'w') as results_file:
+            json.dump(results, results_file)
+        self.assertEqual(self._main('-n', '20', '-r', '1', '-b', output, 'FlatChain*')[0], 1)
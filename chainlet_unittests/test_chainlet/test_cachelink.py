@@ -0,0 +1,148 @@
+from __future__ import absolute_import, division
+import unittest
+import copy
+import threading
+import time
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+import chainlet
+import chainlet.concurrency
+from chainlet.cachelink import CachedLink, LinkCache, cachedlet
+
+from chainlet_unittests.utility import Adder
+
+
+class CallCounter(object):
+    """Callable recording the chunks passed to it"""
+    def __init__(self, slave):
+        self.slave = slave
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, value, *args, **kwargs):
+        with self._lock:
+            self.calls.append(value)
+        return self.slave(value, *args, **kwargs)
+
+
+@cachedlet(maxsize=None)
+def scale(value, factor=2):
+    return value * factor
+
+
+def odd(value):
+    if value % 2:
+        return value
+    raise chainlet.StopTraversal
+
+
+class TestCachedLink(unittest.TestCase):
+    def test_send(self):
+        """CachedLink: cache results of individual values"""
+        counter = CallCounter(lambda value, offset: value + offset)
+        link = CachedLink(counter, 3)
+        for value in (1, 2, 1, 2, 3, 1):
+            self.assertEqual(link.send(value), value + 3)
+        self.assertEqual(counter.calls, [1, 2, 3])
+        self.assertEqual((link.cache.hits, link.cache.misses, len(link.cache)), (3, 3, 3))
+        self.assertTrue(repr(link.cache))
+        link.cache.clear()
+        self.assertEqual((link.cache.hits, link.cache.misses, len(link.cache)), (0, 0, 0))
+
+    def test_stop_traversal(self):
+        """CachedLink: cache stopped traversal"""
+        counter = CallCounter(odd)
+        link = CachedLink(counter)
+        for value in (1, 2, 1, 2, 3):
+            self.assertEqual(link.send(value), None if value == 2 else value)
+        self.assertEqual(counter.calls, [1, 2, 3])
+        self.assertEqual(list(link.dispatch([1, 2, 3, 4, 4])), [1, 3])
+        self.assertEqual(link.send_many([1, 2, 3, 4, 5]), [1, 3, 5])
+        self.assertEqual(counter.calls, [1, 2, 3, 4, 5])
+        chain = Adder(1) >> link >> Adder(-1)
+        self.assertEqual(list(chain.dispatch(range(6))), [0, 2, 4])
+
+    def test_unhashable(self):
+        """CachedLink: pass on unhashable values"""
+        counter = CallCounter(lambda value: value)
+        link = CachedLink(counter)
+        for value in ([1], [1], {2: 3}):
+            self.assertEqual(link.send(value), value)
+        self.assertEqual(len(counter.calls), 3)
+        self.assertEqual(len(link.cache), 0)
+
+    def test_lru(self):
+        """CachedLink: evict the least recently used results"""
+        counter = CallCounter(lambda value: value)
+        link = CachedLink(counter, maxsize=2)
+        for value in (1, 2, 1, 3, 1, 2):
+            link.send(value)
+        # 2 is evicted by 3, then 3 by 2
+        self.assertEqual(counter.calls, [1, 2, 3, 2])
+        self.assertEqual(len(link.cache), 2)
+
+    def test_ttl(self):
+        """CachedLink: expire results"""
+        counter = CallCounter(lambda value: value)
+        link = CachedLink(counter, ttl=0.05)
+        link.send(1)
+        link.send(1)
+        time.sleep(0.1)
+        link.send(1)
+        self.assertEqual(counter.calls, [1, 1])
+
+    def test_wraplet(self):
+        """CachedLink: share cache of decorated functions, including their arguments"""
+        double, triple = scale(), scale(factor=3)
+        self.assertIs(double.cache, triple.cache)
+        double.cache.clear()
+        self.assertEqual([double.send(4), triple.send(4), scale(factor=3).send(4)], [8, 12, 12])
+        self.assertEqual((double.cache.hits, double.cache.misses), (1, 2))
+
+    def test_shared_cache(self):
+        """CachedLink: separate results of different functions sharing a cache"""
+        cache = LinkCache()
+        double, negate = CachedLink(lambda value: value * 2, cache=cache), CachedLink(lambda value: -value, cache=cache)
+        self.assertEqual([double.send(3), negate.send(3), double.send(3), negate.send(3)], [6, -3, 6, -3])
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_typed(self):
+        """CachedLink: cache results of equal values of different types separately"""
+        counter = CallCounter(lambda value, offset: value + offset)
+        untyped, typed = CachedLink(counter, 1), CachedLink(counter, 1, typed=True)
+        self.assertEqual([type(untyped.send(value)) for value in (1, 1.0, True)], [int, int, int])
+        self.assertEqual(counter.calls, [1])
+        self.assertEqual([type(typed.send(value)) for value in (1, 1.0, True)] * 2, [int, float, int] * 2)
+        self.assertEqual(counter.calls, [1, 1, 1.0, True])
+        # arguments are typed as well
+        self.assertEqual(type(CachedLink(counter, 1.0, typed=True, cache=typed.cache).send(1)), float)
+
+    def test_threads(self):
+        """CachedLink: use in threads"""
+        counter = CallCounter(lambda value: value * 2)
+        link = CachedLink(counter, thread_safe=True)
+        chain = chainlet.concurrency.threads(Adder(0) >> link)
+        values = list(range(50)) * 4
+        self.assertEqual(list(chain.dispatch(values)), [value * 2 for value in values])
+        self.assertEqual(link.cache.hits + link.cache.misses, len(values))
+        self.assertEqual(sorted(set(counter.calls)), list(range(50)))
+
+    def test_pickle_copy(self):
+        """CachedLink: copy, deepcopy and pickle"""
+        link = scale(4)
+        link.send(2)
+        for clone in (copy.copy(link), copy.deepcopy(link), pickle.loads(pickle.dumps(link))):
+            self.assertEqual(clone.send(2), 8)
+        clone = pickle.loads(pickle.dumps(CachedLink(abs, maxsize=12, ttl=3, thread_safe=True, typed=True)))
+        self.assertEqual((clone.cache.maxsize, clone.cache.ttl, clone.cache.thread_safe), (12, 3, True))
+        self.assertTrue(clone.typed)
+        self.assertEqual(len(clone.cache), 0)
+
+    def test_options(self):
+        """CachedLink: reject invalid options"""
+        for options in ({'maxsize': 0}, {'ttl': 0}):
+            with self.subTest(options=options), self.assertRaises(ValueError):
+                LinkCache(**options)
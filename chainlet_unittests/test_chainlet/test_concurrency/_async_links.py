@@ -0,0 +1,25 @@
+"""Coroutine links for testing, separate from tests as they require Python 3.5"""
+import asyncio
+
+import chainlet.signals
+from chainlet.concurrency.asyncio import asynclet
+
+
+@asynclet
+async def async_sleep(value, seconds):
+    await asyncio.sleep(seconds)
+    return value
+
+
+@asynclet
+async def async_add(value, summand=1):
+    await asyncio.sleep(0)
+    return value + summand
+
+
+@asynclet
+async def async_odd(value):
+    await asyncio.sleep(0)
+    if value % 2:
+        return value
+    raise chainlet.signals.StopTraversal
@@ -0,0 +1,100 @@
+import itertools
+import unittest
+import time
+
+import chainlet
+from chainlet.dataflow import MergeLink
+from chainlet.concurrency import threads
+
+from chainlet_unittests.utility import Adder
+
+from . import testbase_primitives
+
+try:
+    import chainlet.concurrency.asyncio
+    from ._async_links import async_sleep, async_add, async_odd
+except (ImportError, SyntaxError):
+    raise unittest.SkipTest('requires asyncio with async/await syntax')
+
+
+class AsyncBundle(testbase_primitives.PrimitiveTestCases.ConcurrentBundle):
+    bundle_type = chainlet.concurrency.asyncio.AsyncBundle
+    converter = staticmethod(chainlet.concurrency.asyncio.convert)
+    # regular links run inside the event loop and block each other
+    test_concurrent = None
+    test_convert_concurrent = None
+
+
+class AsyncChain(testbase_primitives.PrimitiveTestCases.ConcurrentChain):
+    chain_type = chainlet.concurrency.asyncio.AsyncChain
+    converter = staticmethod(chainlet.concurrency.asyncio.convert)
+    # regular links run inside the event loop and block each other
+    test_concurrent = None
+    test_convert_concurrent = None
+    # joined input is fetched before scheduling coroutines
+    test_max_inflight = None
+    test_max_inflight_results = None
+
+
+class AsyncFunctionLink(unittest.TestCase):
+    def test_send(self):
+        """send to asynclet without event loop"""
+        for summand in (0, 1, -12, 1E6):
+            link = async_add(summand)
+            for value in (0, 1, -12, 1E6):
+                self.assertEqual(link.send(value), value + summand)
+        self.assertIsNone(async_odd().send(2))
+        self.assertEqual(list(async_odd().dispatch(range(10))), [1, 3, 5, 7, 9])
+        self.assertEqual(async_add(2).send_many(range(5)), [2, 3, 4, 5, 6])
+
+    def test_regular_chain(self):
+        """asynclet in regular chain as `a >> async >> b`"""
+        chain = Adder(1) >> async_add(2) >> async_odd() >> Adder(-3)
+        self.assertEqual(list(chain.dispatch(range(10))), [0, 2, 4, 6, 8])
+
+
+class AsyncConcurrency(unittest.TestCase):
+    def test_concurrent(self):
+        """concurrent async sleep as `coroutines(a >> sleep >> sleep)`"""
+        chain = chainlet.concurrency.asyncio.convert(Adder(1) >> async_sleep(0.1) >> async_sleep(0.1))
+        start_time = time.time()
+        result = list(chain.dispatch(range(200)))
+        end_time = time.time()
+        self.assertEqual(result, list(range(1, 201)))
+        self.assertLess(end_time - start_time, 1)
+
+    def test_concurrent_bundle(self):
+        """concurrent async sleep as `coroutines((sleep, sleep, ...))`"""
+        chain = Adder(1) >> chainlet.concurrency.asyncio.convert([async_sleep(0.1) for _ in range(50)])
+        start_time = time.time()
+        result = chain.send(1)
+        end_time = time.time()
+        self.assertEqual(result, [2] * 50)
+        self.assertLess(end_time - start_time, 1)
+
+    def test_max_inflight(self):
+        """bounded async sleep as `coroutines(a >> sleep, max_inflight=n)`"""
+        chain = chainlet.concurrency.asyncio.convert(Adder(1) >> async_sleep(0.1), max_inflight=5)
+        start_time = time.time()
+        result = list(chain.dispatch(range(10)))
+        end_time = time.time()
+        self.assertEqual(result, list(range(1, 11)))
+        self.assertGreater(end_time - start_time, 0.2)
+        self.assertLess(end_time - start_time, 0.5)
+
+    def test_mixed(self):
+        """mixed chains as `coroutines(a >> async >> (b, async >> c) >> join >> d)`"""
+        # concurrent chains always join, so compare against another concurrency domain
+        elements = [Adder(2), async_add(), async_odd()]
+        for chain in itertools.product(elements, repeat=4):
+            with self.subTest(chain=chain):
+                a, b, c, d = chain
+                values = list(range(-5, 15))
+                reference = threads(a >> b >> (c, b >> c) >> MergeLink() >> d)
+                converted = chainlet.concurrency.asyncio.convert(a >> b >> (c, b >> c) >> MergeLink() >> d)
+                self.assertEqual(list(converted.dispatch(values)), list(reference.dispatch(values)))
+                reference = threads(a >> (b >> c, d))
+                converted = chainlet.concurrency.asyncio.convert(a >> (b >> c, d))
+                self.assertEqual(
+                    sorted(converted.dispatch(values)), sorted(reference.dispatch(values))
+                )
@@ -1,7 +1,12 @@
 from __future__ import absolute_import, division
 import unittest
+import threading
+import time
 
-from chainlet.concurrency import base
+from chainlet.concurrency import base, threads
+from chainlet.dataflow import NoOp
+
+from chainlet_unittests.utility import Adder
 
 from . import testbase_primitives
 
@@ -35,8 +40,60 @@ class TestMultiIter(unittest.TestCase):
         iterable = base.FutureChainResults([base.StoredFuture(lambda itr: [next(itr)], value_iter) for _ in range(len(values))])
         self._test_multi_tee(iterable, values)
 
-    def _test_multi_tee(self, iterable, values):
-        iters = list(base.multi_iter(iterable, count=4))
+    def test_high_water(self):
+        """multi iter bounded by a high water mark"""
+        values = tuple(range(2000))
+        for high_water in (1, 16, None):
+            with self.subTest(high_water=high_water, case='interleaved'):
+                # iterators in the same thread may never block each other
+                iterable = (val for val in values[:20])
+                self._test_multi_tee(iterable, values[:20], high_water=high_water)
+            with self.subTest(high_water=high_water, case='threaded'):
+                tee = base.RingTee((val for val in values), n=2, high_water=high_water)
+                fast, slow = iter(tee), iter(tee)
+                results, buffered = {}, []
+
+                def consume_slow():
+                    results['slow'] = [val for val in slow if time.sleep(0.0001) is None]
+
+                def consume_fast():
+                    results['fast'] = []
+                    for val in fast:
+                        results['fast'].append(val)
+                        buffered.append(len(tee._buffer))
+                threads = [threading.Thread(target=consume_slow), threading.Thread(target=consume_fast)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                self.assertEqual(results['fast'], list(values))
+                self.assertEqual(results['slow'], list(values))
+                if high_water is not None:
+                    # items are only discarded in batches
+                    self.assertLessEqual(max(buffered), 2 * max(high_water, 64) + 1)
+
+    def test_tee_misuse(self):
+        """multi iter errors in source and iteration"""
+        tee = base.RingTee(iter(range(3)), n=1)
+        self.assertEqual(list(tee), [0, 1, 2])
+        with self.assertRaises(ValueError):
+            iter(tee)
+        with self.assertRaises(ValueError):
+            base.RingTee(iter(range(3)), high_water=0)
+
+        def broken():
+            yield 1
+            raise KeyError
+        a, b = base.multi_iter(broken(), count=2)
+        self.assertEqual(next(a), 1)
+        with self.assertRaises(KeyError):
+            next(a)
+        self.assertEqual(next(b), 1)
+        with self.assertRaises(KeyError):
+            next(b)
+
+    def _test_multi_tee(self, iterable, values, high_water=base.TEE_HIGH_WATER):
+        iters = list(base.multi_iter(iterable, count=4, high_water=high_water))
         self.assertEqual(len(iters), 4)
         a, b, c, d = iters
         # test single iteration
@@ -78,12 +135,125 @@ class TestFutureChainResults(unittest.TestCase):
                     list(d)
 
 
+class TestLightFuture(unittest.TestCase):
+    def test_realise(self):
+        """realise light future once"""
+        calls = []
+
+        def call(value):
+            calls.append(value)
+            return [value]
+        future = base.LightFuture(call, 2)
+        self.assertTrue(future.realise())
+        self.assertTrue(future.realise())
+        self.assertEqual(future.result, [2])
+        self.assertEqual(calls, [2])
+        future = base.LightFuture(raise_stored, KeyError)
+        with self.assertRaises(KeyError):
+            future.result
+
+    def test_contended(self):
+        """await light future realised by other thread"""
+        for _ in range(20):
+            started, release = threading.Event(), threading.Event()
+
+            def call():
+                started.set()
+                release.wait()
+                return [1]
+            future = base.LightFuture(call)
+            worker = threading.Thread(target=future.realise)
+            worker.start()
+            started.wait()
+            self.assertFalse(future.realise())
+            waiter = threading.Thread(target=future.await_result)
+            waiter.start()
+            release.set()
+            self.assertEqual(future.result, [1])
+            worker.join(), waiter.join()
+
+
+class TestFutureChainIterator(unittest.TestCase):
+    def test_iter(self):
+        """single iteration of future chain iterator"""
+        values = base.FutureChainIterator([base.LightFuture(return_stored, [1, 2]), base.LightFuture(return_stored, [3])])
+        self.assertEqual(list(values), [1, 2, 3])
+        with self.assertRaises(RuntimeError):
+            list(values)
+
+    def test_exception(self):
+        """exception in future chain iterator"""
+        values = base.FutureChainIterator([
+            base.LightFuture(return_stored, [1, 2]),
+            base.LightFuture(raise_stored, KeyError),
+            base.LightFuture(return_stored, [3])
+        ])
+        iterator = iter(values)
+        self.assertEqual((next(iterator), next(iterator)), (1, 2))
+        with self.assertRaises(KeyError):
+            next(iterator)
+
+
 # non-concurrent primitives
 class NonConcurrentBundle(testbase_primitives.PrimitiveTestCases.ConcurrentBundle):
     test_concurrent = None
 
+    def test_read_only(self):
+        """shared fan-out passes buffers without copies"""
+        payload = b'chainlet' * 64
+        self.assertTrue(all(
+            result is payload for result in self.bundle_type((NoOp(), NoOp()), fanout='shared').send(payload)
+        ))
+        for chunk in (bytearray(payload), memoryview(bytearray(payload))):
+            with self.subTest(chunk=type(chunk)):
+                results = self.bundle_type((NoOp(), NoOp()), fanout='shared').send(chunk)
+                for result in results:
+                    self.assertIsInstance(result, memoryview)
+                    self.assertEqual(result.tobytes(), payload)
+                    # python < 3.8 cannot provide read-only views without copying
+                    if hasattr(memoryview, 'toreadonly'):
+                        self.assertTrue(result.readonly)
+                        with self.assertRaises(TypeError):
+                            result[0] = 0
+
 
 # dummy-concurrent primitives
 class LocalBundle(testbase_primitives.PrimitiveTestCases.ConcurrentBundle):
     test_concurrent = None
     bundle_type = base.ConcurrentBundle
+
+
+class CountingExecutor(base.LocalExecutor):
+    __slots__ = ('submitted',)
+
+    def __init__(self, max_workers, identifier=''):
+        super(CountingExecutor, self).__init__(max_workers, identifier)
+        self.submitted = 0
+
+    def submit(self, call, *args, **kwargs):
+        self.submitted += 1
+        return base.StoredFuture(call, *args, **kwargs)
+
+
+class TestChunkSize(unittest.TestCase):
+    def _count_futures(self, values, chunk_size, max_workers=4, sized=True):
+        executor = CountingExecutor(max_workers)
+        chain = threads(Adder(1) >> Adder(2), executor=executor, chunk_size=chunk_size)
+        results = list(chain.dispatch(values if sized else iter(values)))
+        self.assertEqual(results, [value + 3 for value in values])
+        return executor.submitted
+
+    def test_fixed(self):
+        """fixed chunk size"""
+        for chunk_size, futures in ((None, 100), (1, 100), (3, 34), (10, 10), (200, 1)):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self._count_futures(list(range(100)), chunk_size), futures)
+
+    def test_auto(self):
+        """automatic chunk size"""
+        # sized input is split into four chunks per worker
+        self.assertEqual(self._count_futures(list(range(100)), 'auto', max_workers=4), 15)
+        self.assertEqual(self._count_futures(list(range(3)), 'auto', max_workers=4), 3)
+        # unsized input is split into growing chunks
+        self.assertEqual(self._count_futures(list(range(15)), 'auto', sized=False), 4)
+        self.assertEqual(self._count_futures(list(range(16)), 'auto', sized=False), 5)
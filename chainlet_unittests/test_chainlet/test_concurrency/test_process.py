@@ -0,0 +1,104 @@
+import unittest
+import gc
+
+import chainlet
+import chainlet.concurrency.process
+from chainlet.dataflow import MergeLink
+
+from chainlet_unittests.utility import Adder
+
+from . import testbase_primitives
+
+# the default executor only uses as many processes as there are CPUs
+MULTI_EXECUTOR = chainlet.concurrency.process.ProcessPoolExecutor(5, 'chainlet_unittest_process')
+
+
+class CountPickle(chainlet.ChainLink):
+    """Link counting how often it has been pickled"""
+    pickled = 0
+
+    def __getstate__(self):
+        CountPickle.pickled += 1
+        return {}
+
+    def chainlet_send(self, value=None):
+        return value
+
+
+@chainlet.funclet
+def fail(value):
+    raise KeyError(value)
+
+
+class MultiProcessLinkPrimitives(chainlet.concurrency.process.ProcessLinkPrimitives):
+    pass
+
+
+class MultiProcessBundle(chainlet.concurrency.process.ProcessBundle):
+    chain_types = MultiProcessLinkPrimitives()
+    executor = MULTI_EXECUTOR
+
+
+class MultiProcessChain(chainlet.concurrency.process.ProcessChain):
+    chain_types = MultiProcessLinkPrimitives()
+    executor = MULTI_EXECUTOR
+
+
+MultiProcessLinkPrimitives.base_bundle_type = MultiProcessBundle
+MultiProcessLinkPrimitives.base_chain_type = MultiProcessChain
+MultiProcessLinkPrimitives.flat_chain_type = MultiProcessChain
+
+
+class ProcessBundle(testbase_primitives.PrimitiveTestCases.ConcurrentBundle):
+    bundle_type = MultiProcessBundle
+    # converted bundles use the default executor, which may not be concurrent
+    test_convert_concurrent = None
+
+
+class ProcessChain(testbase_primitives.PrimitiveTestCases.ConcurrentChain):
+    chain_type = MultiProcessChain
+    test_convert_concurrent = None
+
+
+class ProcessConvert(unittest.TestCase):
+    def test_convert(self):
+        """convert regular chains to processes"""
+        chain = chainlet.concurrency.process.convert(Adder(1) >> Adder(2))
+        self.assertIsInstance(chain, chainlet.concurrency.process.ProcessChain)
+        self.assertEqual(list(chain.dispatch(range(5))), list(range(3, 8)))
+        bundle = chainlet.concurrency.process.convert((Adder(1), Adder(2)))
+        self.assertIsInstance(bundle, chainlet.concurrency.process.ProcessBundle)
+        self.assertEqual(bundle.send(1), [2, 3])
+        chain = Adder(1) >> chainlet.concurrency.process.convert((Adder(1), Adder(2))) >> MergeLink()
+        self.assertEqual(chain.send(1), 7)
+
+    def test_stash(self):
+        """stripes are pickled once for all workers"""
+        CountPickle.pickled = 0
+
+        chain = MultiProcessChain((CountPickle(), Adder(1)))
+        self.assertEqual(list(chain.dispatch(range(10))), list(range(1, 11)))
+        self.assertEqual(list(chain.dispatch(range(10))), list(range(1, 11)))
+        self.assertEqual(CountPickle.pickled, 1)
+
+    def test_release(self):
+        """stripes are released by all workers once they are garbage collected"""
+        executor = chainlet.concurrency.process.ProcessPoolExecutor(2, 'chainlet_unittest_release')
+        chain = chainlet.concurrency.process.ProcessChain((Adder(1),), executor=executor)
+        self.assertEqual(list(chain.dispatch(range(10))), list(range(1, 11)))
+        stash = executor._stash  # pylint:disable=protected-access
+        self.assertTrue(stash)
+        del chain
+        gc.collect()
+        self.assertFalse(stash)
+        chain = chainlet.concurrency.process.ProcessChain((Adder(2),), executor=executor)
+        self.assertEqual(list(chain.dispatch(range(10))), list(range(2, 12)))
+        self.assertEqual(len(stash), 1)
+        for worker in executor._workers:  # pylint:disable=protected-access
+            self.assertLessEqual(worker.stashed, set(key for _, key, _ in stash.values()))
+
+    def test_exception(self):
+        """exceptions in workers are raised by the chain"""
+        chain = chainlet.concurrency.process.convert(Adder(1) >> fail())
+        with self.assertRaises(KeyError):
+            list(chain.dispatch(range(5)))
@@ -1,4 +1,21 @@
+import unittest
+import threading
+import time
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import chainlet
+import chainlet.concurrency.base
 import chainlet.concurrency.thread
+from chainlet.dataflow import MergeLink, forklet
+
+from chainlet_unittests.utility import Adder
 
 from . import testbase_primitives
 
@@ -11,3 +28,240 @@ class ThreadedBundle(testbase_primitives.PrimitiveTestCases.ConcurrentBundle):
 class ThreadedChain(testbase_primitives.PrimitiveTestCases.ConcurrentChain):
     chain_type = chainlet.concurrency.thread.ThreadChain
     converter = staticmethod(chainlet.concurrency.thread.convert)
+
+
+STEALING_EXECUTOR = chainlet.concurrency.thread.WorkStealingExecutor(8, 'chainlet_unittest_stealing')
+
+
+class StealingLinkPrimitives(chainlet.concurrency.thread.ThreadLinkPrimitives):
+    pass
+
+
+class StealingBundle(chainlet.concurrency.thread.ThreadBundle):
+    chain_types = StealingLinkPrimitives()
+    executor = STEALING_EXECUTOR
+
+
+class StealingChain(chainlet.concurrency.thread.ThreadChain):
+    chain_types = StealingLinkPrimitives()
+    executor = STEALING_EXECUTOR
+
+
+StealingLinkPrimitives.base_bundle_type = StealingBundle
+StealingLinkPrimitives.base_chain_type = StealingChain
+StealingLinkPrimitives.flat_chain_type = StealingChain
+
+
+class WorkStealingBundle(testbase_primitives.PrimitiveTestCases.ConcurrentBundle):
+    bundle_type = StealingBundle
+
+
+class WorkStealingChain(testbase_primitives.PrimitiveTestCases.ConcurrentChain):
+    chain_type = StealingChain
+
+
+def log_worker(log, owner, delay):
+    time.sleep(delay)
+    log.put((threading.current_thread().name, owner))
+
+
+def submit_local(executor, log, count, delay, barrier):
+    """Submit futures from a worker, and check that they are in its own queue only"""
+    owner = threading.current_thread().name
+    futures = [executor.submit(log_worker, log, owner, delay) for _ in range(count)]
+    own_queue = executor._local.queue
+    local = all(future in own_queue for future in futures) and not any(
+        future in other_queue for other_queue in executor._queues if other_queue is not own_queue for future in futures
+    )
+    # keep the other worker busy, so that it cannot steal futures before the check
+    barrier.wait()
+    return local
+
+
+class WorkStealingExecutor(unittest.TestCase):
+    def test_option(self):
+        """select executor as `threads(chain, executor=executor)`"""
+        chain = chainlet.concurrency.thread.convert(Adder(1) >> Adder(2), executor=STEALING_EXECUTOR)
+        self.assertIs(chain.options['executor'], STEALING_EXECUTOR)
+        self.assertEqual(list(chain.dispatch(range(20))), list(range(3, 23)))
+        bundle = chainlet.concurrency.thread.convert((Adder(1), Adder(2)), executor=STEALING_EXECUTOR)
+        self.assertEqual(bundle.send(1), [2, 3])
+        self.assertIs((chain >> Adder(3)).options['executor'], STEALING_EXECUTOR)
+
+    def test_nested(self):
+        """nested bundles as `threads(a >> threads((b, c)) >> join >> d)`"""
+        chain = chainlet.concurrency.thread.convert(
+            Adder(1) >> chainlet.concurrency.thread.convert(
+                (Adder(1), Adder(2)), executor=STEALING_EXECUTOR
+            ) >> MergeLink() >> Adder(2), executor=STEALING_EXECUTOR
+        )
+        reference = Adder(1) >> (Adder(1), Adder(2)) >> MergeLink() >> Adder(2)
+        self.assertEqual(list(chain.dispatch(range(20))), list(chainlet.concurrency.thread.convert(reference).dispatch(range(20))))
+
+    def test_local(self):
+        """submit from worker to its own queue, and steal only without own work"""
+        executor = chainlet.concurrency.thread.WorkStealingExecutor(2, 'chainlet_unittest_local')
+        log, barrier = queue.Queue(), threading.Barrier(2, timeout=5)
+        # the fast worker runs out of work while the slow worker still has some
+        outer = [executor.submit(submit_local, executor, log, 3, delay, barrier) for delay in (0, 0.05)]
+        records = [log.get(timeout=5) for _ in range(6)]
+        self.assertEqual([future.result for future in outer], [True, True])
+        self.assertTrue(any(worker != owner for worker, owner in records))
+        for worker in set(worker for worker, _ in records):
+            owners = [owner for executing, owner in records if executing == worker]
+            stolen = [owner != worker for owner in owners]
+            with self.subTest(worker=worker):
+                self.assertEqual(stolen, sorted(stolen))
+
+    def test_idle(self):
+        """queue each idle worker at most once"""
+        executor = chainlet.concurrency.thread.WorkStealingExecutor(1, 'chainlet_unittest_idle')
+        done = threading.Event()
+        executor.submit(done.set)
+        self.assertTrue(done.wait(timeout=1))
+        for _ in range(3):
+            time.sleep(0.01)
+            done.clear()
+            # the worker finds work while it is still queued as idle, such as by stealing
+            executor._queues[0].append(chainlet.concurrency.base.LightFuture(done.set))
+            executor._wakeups[0].set()
+            self.assertTrue(done.wait(timeout=1))
+        time.sleep(0.01)
+        self.assertEqual(list(executor._idle), [0])
+
+
+@chainlet.genlet
+def slow_spread(count, delay):
+    value = yield
+    while True:
+        results = []
+        for offset in range(count):
+            time.sleep(delay)
+            results.append(value + offset)
+        value = yield results
+
+
+class StreamedResults(unittest.TestCase):
+    executor = chainlet.concurrency.thread.ThreadPoolExecutor(4, 'chainlet_unittest_stream')
+
+    def test_first_result(self):
+        """pass on results before all elements are done as `threads(..., merge=mode)`"""
+        for merge in ('round_robin', 'completed'):
+            with self.subTest(merge=merge):
+                bundle = chainlet.concurrency.thread.convert(
+                    (Adder(1), forklet(slow_spread(count=10, delay=0.02))), executor=self.executor, merge=merge
+                )
+                start_time = time.time()
+                results = iter(bundle.chainlet_send(1))
+                self.assertEqual(next(results), 2)
+                self.assertLess(time.time() - start_time, 0.1)
+                self.assertEqual(sorted(results), list(range(1, 11)))
+
+    def test_abandon(self):
+        """stop elements whose streamed results are not consumed"""
+        bundle = chainlet.concurrency.thread.convert(
+            (forklet(slow_spread(count=1000, delay=0)), Adder(1)), executor=self.executor, merge='completed'
+        )
+        results = iter(bundle.chainlet_send(1))
+        next(results)
+        del results
+        # workers are released for further sends
+        for _ in range(8):
+            self.assertEqual(sorted(bundle.send(1))[:2], [1, 2])
+
+
+@chainlet.funclet
+def delay_first(value, delay):
+    if value == 0:
+        time.sleep(delay)
+    return value
+
+
+class CompletedResults(unittest.TestCase):
+    executor = chainlet.concurrency.thread.ThreadPoolExecutor(4, 'chainlet_unittest_completed')
+
+    def test_slow_chunk(self):
+        """pass on results before slow values as `threads(..., ordered=False)`"""
+        chain = chainlet.concurrency.thread.convert(
+            Adder(0) >> delay_first(delay=0.2), executor=self.executor, ordered=False
+        )
+        start_time = time.time()
+        results = iter(chain.dispatch(range(4)))
+        first = next(results)
+        self.assertNotEqual(first, 0)
+        self.assertLess(time.time() - start_time, 0.1)
+        self.assertEqual(sorted([first] + list(results)), list(range(4)))
+
+    def test_pending(self):
+        """keep only futures not started by any worker"""
+        completions = chainlet.concurrency.base.queue.Queue()
+        futures = (
+            self.executor.submit(chainlet.concurrency.base.report_completion, completions, list, (value,))
+            for value in range(20000)
+        )
+        completed_results = chainlet.concurrency.base.CompletedResults
+        fetch, pending = completed_results._fetch, []  # pylint:disable=protected-access
+
+        def record_fetch(futures, pending_futures):
+            pending.append(len(pending_futures))
+            return fetch(futures, pending_futures)
+        with mock.patch.object(completed_results, '_fetch', staticmethod(record_fetch)):
+            results = sorted(completed_results(futures, completions))
+        self.assertEqual(results, list(range(20000)))
+        self.assertLess(max(pending), 5000)
+
+
+class AdaptiveThreadPool(unittest.TestCase):
+    def test_metrics(self):
+        """record utilisation of the pool"""
+        executor = chainlet.concurrency.thread.ThreadPoolExecutor(4, 'chainlet_unittest_metrics', min_workers=2)
+        metrics = executor.metrics()
+        self.assertEqual((metrics.queue_depth, metrics.workers, metrics.tasks_completed), (0, 2, 0))
+        futures = [executor.submit(time.sleep, 0.001) for _ in range(20)]
+        while executor.metrics().tasks_completed < len(futures):
+            time.sleep(0.01)
+        metrics = executor.metrics()
+        self.assertEqual((metrics.queue_depth, metrics.active_workers), (0, 0))
+        self.assertLessEqual(metrics.workers, 4)
+        self.assertGreater(metrics.average_wait, 0)
+        self.assertTrue(repr(metrics))
+
+    def test_grow_shrink(self):
+        """grow with sustained load, and dismiss idle workers"""
+        executor = chainlet.concurrency.thread.ThreadPoolExecutor(
+            6, 'chainlet_unittest_adaptive', min_workers=1, idle_timeout=0.05, grow_wait=0.001
+        )
+        self.assertEqual(executor.metrics().workers, 1)
+        futures = [executor.submit(time.sleep, 0.01) for _ in range(60)]
+        time.sleep(0.1)
+        self.assertGreater(executor.metrics().workers, 1)
+        self.assertLessEqual(executor.metrics().workers, 6)
+        for future in futures:
+            future.result
+        time.sleep(0.3)
+        self.assertEqual(executor.metrics().workers, 1)
+
+    def test_burst(self):
+        """do not start workers for short bursts"""
+        executor = chainlet.concurrency.thread.ThreadPoolExecutor(
+            32, 'chainlet_unittest_burst', min_workers=2, grow_wait=0.5
+        )
+        futures = [executor.submit(int, value) for value in range(200)]
+        self.assertEqual([future.result for future in futures], list(range(200)))
+        self.assertEqual(executor.metrics().workers, 2)
+
+    def test_blocked(self):
+        """grow while all workers are blocked"""
+        executor = chainlet.concurrency.thread.ThreadPoolExecutor(64, 'chainlet_unittest_blocked', min_workers=2)
+        start_time = time.time()
+        futures = [executor.submit(time.sleep, 0.5) for _ in range(16)]
+        time.sleep(0.25)
+        self.assertGreaterEqual(executor.metrics().workers, 16)
+        for future in futures:
+            future.result
+        self.assertLess(time.time() - start_time, 1.0)
+
+    def test_options(self):
+        """reject inconsistent worker limits"""
+        with self.assertRaises(ValueError):
+            chainlet.concurrency.thread.ThreadPoolExecutor(2, min_workers=3)
@@ -0,0 +1,178 @@
+import collections
+import unittest
+import multiprocessing
+import threading
+import pickle
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import chainlet
+import chainlet.driver
+import chainlet.concurrency.process
+import chainlet.concurrency.transport
+
+from chainlet_unittests.utility import produce
+
+SharedMemoryTransport = chainlet.concurrency.transport.SharedMemoryTransport
+SHARED_MEMORY = (
+    chainlet.concurrency.transport.shared_memory is not None and chainlet.concurrency.transport._posixshmem is not None
+)
+
+
+class BufferView(object):
+    """Object referring to the pickled buffer directly, instead of copying it"""
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        return BufferView, (pickle.PickleBuffer(self.data),)
+
+    def __eq__(self, other):
+        return bytes(self.data) == bytes(other.data)
+
+    def __lt__(self, other):
+        return bytes(self.data) < bytes(other.data)
+
+    def __repr__(self):
+        return '%s(%d bytes)' % (self.__class__.__name__, len(self.data))
+
+
+@chainlet.funclet
+def double(value):
+    return BufferView(bytes(value.data) * 2)
+
+
+def round_trip(transport, obj):
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    # large objects do not fit into the pipe, so send them concurrently
+    send_thread = threading.Thread(target=transport.send, args=(sender, obj))
+    send_thread.start()
+    result = transport.recv(receiver)
+    send_thread.join()
+    sender.close()
+    receiver.close()
+    return result
+
+
+class TestPickleTransport(unittest.TestCase):
+    def test_round_trip(self):
+        """Copy objects via pickle"""
+        transport = chainlet.concurrency.transport.PICKLE_TRANSPORT
+        for obj in (None, 1, 'foo', bytearray(b'x' * 100000), [1, 2, (3, 4)]):
+            with self.subTest(obj=obj):
+                self.assertEqual(round_trip(transport, obj), obj)
+
+
+@unittest.skipIf(not SHARED_MEMORY, 'requires POSIX multiprocessing.shared_memory')
+class TestSharedMemoryTransport(unittest.TestCase):
+    def test_round_trip(self):
+        """Move buffers via shared memory"""
+        transport = SharedMemoryTransport(threshold=1024)
+        for obj in (None, 1, 'foo', b'x' * 100000, bytearray(b'x' * 100000), [bytearray(2048), bytearray(16)]):
+            with self.subTest(obj=obj):
+                self.assertEqual(round_trip(transport, obj), obj)
+                self.assertEqual(transport.attached, 0)
+
+    def test_lifetime(self):
+        """Release shared memory once the last reference is gone"""
+        transport = SharedMemoryTransport(threshold=1024)
+        large, small = round_trip(transport, (BufferView(bytearray(b'a' * 4096)), BufferView(bytearray(16))))
+        self.assertEqual(transport.attached, 1)
+        self.assertEqual(bytes(large.data), b'a' * 4096)
+        self.assertEqual(bytes(small.data), bytes(16))
+        del small
+        self.assertEqual(transport.attached, 1)
+        del large
+        self.assertEqual(transport.attached, 0)
+        self.assertEqual(pickle.loads(pickle.dumps(transport)).threshold, 1024)
+
+    def test_close(self):
+        """Unlink blocks which are never received"""
+        transport = SharedMemoryTransport(threshold=1024)
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        transport.send(sender, BufferView(bytearray(2048)))
+        # drop the message without attaching its blocks
+        _, blocks = receiver.recv()
+        (name, _), = blocks
+        self.assertTrue(chainlet.concurrency.transport._exists(name))
+        transport.close()
+        self.assertFalse(chainlet.concurrency.transport._exists(name))
+        sender.close()
+        receiver.close()
+
+    def test_tracker(self):
+        """Leave no blocks registered with the resource tracker"""
+        registered = collections.Counter()
+
+        def register(name, rtype):
+            registered[name, rtype] += 1
+
+        def unregister(name, rtype):
+            registered[name, rtype] -= 1
+        resource_tracker = chainlet.concurrency.transport.resource_tracker
+        with mock.patch.object(resource_tracker, 'register', register), \
+                mock.patch.object(resource_tracker, 'unregister', unregister):
+            transport = SharedMemoryTransport(threshold=1024)
+            # enough blocks to prune the blocks already received
+            for _ in range(100):
+                round_trip(transport, BufferView(bytearray(2048)))
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            transport.send(sender, BufferView(bytearray(2048)))
+            receiver.recv()
+            transport.close()
+            sender.close()
+            receiver.close()
+        self.assertEqual(len(registered), 101)
+        self.assertEqual(set(registered.values()), {0})
+
+    def test_prune(self):
+        """Forget blocks once they are received"""
+        transport = SharedMemoryTransport(threshold=1024)
+        for _ in range(200):
+            round_trip(transport, BufferView(bytearray(2048)))
+        self.assertLess(len(transport._sent), 64)  # pylint:disable=protected-access
+
+    @unittest.skipIf(numpy is None, 'requires numpy')
+    def test_numpy(self):
+        """Move numpy arrays via shared memory"""
+        transport = SharedMemoryTransport()
+        array = numpy.arange(100000, dtype=float)
+        result = round_trip(transport, array)
+        self.assertEqual(transport.attached, 1)
+        self.assertTrue(numpy.array_equal(result, array))
+        view = result[10:20]
+        del result
+        self.assertEqual(transport.attached, 1)
+        self.assertEqual(list(view), list(range(10, 20)))
+        del view
+        self.assertEqual(transport.attached, 0)
+
+    def test_process_chain(self):
+        """Exchange data chunks of process chains via shared memory"""
+        executor = chainlet.concurrency.process.ProcessPoolExecutor(
+            2, 'chainlet_unittest_transport', transport=SharedMemoryTransport(threshold=1024)
+        )
+        chain = chainlet.concurrency.process.ProcessChain((double(),), executor=executor)
+        inputs = [BufferView(bytearray([value]) * 4096) for value in range(8)]
+        self.assertEqual(list(chain.dispatch(inputs)), [double().send(value) for value in inputs])
+
+    def test_driver(self):
+        """Send results of process drivers via shared memory"""
+        results = []
+        driver = chainlet.driver.ProcessPoolChainDriver(
+            processes=2, handler=lambda mount, result: results.append(result),
+            transport=SharedMemoryTransport(threshold=1024),
+        )
+        driver.mount(
+            produce([BufferView(bytearray(4096))] * 4) >> double(), produce([BufferView(bytearray(16))] * 4) >> double()
+        )
+        driver.run()
+        self.assertEqual(sorted(results), [BufferView(bytearray(32))] * 4 + [BufferView(bytearray(8192))] * 4)
@@ -1,11 +1,12 @@
 import itertools
 import unittest
 import time
+import weakref
 
 import chainlet
 import chainlet.primitives.bundle
 import chainlet.primitives.chain
-from chainlet.dataflow import NoOp, MergeLink
+from chainlet.dataflow import NoOp, MergeLink, joinlet, forklet
 
 from chainlet_unittests.utility import Adder
 
@@ -16,6 +17,47 @@ def sleep(value, seconds):
     return value
 
 
+class Token(object):
+    """Data chunk whose instances are tracked while alive"""
+    alive = weakref.WeakSet()
+
+    def __init__(self, value, tag):
+        self.value = value
+        self.tag = tag
+        self.alive.add(self)
+
+    def __reduce__(self):
+        return Token, (self.value, self.tag)
+
+
+@chainlet.funclet
+def tokenize(value, tag):
+    return Token(value, tag)
+
+
+@chainlet.funclet
+def to_bytes(value):
+    return bytes(value)
+
+
+@forklet
+@chainlet.funclet
+def spread(value, count):
+    return [value + offset for offset in range(count)]
+
+
+@joinlet
+@chainlet.funclet
+def join_bytes(value):
+    return b''.join(bytes(chunk) for chunk in value)
+
+
+@joinlet
+@chainlet.funclet
+def sum_twice(value):
+    return sum(value) + sum(value)
+
+
 class PrimitiveTestCases(object):
     class ConcurrentChain(unittest.TestCase):
         chain_type = chainlet.primitives.chain.Chain
@@ -41,6 +83,99 @@ class PrimitiveTestCases(object):
             self.assertEqual(result, list(range(1, 6)))
             self.assertLess(end_time - start_time, 0.5)
 
+        def test_max_inflight(self):
+            """bounded concurrent chain as `chain_type(..., max_inflight=n)`"""
+            for max_inflight in (1, 2, 5):
+                with self.subTest(max_inflight=max_inflight):
+                    consumed, produced = 0, []
+
+                    def source():
+                        for value in range(20):
+                            produced.append(value)
+                            yield value
+                    bounded_chain = self.chain_type((Adder(1), Adder(2)), max_inflight=max_inflight)
+                    for result in bounded_chain.dispatch(source()):
+                        consumed += 1
+                        self.assertEqual(result, consumed + 2)
+                        self.assertLessEqual(len(produced), consumed + max_inflight)
+                    self.assertEqual(consumed, 20)
+
+        def test_max_inflight_results(self):
+            """release consumed results of `chain_type(..., max_inflight=n)`"""
+            for max_inflight in (1, 2, 5):
+                tag = '%s-%d' % (self.id(), max_inflight)
+                with self.subTest(max_inflight=max_inflight):
+                    # results block their worker briefly, so that they are not all realised by the consumer
+                    bounded_chain = self.chain_type(
+                        (Adder(1), sleep(seconds=0.001), tokenize(tag=tag)), max_inflight=max_inflight
+                    )
+                    consumed, retained = 0, 0
+                    for result in bounded_chain.dispatch(range(200)):
+                        consumed += 1
+                        self.assertEqual(result.value, consumed)
+                        del result
+                        retained = max(retained, sum(token.tag == tag for token in list(Token.alive)))
+                    self.assertEqual(consumed, 200)
+                    self.assertLessEqual(retained, max_inflight + 1)
+
+        def test_chunk_size(self):
+            """chunked concurrent chain as `chain_type(..., chunk_size=n)`"""
+            for chunk_size in (1, 2, 5, 32, 'auto'):
+                for values in (list(range(20)), range(500)):
+                    with self.subTest(chunk_size=chunk_size, values=values):
+                        chunked_chain = self.chain_type((Adder(1), Adder(2)), chunk_size=chunk_size)
+                        self.assertEqual(list(chunked_chain.dispatch(values)), [value + 3 for value in values])
+                        self.assertEqual(
+                            list(chunked_chain.dispatch(iter(values))), [value + 3 for value in values]
+                        )
+                        bounded_chain = self.chain_type((Adder(1), Adder(2)), chunk_size=chunk_size, max_inflight=2)
+                        self.assertEqual(list(bounded_chain.dispatch(values)), [value + 3 for value in values])
+            with self.assertRaises(ValueError):
+                self.chain_type((Adder(1), Adder(2)), chunk_size=0)
+
+        def test_join_twice(self):
+            """joining element reading its input twice as `chain_type((a, b, join))`"""
+            options = [{}, {'max_inflight': 2}]
+            if getattr(self.chain_type, 'completion_order', False):
+                options.append({'ordered': False})
+            for kwargs in options:
+                with self.subTest(**kwargs):
+                    joining_chain = self.chain_type((Adder(1), Adder(1), sum_twice()), **kwargs)
+                    self.assertEqual(joining_chain.send([10]), [24])
+                    self.assertEqual(joining_chain.send(range(3)), [18])
+
+        def test_options(self):
+            """inherit options as `chain_type(..., max_inflight=n) >> a`"""
+            bounded_chain = self.chain_type((Adder(1), Adder(2)), max_inflight=3)
+            self.assertEqual(bounded_chain.options, {'max_inflight': 3})
+            self.assertEqual((bounded_chain >> Adder(3)).max_inflight, 3)
+            self.assertEqual(bounded_chain[1:].max_inflight, 3)
+            self.assertIsNone(self.chain_type((Adder(1), Adder(2))).max_inflight)
+            with self.assertRaises(TypeError):
+                self.chain_type((Adder(1), Adder(2)), no_such_option=3)
+            with self.assertRaises(ValueError):
+                self.chain_type((Adder(1), Adder(2)), max_inflight=0)
+
+        def test_unordered(self):
+            """results in completion order as `chain_type(..., ordered=False)`"""
+            if not getattr(self.chain_type, 'completion_order', False):
+                with self.assertRaises((ValueError, TypeError)):
+                    self.chain_type((Adder(1), Adder(2)), ordered=False)
+                return
+            for chunk_size, max_inflight in itertools.product((None, 1, 3), (None, 2)):
+                with self.subTest(chunk_size=chunk_size, max_inflight=max_inflight):
+                    unordered_chain = self.chain_type(
+                        (Adder(1), Adder(2)), ordered=False, chunk_size=chunk_size, max_inflight=max_inflight
+                    )
+                    self.assertEqual(sorted(unordered_chain.dispatch(range(20))), list(range(3, 23)))
+                    self.assertEqual(sorted((unordered_chain >> spread(count=2)).dispatch(range(5))), sorted(
+                        spread(count=2).send_many(range(3, 8))
+                    ))
+            unordered_chain = self.chain_type((Adder(1), Adder(2)), ordered=False)
+            self.assertEqual(unordered_chain.options, {'ordered': False})
+            self.assertIs((unordered_chain >> Adder(3)).ordered, False)
+            self.assertIs(unordered_chain[1:].ordered, False)
+
     class ConcurrentBundle(unittest.TestCase):
         bundle_type = chainlet.primitives.bundle.Bundle
         converter = None
@@ -103,3 +238,67 @@ class PrimitiveTestCases(object):
                     sequential = reference_chain.send(initial)
                     concurrent = concurrent_chain.send(initial)
                     self.assertEqual(sequential, concurrent)
+
+        def test_shared(self):
+            """shared fan-out as `bundle_type(..., fanout='shared')`"""
+            chunks = [b'a' * 64, bytearray(b'b' * 64)]
+            for chunk in chunks:
+                with self.subTest(chunk=type(chunk)):
+                    shared_bundle = self.bundle_type((to_bytes(), to_bytes()), fanout='shared')
+                    self.assertEqual(shared_bundle.send(chunk), [bytes(chunk)] * 2)
+            joined = b''.join(bytes(chunk) for chunk in chunks)
+            for values in (chunks, iter(chunks)):
+                with self.subTest(values=type(values)):
+                    shared_bundle = self.bundle_type((join_bytes(), join_bytes()), fanout='shared')
+                    self.assertEqual(shared_bundle.send(values), [joined] * 2)
+            shared_bundle = self.bundle_type((to_bytes(), to_bytes()), fanout='shared')
+            self.assertEqual(shared_bundle.fanout, 'shared')
+            self.assertEqual(shared_bundle[1:].fanout, 'shared')
+            with self.assertRaises(ValueError):
+                self.bundle_type((to_bytes(), to_bytes()), fanout='copy')
+
+        def test_merge(self):
+            """streamed results as `bundle_type(..., merge=mode)`"""
+            for merge in ('round_robin', 'completed'):
+                with self.subTest(merge=merge):
+                    if merge not in getattr(self.bundle_type, 'merge_modes', (None,)):
+                        with self.assertRaises((ValueError, TypeError)):
+                            self.bundle_type((spread(count=3), spread(count=2)), merge=merge)
+                        continue
+                    merging_bundle = self.bundle_type((Adder(0) >> spread(count=3), Adder(10) >> spread(count=2)), merge=merge)
+                    self.assertEqual(merging_bundle[:].merge, merge)
+                    for initial in (0, 100):
+                        results = merging_bundle.send(initial)
+                        if merge == 'round_robin':
+                            self.assertEqual(results, [initial, initial + 10, initial + 1, initial + 11, initial + 2])
+                        else:
+                            self.assertEqual(sorted(results), sorted(spread(count=3).send(initial) + spread(count=2).send(initial + 10)))
+                    joining_chain = Adder(1) >> (Adder(1), Adder(2)) >> self.bundle_type(
+                        (MergeLink() >> spread(count=40), MergeLink() >> spread(count=70)), merge=merge
+                    ) >> Adder(1)
+                    reference_chain = Adder(1) >> (Adder(1), Adder(2)) >> (
+                        MergeLink() >> spread(count=40), MergeLink() >> spread(count=70)
+                    ) >> Adder(1)
+                    for initial in (0, 100):
+                        self.assertEqual(sorted(joining_chain.send(initial)), sorted(reference_chain.send(initial)))
+
+        def test_unordered(self):
+            """results in completion order as `bundle_type(..., ordered=False)`"""
+            if not getattr(self.bundle_type, 'completion_order', False):
+                with self.assertRaises((ValueError, TypeError)):
+                    self.bundle_type((Adder(1), Adder(2)), ordered=False)
+                return
+            unordered_bundle = self.bundle_type((Adder(1), Adder(2), spread(count=3)), ordered=False)
+            self.assertIs(unordered_bundle[:].ordered, False)
+            for initial in (0, 100):
+                self.assertEqual(
+                    sorted(unordered_bundle.send(initial)), sorted([initial + 1, initial + 2, initial, initial + 1, initial + 2])
+                )
+            joining_chain = Adder(1) >> (Adder(1), Adder(2)) >> self.bundle_type(
+                (MergeLink() >> spread(count=4), MergeLink() >> spread(count=7)), ordered=False
+            ) >> Adder(1)
+            reference_chain = Adder(1) >> (Adder(1), Adder(2)) >> (
+                MergeLink() >> spread(count=4), MergeLink() >> spread(count=7)
+            ) >> Adder(1)
+            for initial in (0, 100):
+                self.assertEqual(sorted(joining_chain.send(initial)), sorted(reference_chain.send(initial)))
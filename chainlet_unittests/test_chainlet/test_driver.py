@@ -1,13 +1,21 @@
 from __future__ import absolute_import, division
 import unittest
 import itertools
+import multiprocessing
+import os
 import random
+import socket
+import threading
 import time
 
 import chainlet.driver
+import chainlet.primitives.link
+import chainlet.signals
 
 from chainlet_unittests.utility import Adder, Buffer, MultiprocessBuffer, produce
 
+MULTIPLEX = chainlet.driver.selectors is not None
+
 
 class DriverMixin(object):
     driver_class = chainlet.driver.ChainDriver
@@ -40,11 +48,74 @@ class DriverMixin(object):
                 for expected, buffer in results:
                     self.assertEqual(expected, buffer.buffer)
 
+    def test_rate(self):
+        """Limit the rate of pulling chains"""
+        driver = self.driver_class()
+        policy = chainlet.driver.PullPolicy(rate=200, batch=2)
+        driver.mount(produce(range(20)) >> Adder(1), produce(range(20)) >> Adder(2), policy=policy)
+        start = time.time()
+        driver.run()
+        # 21 pulls each, of which 2 are free
+        self.assertGreater(time.time() - start, 0.09)
+        self.assertFalse(driver.mounts)
+        self.assertFalse(driver.policies)
+
 
 class TestChainDriver(DriverMixin, unittest.TestCase):
     driver_class = chainlet.driver.ChainDriver
 
 
+class Poller(chainlet.primitives.link.ChainLink):
+    """Produce nothing until a deadline, counting every pull"""
+    def __init__(self, duration):
+        self.deadline = time.time() + duration
+        self.pulls = 0
+
+    def chainlet_send(self, value=None):
+        if time.time() > self.deadline:
+            raise StopIteration
+        self.pulls += 1
+        return chainlet.signals.SKIP
+
+
+class TestPullPolicy(unittest.TestCase):
+    def test_backoff(self):
+        """Back off from chains producing nothing"""
+        driver_classes = (chainlet.driver.ChainDriver,)
+        if MULTIPLEX:
+            driver_classes += (chainlet.driver.MultiplexChainDriver,)
+        for driver_class in driver_classes:
+            with self.subTest(driver_class=driver_class):
+                driver = driver_class()
+                policy = chainlet.driver.PullPolicy(min_backoff=0.001, max_backoff=0.05)
+                idle, busy = Poller(0.2), Buffer()
+                driver.mount(idle, policy=policy)
+                driver.mount(produce(range(1000)) >> busy, policy=policy)
+                driver.run()
+                # 1, 2, 4, ..., 32, 50, 50, ... ms
+                self.assertLess(idle.pulls, 20)
+                self.assertEqual(busy.buffer, list(range(1000)))
+
+    def test_batch(self):
+        """Pull chains in batches"""
+        driver = chainlet.driver.ChainDriver()
+        buffer = Buffer()
+        driver.mount(produce(range(10)) >> buffer, policy=chainlet.driver.PullPolicy(batch=5))
+        driver.mount(produce(range(100, 110)) >> buffer)
+        driver.run()
+        self.assertEqual(buffer.buffer[:12], [0, 1, 2, 3, 4, 100, 5, 6, 7, 8, 9, 101])
+        self.assertEqual(sorted(buffer.buffer), list(range(10)) + list(range(100, 110)))
+
+    def test_options(self):
+        """Reject invalid policies"""
+        for options in ({'rate': 0}, {'batch': 0}, {'burst': 0}, {'min_backoff': 1, 'max_backoff': 0.1}):
+            with self.subTest(options=options), self.assertRaises(ValueError):
+                chainlet.driver.PullPolicy(**options)
+        with self.assertRaises(TypeError):
+            chainlet.driver.ChainDriver().mount(Buffer(), polcy=chainlet.driver.PullPolicy())
+        self.assertTrue(repr(chainlet.driver.DEFAULT_POLICY))
+
+
 class TestThreadedChainDriver(DriverMixin, unittest.TestCase):
     driver_class = chainlet.driver.ThreadedChainDriver
 
@@ -52,3 +123,137 @@ class TestThreadedChainDriver(DriverMixin, unittest.TestCase):
 class TestMultiprocessChainDriver(DriverMixin, unittest.TestCase):
     driver_class = chainlet.driver.MultiprocessChainDriver
     buffer_class = MultiprocessBuffer
+
+
+class TestProcessPoolChainDriver(DriverMixin, unittest.TestCase):
+    driver_class = chainlet.driver.ProcessPoolChainDriver
+    buffer_class = MultiprocessBuffer
+
+
+class Counter(chainlet.primitives.link.ChainLink):
+    """Produce the process id endlessly, recording when closed"""
+    def __init__(self, closed):
+        self.closed = closed
+
+    def chainlet_send(self, value=None):
+        time.sleep(0.001)
+        return os.getpid()
+
+    def close(self):
+        self.closed.put(os.getpid())
+
+
+class TestProcessPool(unittest.TestCase):
+    def test_results(self):
+        """Stream results of chains to the main process"""
+        results = []
+        driver = chainlet.driver.ProcessPoolChainDriver(processes=2, handler=lambda mount, result: results.append(result))
+        for offset in range(5):
+            driver.mount(produce(range(10)) >> Adder(offset))
+        driver.run()
+        self.assertFalse(driver.mounts)
+        self.assertEqual(sorted(results), sorted(value + offset for offset in range(5) for value in range(10)))
+
+    def test_stop(self):
+        """Stop chains in a capped number of processes, closing them in each worker"""
+        closed = multiprocessing.Queue()
+        pids = set()
+        driver = chainlet.driver.ProcessPoolChainDriver(processes=2, handler=lambda mount, result: pids.add(result))
+        driver.mount(*[Counter(closed) for _ in range(10)])
+        driver.start()
+        while len(pids) < 2:
+            time.sleep(0.01)
+        driver.stop()
+        while driver.running:
+            time.sleep(0.01)
+        self.assertEqual(len(driver.mounts), 10)
+        self.assertEqual(len(pids), 2)
+        self.assertNotIn(os.getpid(), pids)
+        self.assertEqual(sorted(closed.get(timeout=1) for _ in range(10)), sorted(list(pids) * 5))
+
+    def test_exception(self):
+        """Propagate exceptions of chains"""
+        driver = chainlet.driver.ProcessPoolChainDriver(processes=2)
+        driver.mount(produce(['a', 'b']) >> Adder(2), produce(range(10)) >> Adder(2))
+        with self.assertRaises(TypeError):
+            driver.run()
+        with self.assertRaises(ValueError):
+            chainlet.driver.ProcessPoolChainDriver(processes=0)
+
+
+@unittest.skipIf(not MULTIPLEX, 'requires selectors')
+class TestMultiplexChainDriver(DriverMixin, unittest.TestCase):
+    driver_class = chainlet.driver.MultiplexChainDriver
+
+
+class SocketSource(chainlet.primitives.link.ChainLink):
+    """Produce messages of a socket, ending on an empty message"""
+    def __init__(self, connection):
+        self.connection = connection
+
+    def fileno(self):
+        return self.connection.fileno()
+
+    def chainlet_send(self, value=None):
+        message = self.connection.recv(1)
+        if not message:
+            raise StopIteration
+        return message
+
+
+class Blocker(chainlet.primitives.link.ChainLink):
+    """Produce one value after an event is set"""
+    def __init__(self, event):
+        self.event = event
+
+    def chainlet_send(self, value=None):
+        self.event.wait()
+        raise StopIteration
+
+
+@unittest.skipIf(not MULTIPLEX, 'requires selectors')
+class TestMultiplexing(unittest.TestCase):
+    def test_selectable(self):
+        """Pull selectable chains only when ready"""
+        driver = chainlet.driver.MultiplexChainDriver(workers=2)
+        connections = [socket.socketpair() for _ in range(20)]
+        buffers = [Buffer() for _ in connections]
+        for (receiver, _), buffer in zip(connections, buffers):
+            driver.mount(SocketSource(receiver) >> buffer)
+        driver.start()
+        time.sleep(0.05)
+        self.assertTrue(driver.running)
+        for index, (_, sender) in enumerate(reversed(connections)):
+            sender.sendall(b'%d' % (index % 10))
+            sender.close()
+        while driver.running:
+            time.sleep(0.01)
+        self.assertFalse(driver.mounts)
+        for index, buffer in enumerate(reversed(buffers)):
+            self.assertEqual(buffer.buffer, [b'%d' % (index % 10)])
+        for receiver, _ in connections:
+            receiver.close()
+
+    def test_blocking(self):
+        """Do not stall other chains when a chain blocks"""
+        driver = chainlet.driver.MultiplexChainDriver(workers=2)
+        event = threading.Event()
+        buffer = Buffer()
+        driver.mount(Blocker(event), produce(range(100)) >> buffer)
+        driver.start()
+        time.sleep(0.1)
+        self.assertEqual(buffer.buffer, list(range(100)))
+        self.assertTrue(driver.running)
+        event.set()
+        while driver.running:
+            time.sleep(0.01)
+        self.assertFalse(driver.mounts)
+
+    def test_exception(self):
+        """Propagate exceptions of chains"""
+        driver = chainlet.driver.MultiplexChainDriver(workers=2)
+        driver.mount(produce(['a', 'b']) >> Adder(2))
+        with self.assertRaises(TypeError):
+            driver.run()
+        with self.assertRaises(ValueError):
+            chainlet.driver.MultiplexChainDriver(workers=0)
@@ -49,6 +49,12 @@ except AttributeError:
     ABCDEFG = functools.partial(chainlet.funclink.FunctionLink, abcdefg.__wrapped__)
 
 
+class NegatedLink(chainlet.funclink.FunctionLink):
+    """FunctionLink negating the result of its slave"""
+    def chainlet_send(self, value=None):
+        return -self.__wrapped__(value)
+
+
 class TestFunctionLink(unittest.TestCase):
     @staticmethod
     def _get_test_iterable():
@@ -86,6 +92,13 @@ class TestFunctionLink(unittest.TestCase):
                 self.assertIsNone(next(chain))
                 self.assertEqual(chain.send(value), value)
 
+    def test_send_batch(self):
+        """FunctionLink: send batches via an overridden chainlet_send"""
+        for link, expected in ((new_pingpong(), [1, 2, 3]), (NegatedLink(pingpong), [-1, -2, -3])):
+            with self.subTest(link=link):
+                self.assertEqual(link.chainlet_send_batch([1, 2, 3]), expected)
+                self.assertEqual(list(link.dispatch([1, 2, 3])), expected)
+
     def test_arguments(self):
         """FunctionLink: arguments as .. >> funclink(*args, **kwargs) >> ..."""
         for description, linklet in (('FunctionLink', ABCDEFG), ('wrapper', abcdefg)):
@@ -136,6 +149,15 @@ class TestFunctionLink(unittest.TestCase):
                     self.assertEqual(native.slave(), pickle_copy(native, proto).slave())
                     self._subtest_cloned_result(native, pickle_copy(native, proto))
 
+    def test_pickle_copy_direct(self):
+        """FunctionLink: copy, deepcopy and pickle without wraplet"""
+        native = chainlet.funclink.FunctionLink(pingpong)
+        self._subtest_cloned_result(native, copy.copy(native))
+        self._subtest_cloned_result(native, copy.deepcopy(native))
+        for proto in range(pickle.HIGHEST_PROTOCOL):
+            with self.subTest(pickle_protocol=proto):
+                self._subtest_cloned_result(native, pickle_copy(native, proto))
+
     def _subtest_cloned_result(self, original, clone):
         self.assertIsNot(original, clone)
         # direct access
@@ -0,0 +1,153 @@
+from __future__ import absolute_import
+import unittest
+import gc
+import pickle
+import time
+
+import chainlet
+import chainlet.instrument
+from chainlet.instrument import instrument, uninstrument, LinkStats
+from chainlet.dataflow import MergeLink, forklet
+from chainlet.concurrency import threads
+
+from chainlet_unittests.utility import Adder, AbortEvery
+
+
+@chainlet.funclet
+def add(value, summand=1):
+    return value + summand
+
+
+@chainlet.funclet
+def sleep(value, duration=0.001):
+    time.sleep(duration)
+    return value
+
+
+@forklet
+@chainlet.funclet
+def spread(value, count=3):
+    for offset in range(count):
+        yield value + offset
+
+
+class TestInstrument(unittest.TestCase):
+    def test_flat(self):
+        """Record statistics of a flat chain"""
+        for chain_factory in (
+            lambda: add() >> sleep() >> Adder(2),
+            lambda: add() >> AbortEvery(2) >> Adder(2),
+        ):
+            chain = chain_factory()
+            with self.subTest(chain=chain):
+                elements = chain.elements
+                expected = list(chain_factory().dispatch(range(10)))
+                instrument(chain)
+                self.assertEqual(list(chain.dispatch(range(10))), expected)
+                stats = chain.stats()
+                self.assertIsInstance(stats, LinkStats)
+                self.assertEqual([child.element for child in stats.children], list(elements))
+                self.assertEqual((stats.calls, stats.chunks_in, stats.chunks_out), (10, 10, len(expected)))
+                self.assertEqual((stats.children[0].calls, stats.children[-1].calls), (10, len(expected)))
+                self.assertEqual(len(list(stats)), 1 + len(elements))
+                for element_stats in stats:
+                    self.assertLessEqual(element_stats.self_time, element_stats.total_time)
+                self.assertLessEqual(sum(child.total_time for child in stats.children), stats.total_time)
+                self.assertEqual(stats.self_time + sum(child.total_time for child in stats.children), stats.total_time)
+                self.assertTrue(str(stats))
+
+    def test_timing(self):
+        """Attribute time to the slow element"""
+        chain = instrument(add() >> sleep(duration=0.01) >> add())
+        chain.send(1)
+        stats = chain.stats()
+        self.assertGreaterEqual(stats.children[1].self_time, 0.01 * 1E9)
+        self.assertLess(stats.self_time, stats.children[1].self_time)
+        self.assertEqual(max(stats.children, key=lambda child: child.self_time).element, chain.elements[1])
+
+    def test_fork_join(self):
+        """Count chunks of forking and joining elements"""
+        chain = instrument(add() >> (add(1), add(2), add(3)) >> MergeLink())
+        self.assertEqual(
+            list(chain.dispatch(range(4))), [sum(value + 1 + offset for offset in (1, 2, 3)) for value in range(4)]
+        )
+        stats = chain.stats()
+        bundle_stats, merge_stats = stats.children[1:]
+        self.assertEqual((bundle_stats.chunks_in, bundle_stats.chunks_out), (4, 12))
+        self.assertEqual((merge_stats.calls, merge_stats.chunks_in, merge_stats.chunks_out), (4, 12, 4))
+        self.assertEqual([child.calls for child in bundle_stats.children], [4, 4, 4])
+
+    def test_stream(self):
+        """Count results of forking elements as they are consumed"""
+        element = instrument(spread())
+        results = element.chainlet_send(1)
+        self.assertEqual(element.stats().chunks_out, 0)
+        self.assertEqual(next(results), 1)
+        self.assertEqual(element.stats().chunks_out, 1)
+        self.assertEqual(list(results), [2, 3])
+        self.assertEqual((element.stats().calls, element.stats().chunks_out), (1, 3))
+
+    def test_batch(self):
+        """Record each batch only once"""
+        chain = instrument(add() >> Adder(2) >> add())
+        self.assertEqual(chain.send_many(range(5)), [value + 4 for value in range(5)])
+        stats = chain.stats()
+        for element_stats in stats:
+            self.assertEqual((element_stats.calls, element_stats.chunks_in, element_stats.chunks_out), (1, 5, 5))
+
+    def test_compiled(self):
+        """Instrument a flat chain after compilation"""
+        chain = add() >> add(2)
+        self.assertEqual(chain.send(1), 4)
+        instrument(chain)
+        self.assertEqual(chain.send(1), 4)
+        self.assertEqual([element_stats.calls for element_stats in chain.stats()], [1, 1, 1])
+        uninstrument(chain)
+        self.assertEqual(chain.send(1), 4)
+        self.assertEqual([element_stats.calls for element_stats in chain.stats()], [0, 0, 0])
+
+    def test_uninstrument(self):
+        """Restore elements when uninstrumenting"""
+        chain = add() >> (Adder(1), add(2))
+        types = [type(chain), type(chain.elements[0]), type(chain.elements[1])]
+        instrument(chain)
+        self.assertNotEqual(types, [type(chain), type(chain.elements[0]), type(chain.elements[1])])
+        uninstrument(chain)
+        self.assertEqual(types, [type(chain), type(chain.elements[0]), type(chain.elements[1])])
+
+    def test_release(self):
+        """Forget instrumented elements once they are garbage collected"""
+        registry = chainlet.instrument._REGISTRY  # pylint:disable=protected-access
+        for chain_factory, expected in ((lambda: add() >> (Adder(1), add(2)), [3, 4]), (lambda: add() >> add(2), 4)):
+            chain = instrument(chain_factory())
+            self.assertEqual(chain.send(1), expected)
+            # a list comprehension would keep the last statistics, and thus its element, alive on Python 2
+            element_ids = list(id(element_stats.element) for element_stats in chain.stats())
+            self.assertTrue(all(element_id in registry for element_id in element_ids))
+            chain = None
+            gc.collect()
+            self.assertFalse(any(element_id in registry for element_id in element_ids))
+
+    def test_copies(self):
+        """Copies of instrumented elements are not instrumented"""
+        chain = add() >> (Adder(1), add(2))
+        plain_types = [type(chain), type(chain.elements[0]), type(chain.elements[1])]
+        instrument(chain)
+        copy = pickle.loads(pickle.dumps(chain))
+        self.assertEqual(plain_types, [type(copy), type(copy.elements[0]), type(copy.elements[1])])
+        self.assertEqual(copy.send(1), [3, 4])
+        self.assertEqual(chain.stats().calls, 0)
+        # slices are new chains sharing the instrumented elements
+        subchain = chain[:]
+        self.assertIs(type(subchain), plain_types[0])
+        self.assertEqual(subchain.send(1), [3, 4])
+        self.assertEqual([element_stats.calls for element_stats in chain.stats()], [0, 1, 1, 1, 1])
+
+    def test_concurrent(self):
+        """Record statistics of concurrent elements"""
+        chain = instrument(threads(add() >> (sleep(), sleep()) >> add()))
+        self.assertEqual(sorted(chain.dispatch(range(4))), sorted([value + 2 for value in range(4)] * 2))
+        stats = chain.stats()
+        self.assertEqual((stats.chunks_in, stats.chunks_out), (4, 8))
+        self.assertEqual([child.chunks_in for child in stats.children], [4, 4, 8])
+        self.assertEqual([child.chunks_out for child in stats.children], [4, 8, 8])
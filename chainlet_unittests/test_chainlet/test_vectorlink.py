@@ -0,0 +1,81 @@
+from __future__ import absolute_import, division
+import unittest
+import copy
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+else:
+    from chainlet.vectorlink import VectorLink, vectorlet
+
+import chainlet
+
+from chainlet_unittests.utility import Adder, Buffer
+
+
+if numpy is not None:
+    @vectorlet
+    def scale(values, factor=2):
+        return values * factor
+
+    @vectorlet(mask=True)
+    def positive(values):
+        return values > 0
+
+
+class BatchCounter(Buffer):
+    """Buffer recording the batches passed to it"""
+    def __init__(self, slave):
+        super(BatchCounter, self).__init__()
+        self.slave = slave
+
+    def __call__(self, values, *args, **kwargs):
+        self.buffer.append(len(values))
+        return self.slave(values, *args, **kwargs)
+
+
+@unittest.skipIf(numpy is None, 'requires numpy')
+class TestVectorLink(unittest.TestCase):
+    def test_send(self):
+        """VectorLink: individual values"""
+        for factor in (1, 2, -3, 0.5):
+            link = scale(factor)
+            for value in (0, 1, -12, 1E6, 0.25):
+                self.assertEqual(link.send(value), value * factor)
+        link = positive()
+        self.assertEqual(link.send(2), 2)
+        self.assertIsNone(link.send(-2))
+
+    def test_batch(self):
+        """VectorLink: batches of values"""
+        values = list(range(-50, 50))
+        self.assertEqual(scale(3).send_many(values), [value * 3 for value in values])
+        self.assertEqual(positive().send_many(values), [value for value in values if value > 0])
+        with self.assertRaises(ValueError):
+            VectorLink(lambda array: array[1:]).send_many(values)
+
+    def test_chain(self):
+        """VectorLink: gather batches in chain as `a >> vector >> b`"""
+        values = list(range(-50, 50))
+        counter = BatchCounter(lambda array: array * 2)
+        chain = Adder(1) >> VectorLink(counter, batch_size=16) >> positive() >> Adder(-1)
+        self.assertEqual(chain.chain_batch_size, chainlet.vectorlink.DEFAULT_BATCH_SIZE)
+        self.assertEqual(chain.send(3), 7)
+        self.assertEqual(list(chain.dispatch(values)), [(value + 1) * 2 - 1 for value in values if value + 1 > 0])
+        self.assertEqual(counter.buffer, [1] + [16] * 6 + [4])
+        counter.buffer[:] = []
+        self.assertEqual(list(chain.send_many(values)), [(value + 1) * 2 - 1 for value in values if value + 1 > 0])
+        self.assertEqual(counter.buffer, [16] * 6 + [4])
+
+    def test_pickle_copy(self):
+        """VectorLink: copy, deepcopy and pickle"""
+        link = VectorLink(numpy.negative, batch_size=12, dtype=float)
+        for clone in (copy.copy(link), copy.deepcopy(link), pickle.loads(pickle.dumps(link))):
+            self.assertEqual(clone.chain_batch_size, 12)
+            self.assertEqual(clone.dtype, float)
+            self.assertEqual(clone.send_many([1, 2, 3]), [-1, -2, -3])
@@ -0,0 +1,88 @@
+import itertools
+import unittest
+
+import chainlet
+import chainlet.signals
+from chainlet.dataflow import MergeLink
+from chainlet.concurrency import threads
+
+from chainlet_unittests.utility import Adder, abort_swallow, AbortEvery, produce, skip_swallow, SkipEvery
+
+
+@chainlet.funclet
+def add(value, summand=1):
+    return value + summand
+
+
+@chainlet.funclet
+def odd(value):
+    if value % 2:
+        return value
+    raise chainlet.signals.StopTraversal
+
+
+@chainlet.funclet
+def even(value):
+    if value % 2:
+        return chainlet.signals.SKIP
+    return value
+
+
+class ChainBatch(unittest.TestCase):
+    def test_funclet(self):
+        """Batch single link as `link.send_many(values)`"""
+        for factory in (
+            add, lambda: add(summand=3), odd, even, lambda: Adder(2), lambda: AbortEvery(3), lambda: SkipEvery(3)
+        ):
+            with self.subTest(link=factory()):
+                values = list(range(-5, 15))
+                expected = list(factory().dispatch(values))
+                self.assertEqual(factory().send_many(values), expected)
+        self.assertEqual(abort_swallow().send_many(range(20)), [])
+        self.assertEqual(skip_swallow().send_many(range(20)), [])
+
+    def test_flat(self):
+        """Batch flat chain as `a >> b >> c >> ...`"""
+        factories = [lambda: Adder(2), add, lambda: add(-3), odd, even, lambda: AbortEvery(2), lambda: SkipEvery(2)]
+        for chain in itertools.product(factories, repeat=3):
+            with self.subTest(chain=[factory() for factory in chain]):
+                a, b, c = chain
+                values = list(range(-5, 15))
+                expected = list((a() >> b() >> c()).dispatch(values))
+                self.assertEqual((a() >> b() >> c()).send_many(values), expected)
+
+    def test_fork(self):
+        """Batch forking chain as `a >> (b, c) >> d`"""
+        elements = [Adder(2), add(), odd()]
+        for chain in itertools.product(elements, repeat=4):
+            with self.subTest(chain=chain):
+                a, b, c, d = chain
+                values = list(range(-5, 15))
+                expected = list((a >> (b, c) >> d).dispatch(values))
+                result = (a >> (b, c) >> d).send_many(values)
+                # batches traverse each branch in order, but not across branches
+                self.assertEqual(sorted(result), sorted(expected))
+                self.assertEqual(result, list((a >> b >> d).dispatch(values)) + list((a >> c >> d).dispatch(values)))
+
+    def test_join(self):
+        """Batch joining chain as `a >> (b, c) >> join >> d`"""
+        elements = [Adder(2), add(), odd()]
+        for chain in itertools.product(elements, repeat=4):
+            with self.subTest(chain=chain):
+                a, b, c, d = chain
+                values = list(range(-5, 15))
+                expected = list((a >> (b, c) >> MergeLink() >> d).dispatch(values))
+                self.assertEqual((a >> (b, c) >> MergeLink() >> d).send_many(values), expected)
+
+    def test_concurrent(self):
+        """Batch concurrent chain as `threads(a >> b >> ...)`"""
+        chain = threads(add() >> Adder(2) >> odd())
+        values = list(range(-5, 15))
+        self.assertEqual(chain.send_many(values), list((add() >> Adder(2) >> odd()).dispatch(values)))
+
+    def test_exhausted(self):
+        """Batch exhausted chain"""
+        chain = produce(range(5)) >> add()
+        list(chain)
+        with self.assertRaises(chainlet.signals.ChainExit):
+            chain.send_many([None, None])
@@ -0,0 +1,82 @@
+import itertools
+import unittest
+
+import chainlet
+import chainlet.primitives.chain
+from chainlet.dataflow import NoOp
+
+from chainlet_unittests.utility import Adder, produce, abort_swallow, AbortEvery, skip_swallow, SkipEvery
+
+
+@chainlet.funclet
+def add(value, summand=1):
+    return value + summand
+
+
+@chainlet.funclet
+def double(value):
+    return value * 2
+
+
+class FlatChainCompile(unittest.TestCase):
+    def test_fused(self):
+        """Compile flat chain of funclets and links"""
+        elements = [Adder(2), add(), add(-3), add(summand=5), double(), NoOp()]
+        for chain in itertools.product(elements, repeat=4):
+            for initial in (0, 15, -15, 1E6):
+                with self.subTest(chain=chain, initial=initial):
+                    expected = initial
+                    for element in chain:
+                        expected = element.chainlet_send(expected)
+                    a, b, c, d = chain
+                    compiled_chain = a >> b >> c >> d
+                    self.assertIsInstance(compiled_chain, chainlet.primitives.chain.FlatChain)
+                    self.assertEqual(compiled_chain.send(initial), expected)
+                    self.assertEqual(compiled_chain.send(initial), expected)
+
+    def test_explicit(self):
+        """Compile flat chain explicitly"""
+        chain = add() >> double() >> add(-1)
+        self.assertIs(chain.compile(), chain)
+        self.assertIn('chainlet_send', vars(chain))
+        self.assertEqual(chain.send(2), 5)
+        self.assertEqual(list(chain.dispatch([1, 2, 3])), [3, 5, 7])
+
+    def test_stop_traversal(self):
+        """Abort compiled flat chain"""
+        chain = add() >> abort_swallow() >> double()
+        self.assertIsNone(chain.send(1))
+        chain = add() >> AbortEvery(2) >> double()
+        self.assertEqual(list(chain.dispatch(range(6))), [2, 6, 10])
+
+    def test_skip(self):
+        """Skip compiled flat chain"""
+        for skip_element in (skip_swallow(), SkipEvery(1)):
+            with self.subTest(skip=skip_element):
+                chain = add() >> skip_element >> double()
+                self.assertIsNone(chain.send(1))
+                self.assertIs(chain.chainlet_send(1), chainlet.signals.SKIP)
+                self.assertEqual(list(chain.dispatch(range(6))), [])
+                self.assertEqual(chain.send_many(range(6)), [])
+        chain = add() >> SkipEvery(2) >> double()
+        self.assertEqual(list(chain.dispatch(range(6))), [2, 6, 10])
+        chain = add() >> SkipEvery(2) >> double()
+        self.assertEqual(chain.send_many(range(6)), [2, 6, 10])
+
+    def test_exhausted(self):
+        """Exhaust compiled flat chain"""
+        chain = produce(range(5)) >> add() >> double()
+        self.assertEqual(list(chain), [2, 4, 6, 8, 10])
+        with self.assertRaises(StopIteration):
+            next(chain)
+
+    def test_slicing(self):
+        """Subscribe compiled flat chain as `chain[:i] >> chain[i:]`"""
+        chain = add() >> double() >> Adder(-3) >> add(summand=5) >> double()
+        chain.compile()
+        for index in range(len(chain)):
+            with self.subTest(index=index):
+                head, tail = chain[:index], chain[index:]
+                self.assertEqual(head >> tail, chain)
+                self.assertEqual((head >> tail).send(7), chain.send(7))
+                self.assertEqual(tail.send(head.send(7)), chain.send(7))
@@ -60,3 +60,21 @@ class Decorators(unittest.TestCase):
         self.assertEqual(list(fork_chain), [[1], [1], [1]])
         fork_join_chain = produce([1, 1, 1]) >> fork_type() >> join_type()
         self.assertEqual(list(fork_join_chain), [1, 1, 1])
+
+    def test_late(self):
+        """Decorate elements after linking"""
+        class Sum(ChainLink):
+            def chainlet_send(self, value=None):
+                return sum(value) if self.chain_join else value
+
+        class Repeat(ChainLink):
+            def chainlet_send(self, value=None):
+                return [value, value] if self.chain_fork else value
+
+        total, repeat = Sum(), Repeat()
+        chain = produce([1, 2, 3]) >> repeat >> (Sum(), Sum()) >> total
+        self.assertEqual(chain.send(), [1, 1])
+        joinlet(total)
+        self.assertEqual(chain.send(), [4])
+        forklet(repeat)
+        self.assertEqual(chain.send(), [12])
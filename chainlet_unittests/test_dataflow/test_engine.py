@@ -0,0 +1,106 @@
+import itertools
+import pickle
+import unittest
+
+from chainlet.funclink import funclet
+from chainlet.primitives.link import ChainLink
+from chainlet.primitives.chain import Chain, ENGINES
+from chainlet.primitives.bundle import Bundle
+from chainlet.dataflow import MergeLink, either, joinlet
+
+from chainlet_unittests.utility import Adder, produce, abort_swallow, AbortEvery, ReturnEvery, skip_swallow, SkipEvery
+
+
+class ExhaustAfter(ChainLink):
+    """Pass on ``count`` values, then signal exhaustion"""
+    def __init__(self, count):
+        self.count = count
+
+    def chainlet_send(self, value=None):
+        if self.count <= 0:
+            raise StopIteration
+        self.count -= 1
+        return value
+
+
+@joinlet
+@funclet
+def count_join(value):
+    return len(list(value))
+
+
+def _engine(chain, engine):
+    chain.engine = engine
+    return chain
+
+
+class ChainEngine(unittest.TestCase):
+    def test_equivalent(self):
+        """Traverse chains with all engines for equal results"""
+        initials = (0, 15, -15, -1E6, +1E6, 0, 1)
+        factories = (
+            lambda: Adder(1) >> (Adder(2), Adder(3)),
+            lambda: Adder(0) >> (Adder(2), Adder(3)) >> Adder(1) >> Adder(-1),
+            lambda: Adder(0) >> (Adder(2), Adder(3) >> (Adder(4), Adder(5))) >> MergeLink(),
+            lambda: Adder(0) >> (Adder(2), Adder(3)) >> MergeLink() >> (Adder(4), Adder(5)),
+            lambda: Adder(0) >> (Adder(2) >> abort_swallow(), Adder(3)) >> Adder(1),
+            lambda: Adder(0) >> (Adder(2), Adder(3)) >> skip_swallow(),
+            lambda: Adder(0) >> (Adder(2), Adder(3)) >> AbortEvery(3) >> MergeLink(),
+            lambda: Adder(0) >> (Adder(2), Adder(3)) >> SkipEvery(2),
+            lambda: Adder(0) >> (Adder(2), ReturnEvery(2)) >> Adder(1),
+            lambda: Adder(0) >> (Adder(2), Adder(3)) >> either(SkipEvery(2) >> Adder(4), Adder(5)),
+        )
+        for factory in factories:
+            expected_iter = list(produce(initials) >> factory())
+            expected_dispatch = list(factory().dispatch(initials))
+            for engine in ENGINES:
+                chain = _engine(factory(), engine)
+                with self.subTest(chain=chain, engine=engine):
+                    self.assertEqual(list(_engine(produce(initials) >> factory(), engine)), expected_iter)
+                    self.assertEqual(list(chain.dispatch(initials)), expected_dispatch)
+
+    def test_exit(self):
+        """Stop all engines when an element is exhausted"""
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                chain = _engine(produce((1, 2)) >> (Adder(1), Adder(2)) >> Adder(1), engine)
+                self.assertEqual(next(chain), [3, 4])
+                self.assertEqual(next(chain), [4, 5])
+                with self.assertRaises(StopIteration):
+                    next(chain)
+                forked = _engine(
+                    Adder(1) >> (Adder(1), ExhaustAfter(1) >> Adder(1)) >> ExhaustAfter(3) >> Adder(1), engine
+                )
+                self.assertEqual(forked.send(1), [4, 4])
+                self.assertEqual(forked.send(1), [4])
+                with self.assertRaises(StopIteration):
+                    forked.send(1)
+
+    def test_empty_join(self):
+        """Send empty input to joining elements with all engines"""
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                chain = Chain((Adder(1), Bundle((Adder(1), Adder(2))), skip_swallow(), count_join()), engine=engine)
+                self.assertEqual(chain.send(0), 0)
+                self.assertEqual(list(chain.dispatch([0, 0])), [0, 0])
+
+    def test_inherit(self):
+        """Preserve the engine when slicing, linking and copying a chain"""
+        chain = Chain((Adder(1), Bundle((Adder(2), Adder(3))), Adder(4)), engine='iterative')
+        for derived in itertools.chain(
+                (chain[:], chain[1:], chain >> Adder(5), Adder(5) >> chain),
+                (pickle.loads(pickle.dumps(chain, protocol)) for protocol in range(pickle.HIGHEST_PROTOCOL + 1)),
+        ):
+            with self.subTest(chain=derived):
+                self.assertEqual(derived.engine, 'iterative')
+        self.assertEqual(pickle.loads(pickle.dumps(chain)).send(1), chain.send(1))
+        self.assertEqual((Adder(1) >> (Adder(2), Adder(3))).engine, 'lazy')
+
+    def test_unknown(self):
+        """Reject unknown engines"""
+        with self.assertRaises(ValueError):
+            Chain((Adder(1), Bundle((Adder(2), Adder(3)))), engine='magic')
+        chain = Adder(1) >> (Adder(2), Adder(3))
+        with self.assertRaises(ValueError):
+            chain.engine = 'magic'
+        self.assertEqual(chain.engine, 'lazy')
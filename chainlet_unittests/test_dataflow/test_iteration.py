@@ -3,7 +3,7 @@ import unittest
 
 from chainlet.dataflow import MergeLink
 
-from chainlet_unittests.utility import Adder, produce, abort_swallow, AbortEvery, ReturnEvery
+from chainlet_unittests.utility import Adder, produce, abort_swallow, AbortEvery, ReturnEvery, skip_swallow, SkipEvery
 
 
 class ChainIteration(unittest.TestCase):
@@ -58,6 +58,11 @@ class ChainIteration(unittest.TestCase):
                 return chain_factory() >> abort_swallow()
             self._test_iter_one(factory_swallow, [])
 
+        with self.subTest(case='skip_swallow'):
+            def factory_skip():
+                return chain_factory() >> skip_swallow()
+            self._test_iter_one(factory_skip, [])
+
         if not parallel:
             with self.subTest(case='AbortEvery 2'):
                 def factory_second():
@@ -69,6 +74,11 @@ class ChainIteration(unittest.TestCase):
                     return chain_factory() >> AbortEvery(3)
                 self._test_iter_one(factory_second, [val for idx, val in enumerate(expected) if (idx + 1) % 3])
 
+            with self.subTest(case='SkipEvery 3'):
+                def factory_second():
+                    return chain_factory() >> SkipEvery(3)
+                self._test_iter_one(factory_second, [val for idx, val in enumerate(expected) if (idx + 1) % 3])
+
             with self.subTest(case='ReturnEvery 2'):
                 def factory_second():
                     return chain_factory() >> ReturnEvery(2)
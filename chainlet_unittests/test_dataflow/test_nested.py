@@ -3,7 +3,7 @@ import unittest
 
 from chainlet.dataflow import either
 
-from chainlet_unittests.utility import Adder, produce, abort_swallow, AbortEvery, ReturnEvery
+from chainlet_unittests.utility import Adder, produce, abort_swallow, AbortEvery, ReturnEvery, skip_swallow, SkipEvery
 
 
 class ChainNested(unittest.TestCase):
@@ -40,8 +40,13 @@ class ChainNested(unittest.TestCase):
                     list(chain_abort_all_swallow),
                     []
                 )
-                for every in (2, 3):
-                    chain_switch_nth = produce(initials) >> a >> either(AbortEvery(every) >> b, c)
+                chain_skip_all_swallow = produce(initials) >> a >> (b >> skip_swallow(), c >> abort_swallow())
+                self.assertEqual(
+                    list(chain_skip_all_swallow),
+                    []
+                )
+                for every, stop_type in itertools.product((2, 3), (AbortEvery, SkipEvery)):
+                    chain_switch_nth = produce(initials) >> a >> either(stop_type(every) >> b, c)
                     self.assertEqual(
                         list(chain_switch_nth),
                         [
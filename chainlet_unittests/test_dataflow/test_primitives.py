@@ -1,7 +1,33 @@
 import itertools
 import unittest
+import pickle
 
-from chainlet_unittests.utility import Adder
+import chainlet.signals
+import chainlet.chainsend
+import chainlet.primitives.chain
+from chainlet.dataflow import MergeLink, either, joinlet
+
+from chainlet_unittests.utility import Adder, skip_swallow, SkipEvery, AbortEvery, produce
+
+
+class AbortShared(AbortEvery):
+    """Abort every n'th traversal of the chain with a shared signal"""
+    def chainlet_send(self, value=None):
+        self._count += 1
+        if self._count % self.every:
+            return value
+        raise chainlet.signals.STOP_TRAVERSAL
+
+
+@chainlet.funclet
+def exhaust(value):
+    raise StopIteration
+
+
+@joinlet
+@chainlet.funclet
+def exhaust_join(value):
+    raise StopIteration
 
 
 class ChainPrimitives(unittest.TestCase):
@@ -46,3 +72,60 @@ class ChainPrimitives(unittest.TestCase):
                 a, b, c = chain
                 chain_a = (val for val in initials) >> a >> b >> c
                 self.assertEqual(list(chain_a), expected)
+
+    def test_skip(self):
+        """Skip chunks in links and chains as `a >> skip >> b`"""
+        for chain in (
+            Adder(1) >> skip_swallow() >> Adder(2),
+            Adder(1) >> (Adder(1), Adder(2)) >> MergeLink() >> skip_swallow(),
+            Adder(1) >> SkipEvery(1) >> (Adder(1), Adder(2)) >> MergeLink(),
+            Adder(1) >> either(skip_swallow(), SkipEvery(1)),
+        ):
+            with self.subTest(chain=chain):
+                self.assertIs(chain.chainlet_send(1), chainlet.signals.SKIP)
+                self.assertIsNone(chain.send(1))
+                self.assertEqual(list(chain.dispatch(range(5))), [])
+        self.assertEqual((Adder(1) >> (Adder(1), skip_swallow())).send(1), [3])
+        self.assertIs(pickle.loads(pickle.dumps(chainlet.signals.SKIP)), chainlet.signals.SKIP)
+
+    def test_shared_signals(self):
+        """Raise shared signal instances in links and chains"""
+        for chain_factory in (
+            lambda: produce(range(20)) >> AbortShared(2) >> Adder(1),
+            lambda: produce(range(20)) >> Adder(1) >> (Adder(-1), AbortShared(2)) >> MergeLink(),
+            lambda: produce(range(20)) >> either(AbortShared(2), Adder(1)),
+        ):
+            with self.subTest(chain=chain_factory()):
+                expected = list(chain_factory())
+                for _ in range(5):
+                    self.assertEqual(list(chain_factory()), expected)
+                    self.assertIsNone(chainlet.signals.STOP_TRAVERSAL.__traceback__)
+                    self.assertIsNone(chainlet.signals.CHAIN_EXIT.__traceback__)
+
+    def test_exhausted_signal(self):
+        """Raise shared signals of exhausted links without referring to other exceptions"""
+        for element in (exhaust(), Adder(1) >> exhaust(), Adder(1) >> exhaust() >> Adder(1)):
+            for send in (chainlet.chainsend.lazy_send, chainlet.chainsend.eager_send):
+                for send_batch in (True, False):
+                    with self.subTest(element=element, send=send, batch=send_batch):
+                        with self.assertRaises(chainlet.signals.ChainExit) as context:
+                            if send_batch:
+                                element.chainlet_send_batch([1, 2])
+                            else:
+                                list(send(element, [1, 2]))
+                        self.assertIs(context.exception, chainlet.signals.CHAIN_EXIT)
+                        self.assertIsNone(context.exception.__context__)
+
+    def test_exhausted_join(self):
+        """Signal exhausted joining links like any other links"""
+        for send in (chainlet.chainsend.lazy_send, chainlet.chainsend.eager_send):
+            with self.subTest(send=send), self.assertRaises(chainlet.signals.ChainExit):
+                list(send(exhaust_join(), [1, 2]))
+        for engine in sorted(chainlet.primitives.chain.ENGINES):
+            for element in (exhaust(), exhaust_join()):
+                with self.subTest(engine=engine, element=element):
+                    chain = chainlet.primitives.chain.Chain((Adder(1), element, Adder(1)), engine=engine)
+                    with self.assertRaises(StopIteration):
+                        chain.send(1)
+                    with self.assertRaises(chainlet.signals.ChainExit):
+                        list(chain.dispatch([1, 2]))
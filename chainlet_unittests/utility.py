@@ -102,6 +102,25 @@ class AbortEvery(chainlet.primitives.link.ChainLink):
         raise chainlet.signals.StopTraversal
 
 
+@chainlet.funclet
+def skip_swallow(value):
+    """Always skip the chain without returning"""
+    return chainlet.signals.SKIP
+
+
+class SkipEvery(AbortEvery):
+    """
+    Skip every n'th traversal of the chain
+
+    This returns its input for calls 1, ..., n-1, then returns SKIP on n.
+    """
+    def chainlet_send(self, value=None):
+        self._count += 1
+        if self._count % self.every:
+            return value
+        return chainlet.signals.SKIP
+
+
 class ReturnEvery(chainlet.primitives.link.ChainLink):
     """
     Abort-return every n'th traversal of the chain